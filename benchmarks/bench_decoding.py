@@ -0,0 +1,165 @@
+"""
+Jobs parsed per second on 100-result jobSearch pages.
+
+Compares the original path (response.json() followed by nested .get()
+walks, one try/except per job) with the fast path in core.decoding
+(typed msgspec structs or orjson + precompiled extractors, decoded
+straight from the body bytes as one batch over `results`).
+
+Pages are rebuilt from the postings in jobs.csv, so description sizes match
+what the crawler actually downloads.
+
+    python -m benchmarks.bench_decoding [--pages N] [--repeat N]
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+import argparse
+import csv
+import json
+import sys
+import time
+
+from core.data_model import Company, Job
+from core.decoding import decode_job_search, format_compensation, msgspec, orjson
+from core.queries import INDEED_JOB_TYPE_KEYS, INDEED_REMOTE_KEYS
+
+PAGE_SIZE = 100
+
+def load_postings(path: str = "jobs.csv") -> List[Dict[str, str]]:
+    """Read the sample postings exported in jobs.csv."""
+    csv.field_size_limit(sys.maxsize)
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+def _api_result(row: Dict[str, str], index: int) -> Dict[str, Any]:
+    """Turn a jobs.csv row into a jobSearch result as returned by the API."""
+    key = f"{row['id'].removeprefix('in-')}{index:06x}"
+    attributes = []
+    if row["is_remote"] == "True":
+        attributes.append({"key": "remote", "label": "Remote"})
+    if row["job_type"]:
+        attributes.append({"key": "job_type", "label": row["job_type"]})
+    salary_range = {
+        "min": float(row["min_amount"]) if row["min_amount"] else None,
+        "max": float(row["max_amount"]) if row["max_amount"] else None,
+    }
+    return {
+        "trackingKey": f"tk-{key}",
+        "job": {
+            "key": key,
+            "title": row["title"],
+            "datePublished": int(datetime.fromisoformat(row["date_posted"]).timestamp() * 1000),
+            "description": {"html": row["description"]},
+            "location": {"formatted": {"short": row["location"], "long": row["location"]}},
+            "compensation": {
+                "estimated": {"currencyCode": row["currency"] or "USD", "baseSalary": {"range": salary_range}}
+            },
+            "attributes": attributes,
+            "employer": {
+                "name": row["company"],
+                "dossier": {
+                    "employerDetails": {"addresses": [row["company_addresses"]] if row["company_addresses"] else []},
+                    "links": {"corporateWebsite": row["company_url_direct"] or None},
+                },
+            },
+            "recruit": {"viewJobUrl": row["job_url"]},
+        },
+    }
+
+def build_pages(postings: List[Dict[str, str]], pages: int) -> List[bytes]:
+    """Build `pages` encoded 100-result response bodies."""
+    bodies = []
+    for page in range(pages):
+        results = [
+            _api_result(postings[(page * PAGE_SIZE + i) % len(postings)], page * PAGE_SIZE + i)
+            for i in range(PAGE_SIZE)
+        ]
+        payload = {"data": {"jobSearch": {"pageInfo": {"nextCursor": f"c{page}"}, "results": results}}}
+        bodies.append(json.dumps(payload).encode("utf-8"))
+    return bodies
+
+def parse_baseline(body: bytes) -> List[Job]:
+    """The original response.json() + nested .get() parsing."""
+    jobs = []
+    data = json.loads(body)
+    for result in data.get("data", {}).get("jobSearch", {}).get("results", []):
+        try:
+            job_data = result.get("job", {})
+            employer_data = job_data.get("employer", {})
+            dossier = employer_data.get("dossier", {})
+            company = Company(
+                name=employer_data.get("name", ""),
+                website=dossier.get("links", {}).get("corporateWebsite"),
+                location=(dossier.get("employerDetails", {}).get("addresses") or [None])[0],
+                contact_email=None,
+                contact_phone=None
+            )
+            attributes = job_data.get("attributes", [])
+            is_remote = any(a.get("key", "").lower() in INDEED_REMOTE_KEYS for a in attributes)
+            job_type = next(
+                (a.get("label", "Unknown") for a in attributes if a.get("key", "").lower() in INDEED_JOB_TYPE_KEYS),
+                "Unknown"
+            )
+            estimated = job_data.get("compensation", {}).get("estimated") or {}
+            salary_range = (estimated.get("baseSalary") or {}).get("range") or {}
+            salary_min, salary_max = salary_range.get("min"), salary_range.get("max")
+            published = job_data.get("datePublished")
+            jobs.append(Job(
+                title=job_data.get("title", ""),
+                company=company,
+                location=job_data.get("location", {}).get("formatted", {}).get("short", ""),
+                is_remote=is_remote,
+                job_type=job_type,
+                compensation=format_compensation(salary_min, salary_max),
+                date_posted=datetime.fromtimestamp(published / 1000) if published else None,
+                description=job_data.get("description", {}).get("html", ""),
+                application_url=job_data.get("recruit", {}).get("viewJobUrl", ""),
+                source_url=job_data.get("recruit", {}).get("viewJobUrl", ""),
+                salary_min=salary_min,
+                salary_max=salary_max,
+                key=job_data.get("key")
+            ))
+        except Exception:
+            continue
+    return jobs
+
+def parse_fast(body: bytes) -> List[Job]:
+    """The decoding fast path used by IndeedScraper."""
+    return [record.to_job() for record in decode_job_search(body).records]
+
+def _decoder_name() -> str:
+    """Name of the decoder core.decoding picked up."""
+    if msgspec is not None:
+        return "msgspec"
+    return "orjson" if orjson is not None else "json"
+
+def measure(parse: Callable[[bytes], List[Job]], bodies: List[bytes], repeat: int) -> float:
+    """Get the best jobs-per-second rate over `repeat` runs."""
+    best = float("inf")
+    jobs = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        jobs = sum(len(parse(body)) for body in bodies)
+        best = min(best, time.perf_counter() - start)
+    return jobs / best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=50, help="100-result pages per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per parser (best is reported)")
+    parser.add_argument("--jobs-csv", default="jobs.csv", help="postings used to build the pages")
+    args = parser.parse_args()
+
+    bodies = build_pages(load_postings(args.jobs_csv), args.pages)
+    assert parse_fast(bodies[0]) == parse_baseline(bodies[0])
+
+    size = sum(len(body) for body in bodies) / len(bodies) / 1024
+    print(f"{args.pages} pages x {PAGE_SIZE} results ({size:.0f} KiB/page), "
+          f"decoder: {_decoder_name()}")
+    baseline = measure(parse_baseline, bodies, args.repeat)
+    fast = measure(parse_fast, bodies, args.repeat)
+    print(f"baseline  {baseline:>12,.0f} jobs/s")
+    print(f"fast path {fast:>12,.0f} jobs/s  ({fast / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
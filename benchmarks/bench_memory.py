@@ -0,0 +1,92 @@
+"""
+Memory held by N postings as plain dataclasses, slotted Jobs and a JobBatch.
+
+Every posting gets its own string objects (as when decoded from a response),
+so interning and dictionary encoding have something to share. Postings are
+cycled from jobs.csv with unique keys and URLs.
+
+    python -m benchmarks.bench_memory [--jobs N] [--no-descriptions]
+"""
+from dataclasses import make_dataclass
+from datetime import datetime
+from typing import Any, Callable, List
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks.bench_decoding import load_postings
+from core.data_model import Company, Job, intern_str
+from core.job_batch import JobBatch
+
+# The pre-slots models, for comparison
+PlainCompany = make_dataclass("PlainCompany", [f.name for f in Company.__dataclass_fields__.values()])
+PlainJob = make_dataclass("PlainJob", [f.name for f in Job.__dataclass_fields__.values()])
+
+def _copy(text: str) -> str:
+    """Get an equal string that is a separate object."""
+    return text.encode("utf-8").decode("utf-8") if text else text
+
+def make_jobs(count: int, descriptions: bool, job_class: Any, company_class: Any, intern: Callable) -> List[Any]:
+    """Build `count` postings with per-posting string objects."""
+    postings = load_postings()
+    jobs = []
+    for i in range(count):
+        row = postings[i % len(postings)]
+        url = f"https://www.indeed.com/viewjob?jk={i:016x}"
+        jobs.append(job_class(
+            title=_copy(row["title"]),
+            company=company_class(
+                name=intern(_copy(row["company"])),
+                website=intern(_copy(row["company_url_direct"]) or None),
+                location=intern(_copy(row["company_addresses"]) or None),
+                contact_email=None,
+                contact_phone=None
+            ),
+            location=intern(_copy(row["location"])),
+            is_remote=row["is_remote"] == "True",
+            job_type=intern(_copy(row["job_type"]) or "Unknown"),
+            compensation=None,
+            date_posted=datetime.fromisoformat(row["date_posted"]),
+            description=_copy(row["description"]) if descriptions else "",
+            application_url=url,
+            source_url=url,
+            salary_min=float(row["min_amount"]) if row["min_amount"] else None,
+            salary_max=float(row["max_amount"]) if row["max_amount"] else None,
+            key=f"{i:016x}"
+        ))
+    return jobs
+
+def measure(build: Callable[[], Any]) -> int:
+    """Get the bytes still allocated by whatever `build` returns."""
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=100_000, help="number of postings")
+    parser.add_argument("--no-descriptions", action="store_true", help="leave descriptions empty")
+    args = parser.parse_args()
+    descriptions = not args.no_descriptions
+
+    cases = {
+        "dataclasses (__dict__)": lambda: make_jobs(args.jobs, descriptions, PlainJob, PlainCompany, lambda s: s),
+        "slots + interning": lambda: make_jobs(args.jobs, descriptions, Job, Company, intern_str),
+        "JobBatch": lambda: JobBatch(make_jobs(args.jobs, descriptions, Job, Company, intern_str)),
+        "JobBatch (compressed)": lambda: JobBatch(
+            make_jobs(args.jobs, descriptions, Job, Company, intern_str), compress_descriptions=True
+        ),
+    }
+    baseline = None
+    print(f"{args.jobs:,} postings{'' if descriptions else ' without descriptions'}")
+    for name, build in cases.items():
+        size = measure(build)
+        baseline = baseline or size
+        print(f"{name:<24} {size / 2 ** 20:>10,.1f} MiB  ({size / baseline:.0%})")
+
+if __name__ == "__main__":
+    main()
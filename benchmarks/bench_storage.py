@@ -0,0 +1,167 @@
+"""
+Storage throughput, file size and memory at 10k / 100k / 1M rows.
+
+The bundled jobs.csv is the seed corpus: its postings are cycled with unique
+keys and URLs to synthesize each dataset size. Every (format, size) case runs
+in a fresh process, so peak RSS is measured per case:
+
+- save_csv / save_json / save_jsonl / save_parquet / save_sqlite take the
+  whole dataset as a list, like the batch API does;
+- stream_csv / stream_jsonl / stream_parquet / stream_sqlite feed a
+  generator through Storage.open_writer, like the crawler does.
+
+For each case the write throughput, read-back throughput (the whole file
+parsed back into rows), file size and peak RSS are reported. Descriptions
+are shared between synthesized rows in memory, so RSS reflects the
+container overhead rather than the text itself. The seed holds only 143
+distinct postings, so Parquet's dictionary encoding and compression make
+its files far smaller here than on a real crawl.
+
+    python -m benchmarks.bench_storage [--rows 10000,100000] [--formats save_json,stream_jsonl] [--json out.json]
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+import argparse
+import csv
+import json
+import multiprocessing
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_decoding import load_postings
+from core.data_model import Company, Job
+from core.storage import Storage, job_to_record
+
+SIZES = (10_000, 100_000, 1_000_000)
+FORMATS = (
+    "save_csv", "save_json", "save_jsonl", "save_parquet", "save_sqlite",
+    "stream_csv", "stream_jsonl", "stream_parquet", "stream_sqlite",
+)
+
+def _seed_records(path: str) -> List[Dict[str, Any]]:
+    """Convert the jobs.csv postings into flat job records."""
+    records = []
+    for row in load_postings(path):
+        job = Job(
+            title=row["title"],
+            company=Company(
+                name=row["company"],
+                website=row["company_url_direct"] or None,
+                location=row["company_addresses"] or None,
+                contact_email=row["emails"] or None,
+                contact_phone=None
+            ),
+            location=row["location"],
+            is_remote=row["is_remote"] == "True",
+            job_type=row["job_type"] or "Unknown",
+            compensation=None,
+            date_posted=datetime.fromisoformat(row["date_posted"]),
+            description=row["description"],
+            application_url=row["job_url"],
+            source_url=row["job_url"],
+            salary_min=float(row["min_amount"]) if row["min_amount"] else None,
+            salary_max=float(row["max_amount"]) if row["max_amount"] else None,
+            key=row["id"].removeprefix("in-")
+        )
+        records.append(job_to_record(job))
+    return records
+
+def synthesize(seed: List[Dict[str, Any]], rows: int) -> Iterator[Dict[str, Any]]:
+    """Cycle the seed records into `rows` records with unique keys and URLs."""
+    for i in range(rows):
+        record = dict(seed[i % len(seed)])
+        record["key"] = f"{i:016x}"
+        record["application_url"] = record["source_url"] = f"https://www.indeed.com/viewjob?jk={i:016x}"
+        yield record
+
+def read_back(path: Path, format: str) -> int:
+    """Parse a written file back into rows; return the row count."""
+    if format == "csv":
+        csv.field_size_limit(sys.maxsize)
+        with open(path, newline="", encoding="utf-8") as f:
+            return sum(1 for _ in csv.DictReader(f))
+    if format == "json":
+        with open(path, encoding="utf-8") as f:
+            return len(json.load(f))
+    if format == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            return sum(1 for line in f if json.loads(line))
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        return len(pq.read_table(path).to_pylist())
+    if format == "sqlite":
+        conn = sqlite3.connect(str(path))
+        try:
+            return sum(1 for _ in conn.execute("SELECT * FROM jobs"))
+        finally:
+            conn.close()
+    raise ValueError(f"Unknown format: {format}")
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+def run_case(case: str, rows: int, seed_path: str, results: "multiprocessing.Queue") -> None:
+    """Benchmark one (format, size) case; runs in its own process."""
+    mode, format = case.split("_", 1)
+    seed = _seed_records(seed_path)
+    with tempfile.TemporaryDirectory() as directory:
+        storage = Storage(directory)
+        start = time.perf_counter()
+        if mode == "save":
+            # The batch API needs the whole dataset in memory first
+            path = Path(getattr(storage, f"save_{format}")(list(synthesize(seed, rows)), "bench"))
+        else:
+            with storage.open_writer(format=format, filename="bench") as writer:
+                writer.write(synthesize(seed, rows))
+            path = writer.path
+        write_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_rows = read_back(path, format)
+        read_seconds = time.perf_counter() - start
+        results.put({
+            "case": case,
+            "rows": rows,
+            "write_rows_per_second": rows / write_seconds,
+            "read_rows_per_second": read_rows / read_seconds,
+            "file_mib": path.stat().st_size / 2 ** 20,
+            "peak_rss_mib": _peak_rss_mib(),
+        })
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default=",".join(map(str, SIZES)), help="comma-separated dataset sizes")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated cases")
+    parser.add_argument("--jobs-csv", default="jobs.csv", help="seed corpus")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    report = []
+    print(f"{'case':<16}{'rows':>10}{'write rows/s':>15}{'read rows/s':>15}{'file MiB':>11}{'peak RSS MiB':>14}")
+    for rows in (int(value) for value in args.rows.split(",")):
+        for case in args.formats.split(","):
+            process = context.Process(target=run_case, args=(case, rows, args.jobs_csv, results))
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                print(f"{case:<16}{rows:>10,}  failed (exit code {process.exitcode})")
+                continue
+            result = results.get()
+            report.append(result)
+            print(f"{case:<16}{rows:>10,}{result['write_rows_per_second']:>15,.0f}"
+                  f"{result['read_rows_per_second']:>15,.0f}{result['file_mib']:>11,.1f}"
+                  f"{result['peak_rss_mib']:>14,.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Offline benchmark suite (pytest-benchmark).
+
+    pytest benchmarks                              # run with thresholds
+    pytest benchmarks --benchmark-json=bench.json  # keep the numbers
+
+Pages come from fixtures recorded with `replay_mode: record` under
+`replay_fixtures_dir`. Without recordings, pages are rebuilt from jobs.csv
+and written in the same fixture format, so the replay path is exercised
+either way. No request leaves the machine.
+"""
+from pathlib import Path
+from typing import Dict, List
+import json
+import os
+import resource
+import sys
+
+import pytest
+import requests
+
+pytest.importorskip("pytest_benchmark")
+
+from config.settings import settings
+from core.data_model import SearchParams
+from core.replay import RequestRecorder, load_fixture
+from benchmarks.bench_decoding import build_pages, load_postings
+
+ROOT = Path(__file__).resolve().parent.parent
+SEARCH = SearchParams(what="python developer", location="remote")
+SYNTHETIC_PAGES = 20
+
+# Regression floors/ceilings, overridable with BENCH_<NAME>=value
+THRESHOLDS: Dict[str, float] = {
+    "PARSE_JOBS_PER_SECOND": 5000.0,
+    "STORE_JOBS_PER_SECOND": 2000.0,
+    "REPLAY_PAGES_PER_SECOND": 20.0,
+    "PEAK_RSS_MIB": 1024.0,
+}
+
+def threshold(name: str) -> float:
+    """Get a regression threshold, honoring an environment override."""
+    return float(os.environ.get(f"BENCH_{name}", THRESHOLDS[name]))
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+def _is_job_search(path: Path) -> bool:
+    return b'"jobSearch"' in load_fixture(path).content[:256]
+
+def record_synthetic_search(recorder: RequestRecorder, scraper, params: SearchParams, pages: int) -> None:
+    """Record a cursor chain of pages rebuilt from jobs.csv for `params`."""
+    bodies = build_pages(load_postings(str(ROOT / "jobs.csv")), pages)
+    cursor = None
+    for page, body in enumerate(bodies):
+        payload = json.loads(body)
+        next_cursor = f"c{page}" if page + 1 < pages else None
+        payload["data"]["jobSearch"]["pageInfo"]["nextCursor"] = next_cursor
+        response = requests.Response()
+        response.status_code = 200
+        response.url = scraper.api_url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode("utf-8")
+        request_body = scraper.job_search.body(
+            what=params.what, location=params.location, cursor=cursor, filters=params.filters
+        )
+        recorder.save("POST", scraper.api_url, response, data=request_body)
+        cursor = next_cursor
+
+@pytest.fixture
+def replay_scraper(tmp_path_factory, monkeypatch):
+    """An IndeedScraper that answers every request from recorded fixtures."""
+    from scrapers.indeed import IndeedScraper
+
+    monkeypatch.chdir(tmp_path_factory.mktemp("bench"))
+    monkeypatch.setattr(settings.scraper, "response_cache_enabled", False)
+    monkeypatch.setattr(settings.scraper, "replay_mode", "off")
+    scraper = IndeedScraper(
+        scraping_method="api",
+        api_key="benchmark",
+        proxy_enabled=False,
+        user_agent_enabled=False
+    )
+    yield scraper
+    scraper.close()
+
+@pytest.fixture
+def synthetic_recorder(tmp_path_factory, replay_scraper) -> RequestRecorder:
+    """Recorder holding a synthetic cursor chain for SEARCH."""
+    directory = tmp_path_factory.mktemp("fixtures")
+    record_synthetic_search(RequestRecorder(str(directory), mode="record"), replay_scraper, SEARCH, SYNTHETIC_PAGES)
+    return RequestRecorder(str(directory), mode="replay")
+
+@pytest.fixture
+def replayed_pages(synthetic_recorder) -> List[bytes]:
+    """Bodies of the recorded jobSearch pages (synthetic ones when none were recorded)."""
+    recorded = RequestRecorder(str(ROOT / settings.scraper.replay_fixtures_dir), mode="replay")
+    paths = [path for path in recorded.fixtures() if _is_job_search(path)]
+    if not paths:
+        paths = list(synthetic_recorder.fixtures())
+    return [load_fixture(path).content for path in paths]
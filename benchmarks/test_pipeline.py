@@ -0,0 +1,79 @@
+import itertools
+from typing import Optional
+
+import pytest
+
+from core.storage import Storage
+from benchmarks.conftest import SEARCH, SYNTHETIC_PAGES, peak_rss_mib, threshold
+
+
+def _report(
+    benchmark,
+    pages: int,
+    jobs: int,
+    min_jobs_per_second: Optional[float] = None,
+    min_pages_per_second: Optional[float] = None
+) -> None:
+    """
+    Attach throughput and memory figures to the benchmark and check them against thresholds.
+
+    Under --benchmark-disable the function runs once without timing stats,
+    so there is nothing to report or check.
+    """
+    if benchmark.disabled:
+        return
+    seconds = benchmark.stats.stats.min
+    benchmark.extra_info.update(
+        pages_per_second=round(pages / seconds, 1),
+        jobs_per_second=round(jobs / seconds),
+        peak_rss_mib=round(peak_rss_mib(), 1),
+    )
+    assert peak_rss_mib() <= threshold("PEAK_RSS_MIB")
+    if min_jobs_per_second is not None:
+        assert jobs / seconds >= min_jobs_per_second
+    if min_pages_per_second is not None:
+        assert pages / seconds >= min_pages_per_second
+
+
+def test_parse_pages(benchmark, replay_scraper, replayed_pages):
+    """Recorded pages through IndeedScraper._parse_api_response."""
+    def parse():
+        return sum(len(replay_scraper._parse_api_response(body).jobs) for body in replayed_pages)
+
+    jobs = benchmark(parse)
+
+    _report(benchmark, len(replayed_pages), jobs, min_jobs_per_second=threshold("PARSE_JOBS_PER_SECOND"))
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl", "parquet", "sqlite"])
+def test_parse_and_store(benchmark, replay_scraper, replayed_pages, tmp_path, format):
+    """Recorded pages parsed and streamed through a Storage writer."""
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+    storage = Storage(str(tmp_path))
+    written = {}
+    rounds = itertools.count()
+
+    def run():
+        with storage.open_writer(format=format, filename=f"bench_{next(rounds)}") as writer:
+            for body in replayed_pages:
+                writer.write(replay_scraper._parse_api_response(body).jobs)
+        written.update(jobs=writer.count, bytes=writer.path.stat().st_size)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    benchmark.extra_info.update(bytes_written=written["bytes"], bytes_per_job=round(written["bytes"] / written["jobs"]))
+    _report(benchmark, len(replayed_pages), written["jobs"], min_jobs_per_second=threshold("STORE_JOBS_PER_SECOND"))
+
+
+def test_replay_end_to_end(benchmark, replay_scraper, synthetic_recorder):
+    """A full cursor chain through _make_request in replay mode, no network or proxies."""
+    replay_scraper.recorder = synthetic_recorder
+
+    def crawl():
+        return [len(page.jobs) for page in replay_scraper.iter_pages(SEARCH)]
+
+    pages = benchmark(crawl)
+
+    assert len(pages) == SYNTHETIC_PAGES
+    _report(benchmark, len(pages), sum(pages), min_pages_per_second=threshold("REPLAY_PAGES_PER_SECOND"))
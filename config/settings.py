@@ -22,7 +22,37 @@ class ScraperSettings:
     request_timeout: int = 10
     max_retries: int = 3
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    delay_between_requests: float = 2.0
+    delay_between_requests: float = 2.0  # minimum spacing of requests per proxy (0 disables)
+    host_requests_per_second: float = 5.0  # request budget per target host (0 disables)
+    rate_limit_burst: float = 1.0  # requests allowed back to back before spacing applies
+    retry_backoff_base: float = 1.0  # first retry backoff in seconds, doubled per attempt
+    retry_backoff_max: float = 60.0  # upper bound for a retry backoff
+    concurrency_initial: int = 4  # requests in flight before any feedback
+    concurrency_min: int = 1
+    concurrency_max: int = 64
+    session_pool_size: int = 32  # max pooled sessions (one per proxy)
+    session_idle_timeout: float = 90.0  # seconds before an unused session is closed
+    session_max_age: float = 600.0  # seconds before a session is recycled
+    proxy_cooldown_base: float = 5.0  # first cool-down for a failing proxy, doubled per failure
+    proxy_cooldown_max: float = 300.0  # upper bound for a proxy cool-down
+    proxy_cache_path: str = ".cache/proxies.json"  # on-disk proxy inventory
+    proxy_cache_ttl: float = 3600.0  # seconds before the inventory is refreshed
+    response_cache_enabled: bool = True  # serve repeated requests from disk
+    response_cache_path: str = ".cache/responses.db"
+    response_cache_ttl: float = 900.0  # seconds a cached response stays valid
+    response_cache_max_bytes: int = 268435456  # budget for compressed bodies (256 MiB)
+    replay_mode: str = "off"  # "record" saves responses as fixtures, "replay" serves only fixtures
+    replay_fixtures_dir: str = "benchmarks/fixtures"
+    metrics_enabled: bool = True  # per-request latency/bytes/status histograms
+    metrics_export_path: str = ""  # snapshot written on close (*.json, otherwise Prometheus text)
+    tracing_enabled: bool = False  # spans around search, requests, parsing and saving
+    tracing_sample_rate: float = 1.0  # fraction of top-level spans (traces) recorded
+    tracing_max_spans: int = 100000  # oldest spans are dropped beyond this
+    tracing_export_path: str = ""  # written on close (*.json: Chrome trace, otherwise folded stacks)
+    browser_pool_size: int = 2  # Chrome instances in use at once in browser mode
+    browser_max_pages: int = 50  # pages after which a Chrome instance is recycled
+    webdriver_path: str = ""  # chromedriver binary; resolved once via webdriver-manager when empty
+    browser_block_resources: bool = True  # skip images, fonts, CSS, media and trackers in browser mode
 
 @dataclass
 class StorageSettings:
@@ -67,7 +97,7 @@ class Settings:
         )
         
         # Load scraper settings with defaults
-        self.scraper = ScraperSettings()
+        self.scraper = ScraperSettings(**config_data.get('scraper', {}))
         
         # Load storage settings with defaults
         self.storage = StorageSettings()
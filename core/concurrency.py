@@ -0,0 +1,173 @@
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Iterator, Optional
+import random
+import threading
+import time
+
+import requests
+
+from config.settings import settings
+
+# Status codes treated as "slow down" signals from the target
+BLOCK_STATUS_CODES = (403, 429)
+# Markers of an anti-bot challenge page served instead of the API response
+CAPTCHA_MARKERS = (b"captcha", b"cf-chl", b"challenge-platform")
+
+def is_blocked_response(response: requests.Response) -> bool:
+    """Check whether a response is a 403/429 or a captcha challenge page."""
+    if response.status_code in BLOCK_STATUS_CODES:
+        return True
+    if "html" not in response.headers.get("Content-Type", ""):
+        return False
+    head = response.content[:4096].lower()
+    return any(marker in head for marker in CAPTCHA_MARKERS)
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Get the delay requested by a Retry-After header.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None without a usable header
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Get a full-jitter exponential backoff delay for a 0-based retry attempt."""
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limit on the number of requests in flight.
+
+    Every healthy response grows the limit by 1/limit (about +1 per round
+    trip of the whole window); a 403, 429 or captcha halves it. Decreases are
+    applied at most once per `decrease_cooldown` seconds so a burst of
+    blocks from requests that were already in flight only counts once.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+        window: int = 100
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest allowed limit
+            maximum: Highest allowed limit
+            decrease_factor: Multiplier applied to the limit on a block
+            decrease_cooldown: Minimum seconds between two decreases
+            window: Number of recent responses the block rate is computed over
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_settings(cls) -> "AdaptiveConcurrencyController":
+        """Build a controller from the scraper settings."""
+        return cls(
+            initial=settings.scraper.concurrency_initial,
+            minimum=settings.scraper.concurrency_min,
+            maximum=settings.scraper.concurrency_max
+        )
+
+    @property
+    def concurrency(self) -> int:
+        """Current limit on requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def block_rate(self) -> float:
+        """Share of blocked responses among the recent ones."""
+        with self._condition:
+            if not self._outcomes:
+                return 0.0
+            return sum(self._outcomes) / len(self._outcomes)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; False if `timeout` expires first."""
+        with self._condition:
+            acquired = self._condition.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            )
+            if acquired:
+                self._in_flight += 1
+            return acquired
+
+    def release(self) -> None:
+        """Give a slot back."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record(self, blocked: bool) -> None:
+        """
+        Feed a response outcome into the controller.
+
+        Args:
+            blocked: Whether the response was a 403, 429 or captcha
+        """
+        with self._condition:
+            self._outcomes.append(blocked)
+            if blocked:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self._limit = max(float(self.minimum), self._limit * self.decrease_factor)
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+                self._condition.notify_all()
+
+# Example usage:
+if __name__ == "__main__":
+    controller = AdaptiveConcurrencyController(initial=4)
+    for _ in range(20):
+        controller.record(blocked=False)
+    print("After healthy responses:", controller.concurrency)
+    controller.record(blocked=True)
+    print("After a 429:", controller.concurrency, f"(block rate {controller.block_rate:.0%})")
@@ -1,8 +1,14 @@
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List
 from datetime import datetime
+import sys
 
-@dataclass
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated string (company names, locations, ...) so equal values share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+# Job and Company use __slots__: no per-instance __dict__ on millions of rows
+@dataclass(slots=True)
 class Company:
     name: str  # from employer.name
     website: Optional[str]  # from employer.dossier.links.corporateWebsite
@@ -10,7 +16,7 @@ class Company:
     contact_email: Optional[str]  # not in API, would need to be scraped
     contact_phone: Optional[str]  # not in API, would need to be scraped
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     title: str  # from job.title
     company: Company
@@ -22,6 +28,9 @@ class Job:
     description: str  # from job.description.html
     application_url: str  # from job.recruit.viewJobUrl
     source_url: str  # from job.recruit.viewJobUrl
+    salary_min: Optional[float] = None  # from job.compensation.estimated.baseSalary.range.min
+    salary_max: Optional[float] = None  # from job.compensation.estimated.baseSalary.range.max
+    key: Optional[str] = None  # from job.key, Indeed's stable job identifier
 
 @dataclass
 class SearchParams:
@@ -34,6 +43,8 @@ class SearchParams:
 class SearchResult:
     jobs: List[Job]
     next_cursor: Optional[str]
+    # Keys (with listing fingerprints) to record in the seen index once `jobs` are persisted
+    seen_keys: Dict[str, Optional[str]] = field(default_factory=dict)
 
 class ScrapingMethod:
     API = "api"
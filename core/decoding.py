@@ -0,0 +1,394 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import json
+
+from core.data_model import Company, Job, intern_str
+from core.queries import INDEED_JOB_TYPE_KEYS, INDEED_REMOTE_KEYS
+
+# Both decoders are optional: msgspec decodes pages straight into typed
+# structs, orjson (or the stdlib) backs the generic extractor path
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the fastest available decoder."""
+    if msgspec is not None:
+        return msgspec.json.decode(content)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def compile_path(path: Sequence[Any]) -> Callable[[Any], Any]:
+    """
+    Compile a lookup path into an extractor function.
+
+    Missing keys, nulls and empty lists along the path yield None instead of
+    raising, so a whole page can be extracted without per-job error handling.
+
+    Args:
+        path: Dict keys (str) and list indexes (int) from the root object
+
+    Returns:
+        Callable[[Any], Any]: Extractor returning the value at the path or None
+    """
+    path = tuple(path)
+    if len(path) == 1:
+        (first,) = path
+
+        def extract(obj: Any) -> Any:
+            try:
+                return obj[first]
+            except (KeyError, IndexError, TypeError):
+                return None
+    elif len(path) == 2:
+        first, second = path
+
+        def extract(obj: Any) -> Any:
+            try:
+                return obj[first][second]
+            except (KeyError, IndexError, TypeError):
+                return None
+    else:
+        def extract(obj: Any) -> Any:
+            try:
+                for step in path:
+                    obj = obj[step]
+                return obj
+            except (KeyError, IndexError, TypeError):
+                return None
+    return extract
+
+@lru_cache(maxsize=4096)
+def parse_date(value: Any) -> Optional[datetime]:
+    """Parse datePublished (epoch milliseconds or ISO 8601), None if missing or invalid"""
+    if value is None or value == "":
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value / 1000)
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+def format_compensation(salary_min: Optional[float], salary_max: Optional[float]) -> Optional[str]:
+    """Format an estimated salary range into a readable string"""
+    if salary_min and salary_max:
+        return f"${salary_min:,.2f} - ${salary_max:,.2f}"
+    elif salary_min:
+        return f"From ${salary_min:,.2f}"
+    elif salary_max:
+        return f"Up to ${salary_max:,.2f}"
+    return None
+
+class JobRecord(NamedTuple):
+    """Compact typed record of one jobSearch/jobData result."""
+    key: Optional[str]
+    title: str
+    company_name: str
+    company_website: Optional[str]
+    company_location: Optional[str]
+    location: str
+    is_remote: bool
+    job_type: str
+    salary_min: Optional[float]
+    salary_max: Optional[float]
+    date_posted: Optional[datetime]
+    description: str
+    url: str
+
+    def to_job(self) -> Job:
+        """Build the Job (and its Company) for this record."""
+        # Values repeated across postings are interned, unique text is not
+        return Job(
+            title=self.title,
+            company=Company(
+                name=intern_str(self.company_name),
+                website=intern_str(self.company_website),
+                location=intern_str(self.company_location),
+                contact_email=None,  # Not available in API
+                contact_phone=None   # Not available in API
+            ),
+            location=intern_str(self.location),
+            is_remote=self.is_remote,
+            job_type=intern_str(self.job_type),
+            compensation=format_compensation(self.salary_min, self.salary_max),
+            date_posted=self.date_posted,
+            description=self.description,
+            application_url=self.url,
+            source_url=self.url,
+            salary_min=self.salary_min,
+            salary_max=self.salary_max,
+            key=self.key
+        )
+
+class JobSearchPage(NamedTuple):
+    """Decoded jobSearch page."""
+    records: List[JobRecord]
+    next_cursor: Optional[str]
+
+_SALARY_RANGE = ("compensation", "estimated", "baseSalary", "range")
+
+# Extractors relative to `results[].job`, compiled once at import
+_key = compile_path(("key",))
+_title = compile_path(("title",))
+_company_name = compile_path(("employer", "name"))
+_company_website = compile_path(("employer", "dossier", "links", "corporateWebsite"))
+_company_location = compile_path(("employer", "dossier", "employerDetails", "addresses", 0))
+_location = compile_path(("location", "formatted", "short"))
+_attributes = compile_path(("attributes",))
+_salary_min = compile_path(_SALARY_RANGE + ("min",))
+_salary_max = compile_path(_SALARY_RANGE + ("max",))
+_date_published = compile_path(("datePublished",))
+_description = compile_path(("description", "html"))
+_url = compile_path(("recruit", "viewJobUrl"))
+
+_results = compile_path(("data", "jobSearch", "results"))
+_next_cursor = compile_path(("data", "jobSearch", "pageInfo", "nextCursor"))
+_job_data_results = compile_path(("data", "jobData", "results"))
+
+def _attribute_flags(attributes: Optional[List[Dict[str, Any]]]) -> Tuple[bool, str]:
+    """Get (is_remote, job_type) from a job's attributes in a single pass."""
+    is_remote = False
+    job_type = None
+    for attr in attributes or ():
+        name = (attr.get("key") or "").lower()
+        if name in INDEED_REMOTE_KEYS:
+            is_remote = True
+        elif job_type is None and name in INDEED_JOB_TYPE_KEYS:
+            job_type = attr.get("label", "Unknown")
+    return is_remote, job_type or "Unknown"
+
+def decode_job(job: Dict[str, Any]) -> JobRecord:
+    """
+    Extract a record from a single `job` object.
+
+    Args:
+        job: The `job` object of a jobSearch or jobData result
+
+    Returns:
+        JobRecord: The extracted record
+    """
+    is_remote, job_type = _attribute_flags(_attributes(job))
+    return JobRecord(
+        key=_key(job),
+        title=_title(job) or "",
+        company_name=_company_name(job) or "",
+        company_website=_company_website(job),
+        company_location=_company_location(job),
+        location=_location(job) or "",
+        is_remote=is_remote,
+        job_type=job_type,
+        salary_min=_salary_min(job),
+        salary_max=_salary_max(job),
+        date_posted=parse_date(_date_published(job)),
+        description=_description(job) or "",
+        url=_url(job) or ""
+    )
+
+def decode_jobs(results: Optional[List[Dict[str, Any]]]) -> List[JobRecord]:
+    """Extract records from a page's `results` array in one batch."""
+    return [decode_job(result["job"]) for result in results or () if result and result.get("job")]
+
+if msgspec is not None:
+    # Response schema: only the fields the scraper reads are declared, so
+    # everything else in the body is skipped without being materialized
+    class _Formatted(msgspec.Struct):
+        short: Optional[str] = None
+
+    class _Location(msgspec.Struct):
+        formatted: Optional[_Formatted] = None
+
+    class _Html(msgspec.Struct):
+        html: Optional[str] = None
+
+    class _Range(msgspec.Struct):
+        min: Optional[float] = None
+        max: Optional[float] = None
+
+    class _BaseSalary(msgspec.Struct):
+        range: Optional[_Range] = None
+
+    class _Estimated(msgspec.Struct):
+        baseSalary: Optional[_BaseSalary] = None
+
+    class _Compensation(msgspec.Struct):
+        estimated: Optional[_Estimated] = None
+
+    class _Attribute(msgspec.Struct):
+        key: Optional[str] = None
+        label: Optional[str] = "Unknown"
+
+    class _EmployerDetails(msgspec.Struct):
+        addresses: Optional[List[str]] = None
+
+    class _Links(msgspec.Struct):
+        corporateWebsite: Optional[str] = None
+
+    class _Dossier(msgspec.Struct):
+        employerDetails: Optional[_EmployerDetails] = None
+        links: Optional[_Links] = None
+
+    class _Employer(msgspec.Struct):
+        name: Optional[str] = None
+        dossier: Optional[_Dossier] = None
+
+    class _Recruit(msgspec.Struct):
+        viewJobUrl: Optional[str] = None
+
+    class _Job(msgspec.Struct):
+        key: Optional[str] = None
+        title: Optional[str] = None
+        datePublished: Union[int, float, str, None] = None
+        description: Optional[_Html] = None
+        location: Optional[_Location] = None
+        compensation: Optional[_Compensation] = None
+        attributes: Optional[List[_Attribute]] = None
+        employer: Optional[_Employer] = None
+        recruit: Optional[_Recruit] = None
+
+    class _Result(msgspec.Struct):
+        job: Optional[_Job] = None
+
+    class _PageInfo(msgspec.Struct):
+        nextCursor: Optional[str] = None
+
+    class _JobSearch(msgspec.Struct):
+        results: Optional[List[_Result]] = None
+        pageInfo: Optional[_PageInfo] = None
+
+    class _Data(msgspec.Struct):
+        jobSearch: Optional[_JobSearch] = None
+
+    class _Payload(msgspec.Struct):
+        data: Optional[_Data] = None
+
+    _payload_decoder = msgspec.json.Decoder(_Payload)
+
+    def _record_from_struct(job: "_Job") -> JobRecord:
+        """Build a record from a typed job struct."""
+        is_remote = False
+        job_type = None
+        for attr in job.attributes or ():
+            name = (attr.key or "").lower()
+            if name in INDEED_REMOTE_KEYS:
+                is_remote = True
+            elif job_type is None and name in INDEED_JOB_TYPE_KEYS:
+                job_type = attr.label
+        employer = job.employer
+        dossier = employer.dossier if employer else None
+        details = dossier.employerDetails if dossier else None
+        links = dossier.links if dossier else None
+        location = job.location.formatted if job.location else None
+        estimated = job.compensation.estimated if job.compensation else None
+        base_salary = estimated.baseSalary if estimated else None
+        salary_range = base_salary.range if base_salary else None
+        return JobRecord(
+            key=job.key,
+            title=job.title or "",
+            company_name=(employer.name if employer else None) or "",
+            company_website=links.corporateWebsite if links else None,
+            company_location=details.addresses[0] if details and details.addresses else None,
+            location=(location.short if location else None) or "",
+            is_remote=is_remote,
+            job_type=job_type or "Unknown",
+            salary_min=salary_range.min if salary_range else None,
+            salary_max=salary_range.max if salary_range else None,
+            date_posted=parse_date(job.datePublished),
+            description=(job.description.html if job.description else None) or "",
+            url=(job.recruit.viewJobUrl if job.recruit else None) or ""
+        )
+
+    def _decode_typed(content: Union[bytes, str]) -> Optional[JobSearchPage]:
+        """Decode a jobSearch body into records; None if it does not fit the schema."""
+        try:
+            payload = _payload_decoder.decode(content)
+        except msgspec.ValidationError:
+            return None
+        job_search = payload.data.jobSearch if payload.data else None
+        if job_search is None:
+            return JobSearchPage(records=[], next_cursor=None)
+        return JobSearchPage(
+            records=[_record_from_struct(result.job) for result in job_search.results or () if result and result.job],
+            next_cursor=job_search.pageInfo.nextCursor if job_search.pageInfo else None
+        )
+
+def decode_job_search(content: Union[bytes, str, Dict[str, Any]]) -> JobSearchPage:
+    """
+    Decode a jobSearch response straight from its body.
+
+    With msgspec installed the body is decoded directly into typed structs;
+    otherwise (or when the body does not match the schema) it is decoded
+    generically and run through the precompiled extractors.
+
+    Args:
+        content: Raw response body (or an already decoded payload)
+
+    Returns:
+        JobSearchPage: The page's records and next cursor
+    """
+    if isinstance(content, (bytes, str)):
+        if msgspec is not None:
+            page = _decode_typed(content)
+            if page is not None:
+                return page
+        content = loads(content)
+    return JobSearchPage(records=decode_jobs(_results(content)), next_cursor=_next_cursor(content))
+
+def decode_job_data(content: Union[bytes, str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Decode a batched jobData response into raw job objects by key.
+
+    Args:
+        content: Raw response body (or an already decoded payload)
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Job objects keyed by job key
+    """
+    data = loads(content) if isinstance(content, (bytes, str)) else content
+    return {
+        result["job"]["key"]: result["job"]
+        for result in _job_data_results(data) or ()
+        if result and result.get("job") and result["job"].get("key")
+    }
+
+def decode_listings(content: Union[bytes, str, Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+    """
+    Decode a listing-pass jobSearch response into raw job objects by key.
+
+    Null `data` (GraphQL errors) or `jobSearch` yields an empty page.
+
+    Args:
+        content: Raw response body (or an already decoded payload)
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Optional[str]]: Job objects keyed by
+            job key, and the next cursor
+    """
+    data = loads(content) if isinstance(content, (bytes, str)) else content
+    listings = {
+        result["job"]["key"]: result["job"]
+        for result in _results(data) or ()
+        if result and result.get("job") and result["job"].get("key")
+    }
+    return listings, _next_cursor(data)
+
+# Example usage:
+if __name__ == "__main__":
+    body = (
+        b'{"data":{"jobSearch":{"pageInfo":{"nextCursor":"abc"},"results":[{"job":{'
+        b'"key":"0f713639bfb7177e","title":"Project Manager","datePublished":1746144000000,'
+        b'"location":{"formatted":{"short":"Addison, TX"}},'
+        b'"attributes":[{"key":"job_type","label":"Full-time"}],'
+        b'"employer":{"name":"AG|CM, Inc."},'
+        b'"recruit":{"viewJobUrl":"https://www.indeed.com/viewjob?jk=0f713639bfb7177e"}}}]}}}'
+    )
+    page = decode_job_search(body)
+    print(page.next_cursor, page.records[0])
+    print(page.records[0].to_job())
@@ -0,0 +1,243 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+import atexit
+import logging
+import threading
+import time
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# URL patterns (Network.setBlockedURLs syntax) not needed to read the job cards
+BLOCKED_RESOURCE_PATTERNS: Tuple[str, ...] = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.css", "*.mp4",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*bat.bing.com*", "*newrelic.com*",
+)
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path() -> str:
+    """
+    Get the chromedriver binary path, resolving it once per process.
+
+    `webdriver_path` from settings is used as is; otherwise webdriver-manager
+    looks the matching driver up (a version check over the network) the
+    first time only.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            if settings.scraper.webdriver_path:
+                _driver_path = settings.scraper.webdriver_path
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def launch_chrome(
+    headless: bool = True,
+    next_user_agent: Optional[Callable[[], str]] = None,
+    block_resources: bool = False
+) -> Any:
+    """
+    Launch Chrome with the scraper's standard options.
+
+    Navigation returns once the DOM is parsed (the "eager" page load
+    strategy) instead of waiting for every subresource; callers wait for the
+    elements they need.
+
+    Args:
+        headless: Run without a window
+        next_user_agent: Called once to pick the instance's user agent
+        block_resources: Skip images, fonts, stylesheets, media and trackers
+
+    Returns:
+        selenium.webdriver.Chrome
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+
+    # Add common options
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+
+    options.page_load_strategy = "eager"
+
+    if next_user_agent is not None:
+        options.add_argument(f"user-agent={next_user_agent()}")
+
+    if block_resources:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    if block_resources:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_RESOURCE_PATTERNS)})
+    return driver
+
+@dataclass
+class PooledDriver:
+    """A pooled WebDriver with its usage counters."""
+    driver: Any
+    pages: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+class WebDriverPool:
+    """
+    Pool of warm WebDriver instances reused across searches.
+
+    At most `max_size` drivers are checked out at once; further callers
+    block until one is released. A driver is quit and replaced after
+    `max_pages` checkouts, and when the page it served raised anything but a
+    timeout (a crashed browser or a lost chromedriver session).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 2,
+        max_pages: int = 50
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Launches a new WebDriver
+            max_size: Maximum number of drivers in use at once
+            max_pages: Checkouts after which a driver is recycled
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.factory = factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self._idle: List[PooledDriver] = []
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.closed = False
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        Check a driver out for one page.
+
+        Yields:
+            A WebDriver owned by the caller until the block exits
+        """
+        self._slots.acquire()
+        try:
+            pooled = self._checkout()
+            try:
+                yield pooled.driver
+            except Exception as e:
+                if not _is_timeout(e):
+                    logger.warning(f"Recycling WebDriver after error: {e}")
+                    self._quit(pooled)
+                    pooled = None
+                raise
+            finally:
+                if pooled is not None:
+                    self._checkin(pooled)
+        finally:
+            self._slots.release()
+
+    def _checkout(self) -> PooledDriver:
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("WebDriver pool is closed")
+            if self._idle:
+                pooled = self._idle.pop()
+                pooled.pages += 1
+                return pooled
+            self.launched += 1
+        return PooledDriver(driver=self.factory(), pages=1)
+
+    def _checkin(self, pooled: PooledDriver) -> None:
+        with self._lock:
+            if not self.closed and pooled.pages < self.max_pages:
+                self._idle.append(pooled)
+                return
+        self._quit(pooled)
+
+    @staticmethod
+    def _quit(pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"WebDriver quit failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def close(self) -> None:
+        """Quit every idle driver; drivers in use are quit when released."""
+        with self._lock:
+            self.closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+
+def _is_timeout(error: Exception) -> bool:
+    try:
+        from selenium.common.exceptions import TimeoutException
+    except ImportError:
+        return False
+    return isinstance(error, TimeoutException)
+
+_pools: Dict[Hashable, WebDriverPool] = {}
+_pools_lock = threading.Lock()
+
+def get_driver_pool(key: Hashable, factory: Callable[[], Any]) -> WebDriverPool:
+    """
+    Get the process-wide pool for a browser configuration.
+
+    Args:
+        key: Identifies the launch options (e.g. headless flag)
+        factory: Launches a driver for the pool created on first use
+
+    Returns:
+        WebDriverPool: Sized from settings, shared by every scraper using `key`
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = WebDriverPool(
+                factory,
+                max_size=settings.scraper.browser_pool_size,
+                max_pages=settings.scraper.browser_max_pages
+            )
+            _pools[key] = pool
+        return pool
+
+def close_driver_pools() -> None:
+    """Quit the drivers of every shared pool (also run at interpreter exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+atexit.register(close_driver_pools)
+
+# Example usage:
+if __name__ == "__main__":
+    pool = WebDriverPool(partial(launch_chrome, block_resources=True), max_size=1, max_pages=10)
+    for url in ("https://example.com", "https://example.org"):
+        with pool.acquire() as driver:
+            driver.get(url)
+            print(driver.title, pool.launched)
+    pool.close()
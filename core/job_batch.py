@@ -0,0 +1,234 @@
+from array import array
+from typing import Any, Dict, Hashable, Iterable, Iterator, List
+import math
+import zlib
+
+from core.data_model import Company, Job
+
+# Columns whose values repeat across postings: stored as codes into a dictionary
+DICTIONARY_COLUMNS = (
+    "title",
+    "location",
+    "job_type",
+    "compensation",
+    "date_posted",
+    "company_name",
+    "company_website",
+    "company_location",
+    "company_contact_email",
+    "company_contact_phone",
+)
+# Columns unique to every posting: stored as plain lists
+TEXT_COLUMNS = ("key", "description", "application_url", "source_url")
+# Numeric columns: stored in typed arrays, NaN stands for None
+FLOAT_COLUMNS = ("salary_min", "salary_max")
+
+class ValueDictionary:
+    """Dictionary encoding for one column: each distinct value is stored once."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = [None]
+        self._codes: Dict[Hashable, int] = {None: 0}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: Hashable) -> int:
+        """Get the code of a value, adding it to the dictionary if needed."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+class JobBatch:
+    """
+    Columnar, array-backed container for many jobs (a page or a whole crawl).
+
+    Repeated values (company names, locations, job types, dates, ...) are
+    dictionary-encoded into `array('I')` codes, salaries live in `array('d')`
+    and the remote flag in `array('b')`, so a row costs a few machine words
+    plus its unique text instead of two objects with a field per attribute.
+    Descriptions can optionally be kept zlib-compressed.
+
+    Jobs are materialized on access (`batch[i]`, iteration), so a batch can be
+    passed wherever an iterable of Job is expected, e.g. to a storage writer.
+    """
+
+    def __init__(self, jobs: Iterable[Job] = (), compress_descriptions: bool = False) -> None:
+        """
+        Initialize the batch.
+
+        Args:
+            jobs: Jobs to add
+            compress_descriptions: Keep descriptions zlib-compressed in memory
+        """
+        self.compress_descriptions = compress_descriptions
+        self.dictionaries: Dict[str, ValueDictionary] = {
+            name: ValueDictionary() for name in DICTIONARY_COLUMNS
+        }
+        self._codes: Dict[str, array] = {name: array("I") for name in DICTIONARY_COLUMNS}
+        self._text: Dict[str, List[Any]] = {name: [] for name in TEXT_COLUMNS}
+        self._floats: Dict[str, array] = {name: array("d") for name in FLOAT_COLUMNS}
+        self._is_remote = array("b")
+        self._index: Dict[str, int] = {}
+        self.extend(jobs)
+
+    def __len__(self) -> int:
+        return len(self._is_remote)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[Job]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> Job:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("JobBatch index out of range")
+        value = self._value
+        return Job(
+            title=value("title", row),
+            company=Company(
+                name=value("company_name", row),
+                website=value("company_website", row),
+                location=value("company_location", row),
+                contact_email=value("company_contact_email", row),
+                contact_phone=value("company_contact_phone", row)
+            ),
+            location=value("location", row),
+            is_remote=value("is_remote", row),
+            job_type=value("job_type", row),
+            compensation=value("compensation", row),
+            date_posted=value("date_posted", row),
+            description=value("description", row),
+            application_url=value("application_url", row),
+            source_url=value("source_url", row),
+            salary_min=value("salary_min", row),
+            salary_max=value("salary_max", row),
+            key=value("key", row)
+        )
+
+    def _value(self, name: str, row: int) -> Any:
+        """Decode a single cell."""
+        if name in self._codes:
+            return self.dictionaries[name].values[self._codes[name][row]]
+        if name in self._floats:
+            number = self._floats[name][row]
+            return None if math.isnan(number) else number
+        if name == "is_remote":
+            return bool(self._is_remote[row])
+        text = self._text[name][row]
+        if name == "description" and isinstance(text, bytes):
+            return zlib.decompress(text).decode("utf-8")
+        return text
+
+    def append(self, job: Job) -> None:
+        """Add a job as a new row."""
+        company = job.company
+        values = {
+            "title": job.title,
+            "location": job.location,
+            "job_type": job.job_type,
+            "compensation": job.compensation,
+            "date_posted": job.date_posted,
+            "company_name": company.name if company else None,
+            "company_website": company.website if company else None,
+            "company_location": company.location if company else None,
+            "company_contact_email": company.contact_email if company else None,
+            "company_contact_phone": company.contact_phone if company else None,
+        }
+        for name, value in values.items():
+            self._codes[name].append(self.dictionaries[name].encode(value))
+
+        description = job.description
+        if self.compress_descriptions and description:
+            description = zlib.compress(description.encode("utf-8"))
+        self._text["key"].append(job.key)
+        self._text["description"].append(description)
+        self._text["application_url"].append(job.application_url)
+        self._text["source_url"].append(job.source_url)
+
+        self._floats["salary_min"].append(math.nan if job.salary_min is None else job.salary_min)
+        self._floats["salary_max"].append(math.nan if job.salary_max is None else job.salary_max)
+        self._is_remote.append(bool(job.is_remote))
+        if job.key is not None:
+            self._index.setdefault(job.key, len(self) - 1)
+
+    def extend(self, jobs: Iterable[Job]) -> None:
+        """Add several jobs."""
+        for job in jobs:
+            self.append(job)
+
+    def index(self, key: str) -> int:
+        """
+        Get the row of the first job with a key.
+
+        Raises:
+            KeyError: If no job in the batch has the key
+        """
+        return self._index[key]
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Decode a whole column.
+
+        Args:
+            name: Job field name, or company_<field> for company fields
+
+        Returns:
+            List[Any]: One value per row
+        """
+        if name in self._codes:
+            values = self.dictionaries[name].values
+            return [values[code] for code in self._codes[name]]
+        return [self._value(name, row) for row in range(len(self))]
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """Count rows per distinct value of a dictionary-encoded column."""
+        counts = [0] * len(self.dictionaries[name])
+        for code in self._codes[name]:
+            counts[code] += 1
+        values = self.dictionaries[name].values
+        return {values[code]: count for code, count in enumerate(counts) if count}
+
+    def nbytes(self) -> int:
+        """Approximate size of the array buffers and dictionary/text contents."""
+        total = sum(codes.itemsize * len(codes) for codes in self._codes.values())
+        total += sum(numbers.itemsize * len(numbers) for numbers in self._floats.values())
+        total += len(self._is_remote)
+        for dictionary in self.dictionaries.values():
+            total += sum(len(value) for value in dictionary.values if isinstance(value, (str, bytes)))
+        for texts in self._text.values():
+            total += sum(len(text) for text in texts if isinstance(text, (str, bytes)))
+        return total
+
+# Example usage:
+if __name__ == "__main__":
+    from datetime import datetime
+
+    batch = JobBatch(
+        Job(
+            title="Python Developer",
+            company=Company(name="Tech Corp", website=None, location=None,
+                            contact_email=None, contact_phone=None),
+            location="Remote",
+            is_remote=True,
+            job_type="Full-time",
+            compensation=None,
+            date_posted=datetime(2025, 5, 2),
+            description="Looking for a Python developer...",
+            application_url=f"https://www.indeed.com/viewjob?jk={i}",
+            source_url=f"https://www.indeed.com/viewjob?jk={i}",
+            key=str(i)
+        )
+        for i in range(1000)
+    )
+    print(len(batch), "jobs,", len(batch.dictionaries["company_name"]) - 1, "distinct companies")
+    print(batch.value_counts("location"))
+    print(batch[0])
@@ -0,0 +1,377 @@
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = "jobscraper"
+
+# Connection setup time of the request running on the current thread
+_connect_timing = threading.local()
+
+def reset_connect_timer() -> None:
+    """Start measuring connection setup for the next request on this thread."""
+    _connect_timing.seconds = 0.0
+
+def connect_elapsed() -> float:
+    """Seconds spent opening connections since `reset_connect_timer` (0 when reused)."""
+    return getattr(_connect_timing, "seconds", 0.0)
+
+class _TimedConnectionMixin:
+    """Adds the duration of TCP/TLS (and proxy tunnel) setup to the thread's timer."""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = connect_elapsed() + time.perf_counter() - start
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+_TIMED_POOL_CLASSES = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections (direct or through a proxy) report their setup time."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _TIMED_POOL_CLASSES
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = _TIMED_POOL_CLASSES
+        return manager
+
+def proxy_label(proxies: Optional[Dict[str, str]]) -> str:
+    """Get a credential-free label (host:port) for a requests-style proxies dict."""
+    if not proxies:
+        return "direct"
+    url = proxies.get("https") or proxies.get("http") or ""
+    parts = urlsplit(url if "://" in url else f"http://{url}")
+    return f"{parts.hostname}:{parts.port}" if parts.port else (parts.hostname or "unknown")
+
+def bytes_sent(request: Optional[requests.PreparedRequest], body: Any = None) -> int:
+    """Approximate bytes sent: request line, headers and body."""
+    if request is None:
+        return len(body) if isinstance(body, (bytes, str)) else 0
+    size = len(request.method or "") + len(request.path_url) + 11
+    size += sum(len(name) + len(value) + 4 for name, value in request.headers.items())
+    if isinstance(request.body, (bytes, str)):
+        size += len(request.body)
+    return size
+
+def bytes_received(response: requests.Response) -> int:
+    """Bytes of the response body as received (before content decoding when known)."""
+    raw = getattr(response, "raw", None)
+    try:
+        received = raw.tell() if raw is not None else 0
+    except Exception:
+        received = 0
+    return received or len(response.content or b"")
+
+@dataclass
+class RequestMetrics:
+    """Measurements of a single HTTP attempt made by `_make_request`."""
+    url: str
+    method: str
+    status_code: Optional[int]  # None when the request failed before a response
+    total_seconds: float  # from sending the request to the full body
+    ttfb_seconds: Optional[float] = None  # until the response headers were parsed
+    connect_seconds: float = 0.0  # TCP/TLS/proxy setup, 0 on a reused connection
+    bytes_in: int = 0
+    bytes_out: int = 0
+    proxy: str = "direct"  # host:port of the proxy, without credentials
+    user_agent: Optional[str] = None
+    query: Optional[str] = None  # label of the logical query (e.g. "what | location")
+    attempt: int = 0
+    cached: bool = False  # served by the response cache or a replay fixture
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Get (upper bound, cumulative count) pairs including +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket holding it."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in zip(self.buckets + (float("inf"),), (c for _, c in self.cumulative())):
+            if total >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(self.cumulative()),
+        }
+
+# (metric name, label name) -> label value -> histogram
+_HISTOGRAMS = {
+    ("request_seconds", "proxy"): "total_seconds",
+    ("request_seconds", "query"): "total_seconds",
+    ("ttfb_seconds", "proxy"): "ttfb_seconds",
+    ("connect_seconds", "proxy"): "connect_seconds",
+}
+_HELP = {
+    "request_seconds": "Total request latency in seconds",
+    "ttfb_seconds": "Time to the response headers in seconds",
+    "connect_seconds": "Connection setup time in seconds (new connections only)",
+    "requests_total": "Requests by proxy and status (status 0: no response)",
+    "bytes_in_total": "Response bytes received",
+    "bytes_out_total": "Request bytes sent",
+    "cache_hits_total": "Requests answered by the response cache or replay fixtures",
+}
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class MetricsRegistry:
+    """
+    Aggregates RequestMetrics into histograms and counters.
+
+    Latency histograms are kept per proxy and per query, TTFB and connect
+    histograms per proxy, and request/byte counters per proxy (requests also
+    per status code). Subscribed hooks receive every RequestMetrics as it is
+    observed. Aggregates export as Prometheus text or as a JSON snapshot.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Upper bounds (seconds) of the latency histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._hooks: List[Callable[[RequestMetrics], None]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every aggregate (hooks stay subscribed)."""
+        with self._lock:
+            self._histograms: Dict[Tuple[str, str], DefaultDict[str, Histogram]] = {
+                key: defaultdict(lambda: Histogram(self.buckets)) for key in _HISTOGRAMS
+            }
+            self._requests: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+            self._bytes_in: DefaultDict[str, int] = defaultdict(int)
+            self._bytes_out: DefaultDict[str, int] = defaultdict(int)
+            self._cache_hits = 0
+
+    def subscribe(self, hook: Callable[[RequestMetrics], None]) -> Callable[[RequestMetrics], None]:
+        """
+        Call `hook` with every observed RequestMetrics.
+
+        Hooks run on the requesting thread; exceptions are logged and ignored.
+
+        Returns:
+            The hook, so this can be used as a decorator
+        """
+        with self._lock:
+            self._hooks.append(hook)
+        return hook
+
+    def unsubscribe(self, hook: Callable[[RequestMetrics], None]) -> None:
+        """Stop calling a hook."""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def observe(self, metrics: RequestMetrics) -> None:
+        """Add one request's measurements to the aggregates and notify hooks."""
+        with self._lock:
+            if metrics.cached:
+                self._cache_hits += 1
+            else:
+                for (name, label), attribute in _HISTOGRAMS.items():
+                    value = getattr(metrics, attribute)
+                    label_value = getattr(metrics, label)
+                    if value is None or label_value is None:
+                        continue
+                    if name == "connect_seconds" and not value:
+                        continue
+                    self._histograms[(name, label)][label_value].observe(value)
+                self._requests[(metrics.proxy, str(metrics.status_code or 0))] += 1
+                self._bytes_in[metrics.proxy] += metrics.bytes_in
+                self._bytes_out[metrics.proxy] += metrics.bytes_out
+            hooks = list(self._hooks)
+
+        for hook in hooks:
+            try:
+                hook(metrics)
+            except Exception as e:
+                logger.warning(f"Metrics hook {hook!r} failed: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get every aggregate as a JSON-serializable dictionary."""
+        with self._lock:
+            histograms = {
+                f"{name}_by_{label}": {value: histogram.to_dict() for value, histogram in by_value.items()}
+                for (name, label), by_value in self._histograms.items()
+            }
+            requests_by_proxy: DefaultDict[str, Dict[str, int]] = defaultdict(dict)
+            for (proxy, status), count in self._requests.items():
+                requests_by_proxy[proxy][status] = count
+            return {
+                "timestamp": time.time(),
+                "histograms": histograms,
+                "requests": dict(requests_by_proxy),
+                "bytes_in": dict(self._bytes_in),
+                "bytes_out": dict(self._bytes_out),
+                "cache_hits": self._cache_hits,
+            }
+
+    def to_prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str) -> str:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {_HELP[name]}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        with self._lock:
+            for name in dict.fromkeys(name for name, _ in _HISTOGRAMS):
+                metric = header(name, "histogram")
+                for (histogram_name, label), by_value in self._histograms.items():
+                    if histogram_name != name:
+                        continue
+                    for value, histogram in sorted(by_value.items()):
+                        labels = f'{label}="{_escape(value)}"'
+                        for bound, count in histogram.cumulative():
+                            lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+                        lines.append(f"{metric}_sum{{{labels}}} {histogram.sum}")
+                        lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+            metric = header("requests_total", "counter")
+            for (proxy, status), count in sorted(self._requests.items()):
+                lines.append(f'{metric}{{proxy="{_escape(proxy)}",status="{status}"}} {count}')
+            for name, counter in (("bytes_in_total", self._bytes_in), ("bytes_out_total", self._bytes_out)):
+                metric = header(name, "counter")
+                for proxy, count in sorted(counter.items()):
+                    lines.append(f'{metric}{{proxy="{_escape(proxy)}"}} {count}')
+            metric = header("cache_hits_total", "counter")
+            lines.append(f"{metric} {self._cache_hits}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically write the Prometheus text file (e.g. for node_exporter's textfile collector)."""
+        _write_atomic(Path(path), self.to_prometheus())
+
+    def write_json(self, path: str) -> None:
+        """Atomically write a JSON snapshot."""
+        _write_atomic(Path(path), json.dumps(self.snapshot(), indent=2))
+
+    def export(self, path: str) -> None:
+        """Write a snapshot, as JSON for *.json paths and Prometheus text otherwise."""
+        if path.endswith(".json"):
+            self.write_json(path)
+        else:
+            self.write_prometheus(path)
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file through a temporary file so readers never see a partial export."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry shared by all scrapers."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+        return _metrics
+
+def reset_metrics() -> None:
+    """Drop the shared registry (and its hooks) so a fresh one is created."""
+    global _metrics
+    with _metrics_lock:
+        _metrics = None
+
+# Example usage:
+if __name__ == "__main__":
+    registry = MetricsRegistry()
+    registry.subscribe(lambda m: print(f"{m.status_code} {m.proxy} {m.total_seconds:.3f}s"))
+
+    session = requests.Session()
+    session.mount("https://", TimedHTTPAdapter())
+    for _ in range(2):
+        reset_connect_timer()
+        start = time.monotonic()
+        response = session.get("https://httpbin.org/get", timeout=10)
+        registry.observe(RequestMetrics(
+            url=response.url,
+            method="GET",
+            status_code=response.status_code,
+            total_seconds=time.monotonic() - start,
+            ttfb_seconds=response.elapsed.total_seconds(),
+            connect_seconds=connect_elapsed(),
+            bytes_in=bytes_received(response),
+            bytes_out=bytes_sent(response.request),
+            query="example"
+        ))
+    print(registry.to_prometheus())
@@ -1,9 +1,23 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, TypedDict
-from itertools import cycle
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TypedDict
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
 import requests
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Status codes that mean the proxy has been throttled or blocked by the target
+BLOCKED_STATUS_CODES = (403, 429)
+# Weight of the newest sample in the latency and error-rate moving averages
+HEALTH_EWMA_ALPHA = 0.3
+
 class ProxyConnection(TypedDict):
     publicIp: str
     httpPort: int
@@ -41,21 +55,140 @@ class Proxy:
             "https": self.url
         }
 
+@dataclass
+class ProxyStats:
+    """Health statistics recorded for a single proxy."""
+    latency: Optional[float] = None  # moving average of request latency in seconds
+    error_rate: float = 0.0  # moving average of failed requests (0..1)
+    requests: int = 0
+    errors: int = 0
+    blocked: int = 0  # 403/429 responses
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0  # time.monotonic() at which the proxy may be used again
+
+    def is_cooling_down(self, now: float) -> bool:
+        """Check whether the proxy is still serving a cool-down."""
+        return now < self.cooldown_until
+
+    def score(self, default_latency: float) -> float:
+        """
+        Get the health score of the proxy, lower is better.
+
+        The expected latency is inflated by the failure rate, so a fast proxy
+        that fails half of the time scores like one twice as slow.
+        """
+        latency = self.latency if self.latency is not None else default_latency
+        return latency / max(1.0 - self.error_rate, 0.05)
+
 class ProxyManager:
-    """Manages a pool of residential proxies with rotation capability."""
+    """
+    Manages a pool of residential proxies with health-weighted selection.
+
+    Every request outcome reported through `record_result` updates the
+    proxy's latency and error rate. Selection uses the "power of two choices":
+    two available proxies are sampled and the healthier one wins, which
+    steers traffic away from slow proxies without starving the rest. Failing
+    proxies are put in a cool-down that doubles with every consecutive
+    failure and are brought back once it expires and a request succeeds.
+    Once the inventory is older than `cache_ttl`, the next selection starts
+    a background refresh.
+    """
     
-    def __init__(self, residential: bool = True) -> None:
-        """Initialize the proxy manager and fetch available proxies."""
+    def __init__(
+        self,
+        residential: bool = True,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        background_refresh: bool = True
+    ) -> None:
+        """
+        Initialize the proxy manager from the on-disk inventory cache.
+
+        A fresh cache is used as is. A stale cache is used immediately while
+        the inventory is refreshed in the background. Without a cache the
+        residential proxies are fetched synchronously and the slow mobile
+        proxy check is left to a background thread. With `background_refresh`
+        off, every refresh runs before the constructor returns.
+
+        Args:
+            residential: Whether to route through residential proxies
+            cache_path: Inventory cache file (defaults to settings)
+            cache_ttl: Seconds before the cache is considered stale (defaults to settings)
+            background_refresh: Refresh a stale or partial inventory in a daemon thread
+        """
         self.residential = residential
+        self.cache_path = Path(cache_path or settings.scraper.proxy_cache_path)
+        self.cache_ttl = cache_ttl if cache_ttl is not None else settings.scraper.proxy_cache_ttl
+        self.stats: Dict[str, ProxyStats] = {}
+        self._stats_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
 
-        self.residential_proxies: List[Proxy] = self._fetch_residential_proxies()
-        self.mobile_proxy: Proxy = self._fetch_mobile_proxy()
+        self.residential_proxies: List[Proxy] = []
+        self.mobile_proxy: Optional[Proxy] = None
+        # Wall-clock time after which selecting a proxy starts a refresh
+        self._next_refresh_at = time.time() + self.cache_ttl
+
+        cached = self._load_cache()
+        if cached is not None:
+            self.residential_proxies, self.mobile_proxy, fetched_at = cached
+            self._next_refresh_at = fetched_at + self.cache_ttl
+            if time.time() - fetched_at > self.cache_ttl:
+                self.refresh_proxies(background=background_refresh)
+            elif self.mobile_proxy is None:
+                self.refresh_proxies(background=background_refresh, residential=False)
+        else:
+            self.residential_proxies = self._fetch_residential_proxies()
+            if self.residential_proxies:
+                self._save_cache()
+                self.refresh_proxies(background=background_refresh, residential=False)
+            else:
+                self.refresh_proxies(residential=False)
 
         if not self.residential_proxies and not self.mobile_proxy:
             raise Exception("No residential or mobile proxies found!")
-        
-        if self.residential:
-            self.proxy_pool = cycle(self.residential_proxies)  
+
+    def _load_cache(self) -> Optional[Tuple[List[Proxy], Optional[Proxy], float]]:
+        """
+        Load the proxy inventory from the cache file.
+
+        Returns:
+            Optional[Tuple[List[Proxy], Optional[Proxy], float]]: Residential proxies,
+                mobile proxy and fetch timestamp, or None if there is no usable cache
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            residential = [Proxy(**proxy) for proxy in data["residential"]]
+            mobile = Proxy(**data["mobile"]) if data.get("mobile") else None
+            return residential, mobile, float(data["fetched_at"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable proxy cache {self.cache_path}: {e}")
+            return None
+
+    def _save_cache(self) -> None:
+        """Write the current proxy inventory to the cache file atomically."""
+        data = {
+            "fetched_at": time.time(),
+            "residential": [asdict(proxy) for proxy in self.residential_proxies],
+            "mobile": asdict(self.mobile_proxy) if self.mobile_proxy else None,
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent processes never share one;
+        # mkstemp creates it readable by the owner only (the inventory holds credentials)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.cache_path.parent,
+            prefix=f"{self.cache_path.name}.",
+            suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def _fetch_residential_proxies(self) -> List[Proxy]:
         """
@@ -94,7 +227,7 @@ class ProxyManager:
             for proxy in residential
         ]
     
-    def _fetch_mobile_proxy(self) -> Proxy:
+    def _fetch_mobile_proxy(self) -> Optional[Proxy]:
         """Fetch a mobile proxy from the API."""
         
         mobile_request_proxy = f"http://{settings.mobile_proxy.username}:{settings.mobile_proxy.password}@{settings.mobile_proxy.host}:{settings.mobile_proxy.port}"
@@ -103,7 +236,7 @@ class ProxyManager:
             "https": mobile_request_proxy,
         }
 
-        try: # TODO: figure out why the mobile proxy ip request is timing out
+        try:
             response = requests.get(
                 settings.mobile_proxy.url,
                 proxies=mobile_request_proxies,
@@ -111,18 +244,18 @@ class ProxyManager:
             )
             response.raise_for_status()
             data = response.json()["origin"]
-            print("Mobile proxy fetched: ", data)
+            logger.info(f"Mobile proxy fetched: {data}")
             return Proxy(
                 ip=data,
                 port=settings.mobile_proxy.port,
                 username=settings.mobile_proxy.username,
                 password=settings.mobile_proxy.password
             )
-        except TimeoutError:
-            print(f"Error fetching mobile proxy: {e}")
+        except requests.exceptions.Timeout as e:
+            logger.warning(f"Timed out fetching mobile proxy: {e}")
             return None
         except Exception as e:
-            print(f"Error fetching mobile proxy: {e}")
+            logger.error(f"Error fetching mobile proxy: {e}")
             return None
 
     
@@ -130,24 +263,161 @@ class ProxyManager:
         """Switch to the next proxy in the pool."""
         self.residential = not self.residential
 
+    def _candidates(self) -> List[Proxy]:
+        """Get the proxies eligible for the current mode."""
+        if self.residential and self.residential_proxies:
+            return self.residential_proxies
+        if self.mobile_proxy:
+            return [self.mobile_proxy]
+        return self.residential_proxies
+
+    def select_proxy(self) -> Proxy:
+        """
+        Pick the proxy for the next request based on health.
+
+        Returns:
+            Proxy: The selected proxy
+        """
+        self._refresh_if_stale()
+        candidates = self._candidates()
+        if not candidates:
+            raise Exception("No proxies available!")
+
+        now = time.monotonic()
+        with self._stats_lock:
+            stats = [self.stats.setdefault(p.url, ProxyStats()) for p in candidates]
+            available = [
+                (proxy, stat) for proxy, stat in zip(candidates, stats)
+                if not stat.is_cooling_down(now)
+            ]
+            if not available:
+                # Everything is cooling down; use the proxy that recovers first
+                return min(zip(candidates, stats), key=lambda item: item[1].cooldown_until)[0]
+
+            # Unmeasured proxies are assumed to be as fast as the best known one
+            known = [stat.latency for _, stat in available if stat.latency is not None]
+            default_latency = min(known) if known else 0.0
+
+            sample = random.sample(available, min(2, len(available)))
+            return min(sample, key=lambda item: item[1].score(default_latency))[0]
+
+    def _refresh_if_stale(self) -> None:
+        """Start a background refresh once the inventory is older than `cache_ttl`."""
+        now = time.time()
+        with self._stats_lock:
+            # A refresh still running (e.g. the mobile check) is retried on a later selection
+            if now < self._next_refresh_at or self._refresh_lock.locked():
+                return
+            # Wait a full TTL before trying again, even if this refresh fails
+            self._next_refresh_at = now + self.cache_ttl
+        self.refresh_proxies(background=True)
+
     def get_next_proxy(self) -> Dict[str, str]:
         """
-        Get the next proxy in rotation.
+        Get the proxy to use for the next request.
         
         Returns:
             Dict[str, str]: Proxy configuration for requests library
         """
-        if self.residential:
-            proxy = next(self.proxy_pool)
-            return proxy.to_dict()
-        else:
-            proxy = next(self.proxy_pool)
-            return proxy.to_dict()
+        return self.select_proxy().to_dict()
+
+    def record_result(
+        self,
+        proxy_url: str,
+        latency: float,
+        status_code: Optional[int] = None
+    ) -> None:
+        """
+        Record the outcome of a request made through a proxy.
+
+        Args:
+            proxy_url: URL of the proxy used (as in `Proxy.url`)
+            latency: Request duration in seconds
+            status_code: HTTP status of the response, None if the request failed
+        """
+        failed = (
+            status_code is None
+            or status_code in BLOCKED_STATUS_CODES
+            or status_code >= 500
+        )
+
+        with self._stats_lock:
+            stats = self.stats.setdefault(proxy_url, ProxyStats())
+            stats.requests += 1
+            stats.latency = latency if stats.latency is None else (
+                HEALTH_EWMA_ALPHA * latency + (1 - HEALTH_EWMA_ALPHA) * stats.latency
+            )
+            stats.error_rate = (
+                HEALTH_EWMA_ALPHA * float(failed) + (1 - HEALTH_EWMA_ALPHA) * stats.error_rate
+            )
+
+            if status_code in BLOCKED_STATUS_CODES:
+                stats.blocked += 1
+
+            if failed:
+                stats.errors += 1
+                stats.consecutive_failures += 1
+                cooldown = min(
+                    settings.scraper.proxy_cooldown_base * 2 ** (stats.consecutive_failures - 1),
+                    settings.scraper.proxy_cooldown_max
+                )
+                stats.cooldown_until = time.monotonic() + cooldown
+            else:
+                stats.consecutive_failures = 0
+                stats.cooldown_until = 0.0
+
+    def refresh_proxies(
+        self,
+        background: bool = False,
+        residential: bool = True,
+        mobile: bool = True
+    ) -> Optional[threading.Thread]:
+        """
+        Refresh the proxy inventory from the APIs and update the cache.
+
+        Proxies that fail to refresh keep their previous value. Only one
+        refresh runs at a time; overlapping calls return without doing work.
+
+        Args:
+            background: Run the refresh in a daemon thread
+            residential: Refresh the residential proxy list
+            mobile: Refresh the mobile proxy
+
+        Returns:
+            Optional[threading.Thread]: The refresh thread when running in background
+        """
+        if background:
+            thread = threading.Thread(
+                target=self.refresh_proxies,
+                kwargs={"residential": residential, "mobile": mobile},
+                name="proxy-refresh",
+                daemon=True
+            )
+            thread.start()
+            return thread
+
+        if not self._refresh_lock.acquire(blocking=False):
+            return None
+        if residential:
+            self._next_refresh_at = time.time() + self.cache_ttl
+        try:
+            if residential:
+                try:
+                    proxies = self._fetch_residential_proxies()
+                    if proxies:
+                        self.residential_proxies = proxies
+                except Exception as e:
+                    logger.error(f"Error refreshing residential proxies: {e}")
+            if mobile:
+                proxy = self._fetch_mobile_proxy()
+                if proxy:
+                    self.mobile_proxy = proxy
 
-    def refresh_proxies(self) -> None:
-        """Refresh the proxy pool with new proxies from the API."""
-        self.proxies = self._fetch_residential_proxies()
-        self.proxy_pool = cycle(self.proxies)
+            if self.residential_proxies or self.mobile_proxy:
+                self._save_cache()
+        finally:
+            self._refresh_lock.release()
+        return None
 
 # Example usage:
 if __name__ == "__main__":
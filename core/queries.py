@@ -1,103 +1,8 @@
 """GraphQL queries for Indeed API"""
 
-INDEED_JOB_SEARCH = """
-    query GetJobData {{
-        jobSearch(
-        {what}
-        {location}
-        limit: 100
-        {cursor}
-        sort: RELEVANCE
-        {filters}
-        ) {{
-        pageInfo {{
-            nextCursor
-        }}
-        results {{
-            trackingKey
-            job {{
-            source {{
-                name
-            }}
-            key
-            title
-            datePublished
-            dateOnIndeed
-            description {{
-                html
-            }}
-            location {{
-                countryName
-                countryCode
-                admin1Code
-                city
-                postalCode
-                streetAddress
-                formatted {{
-                short
-                long
-                }}
-            }}
-            compensation {{
-                estimated {{
-                currencyCode
-                baseSalary {{
-                    unitOfWork
-                    range {{
-                    ... on Range {{
-                        min
-                        max
-                    }}
-                    }}
-                }}
-                }}
-                baseSalary {{
-                unitOfWork
-                range {{
-                    ... on Range {{
-                    min
-                    max
-                    }}
-                }}
-                }}
-                currencyCode
-            }}
-            attributes {{
-                key
-                label
-            }}
-            employer {{
-                relativeCompanyPageUrl
-                name
-                dossier {{
-                    employerDetails {{
-                    addresses
-                    industry
-                    employeesLocalizedLabel
-                    revenueLocalizedLabel
-                    briefDescription
-                    ceoName
-                    ceoPhotoUrl
-                    }}
-                    images {{
-                        headerImageUrl
-                        squareLogoUrl
-                    }}
-                    links {{
-                    corporateWebsite
-                }}
-                }}
-            }}
-            recruit {{
-                viewJobUrl
-                detailedSalary
-                workSchedule
-            }}
-            }}
-        }}
-        }}
-    }}
-    """
+import json
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 # API Headers
 INDEED_API_HEADERS = {
@@ -113,4 +18,285 @@ INDEED_API_HEADERS = {
 
 # Common attribute keys for job types and remote status
 INDEED_JOB_TYPE_KEYS = ["employment_type", "job_type"]
-INDEED_REMOTE_KEYS = ["remote", "work_from_home"] 
\ No newline at end of file
+INDEED_REMOTE_KEYS = ["remote", "work_from_home"]
+
+# Attribute codes used by the jobSearch `filters` argument
+INDEED_JOB_TYPE_FILTER_CODES = {
+    "fulltime": "CF3CP",
+    "parttime": "75GKK",
+    "contract": "NJXCK",
+    "internship": "VDTG7",
+}
+INDEED_REMOTE_FILTER_CODE = "DSQF7"
+INDEED_SEARCH_RADIUS = 50
+
+
+def _format_filters(filters: Optional[Dict[str, Any]]) -> str:
+    """
+    Render a SearchParams.filters dict into the jobSearch `filters` argument.
+
+    Supported keys are `is_remote`, `job_type` (see INDEED_JOB_TYPE_FILTER_CODES)
+    and `hours_old`. Unknown keys are ignored.
+    """
+    if not filters:
+        return ""
+
+    clauses = []
+    attribute_keys = []
+    if filters.get("is_remote"):
+        attribute_keys.append(INDEED_REMOTE_FILTER_CODE)
+    job_type = filters.get("job_type")
+    if job_type:
+        code = INDEED_JOB_TYPE_FILTER_CODES.get(job_type.lower().replace("-", ""))
+        if code:
+            attribute_keys.append(code)
+    if attribute_keys:
+        clauses.append(
+            '{ keyword: { field: "attributes", keys: %s } }' % json.dumps(attribute_keys)
+        )
+    if filters.get("hours_old"):
+        clauses.append(
+            '{ date: { field: "dateOnIndeed", start: "%dh" } }' % int(filters["hours_old"])
+        )
+
+    if not clauses:
+        return ""
+    return "filters: { composite: { filters: [%s] } }" % ", ".join(clauses)
+
+
+def _format_search_arguments(
+    what: str,
+    location: str,
+    cursor: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, str]:
+    """Render the per-page jobSearch arguments."""
+    return {
+        "what": f"what: {json.dumps(what)}" if what else "",
+        "location": (
+            f"location: {{where: {json.dumps(location)}, radius: {INDEED_SEARCH_RADIUS}, radiusUnit: MILES}}"
+            if location else ""
+        ),
+        "cursor": f"cursor: {json.dumps(cursor)}" if cursor else "",
+        "filters": _format_filters(filters),
+    }
+
+
+# Selection paths (relative to `results.job`) needed for each Job field
+_SALARY_RANGE = ("compensation", "estimated", "baseSalary", "range", "... on Range")
+JOB_FIELD_SELECTIONS: Dict[str, List[Tuple[str, ...]]] = {
+    "key": [("key",)],
+    "title": [("title",)],
+    "company": [
+        ("employer", "name"),
+        ("employer", "dossier", "links", "corporateWebsite"),
+        ("employer", "dossier", "employerDetails", "addresses"),
+    ],
+    "location": [("location", "formatted", "short")],
+    "is_remote": [("attributes", "key"), ("attributes", "label")],
+    "job_type": [("attributes", "key"), ("attributes", "label")],
+    "compensation": [_SALARY_RANGE + ("min",), _SALARY_RANGE + ("max",)],
+    "salary_min": [_SALARY_RANGE + ("min",)],
+    "salary_max": [_SALARY_RANGE + ("max",)],
+    "date_posted": [("datePublished",)],
+    "description": [("description", "html")],
+    "application_url": [("recruit", "viewJobUrl")],
+    "source_url": [("recruit", "viewJobUrl")],
+}
+
+# Everything needed to build a Job
+JOB_PROJECTION = frozenset(JOB_FIELD_SELECTIONS)
+# Cheap fields fetched by the listing pass of a two-phase crawl
+LISTING_PROJECTION = frozenset({"key", "title", "date_posted", "location"})
+# Heavy fields fetched by key, in batches, for new or changed listings only
+DETAIL_PROJECTION = JOB_PROJECTION - LISTING_PROJECTION
+
+
+def build_selection_set(paths: Iterable[Tuple[str, ...]], indent: int = 0) -> str:
+    """
+    Render selection paths as a GraphQL selection set.
+
+    Args:
+        paths: Field paths, e.g. ("employer", "dossier", "links", "corporateWebsite");
+            inline fragments are written as a segment like "... on Range"
+        indent: Indentation level of the outermost fields
+
+    Returns:
+        str: The nested selection set (without the outer braces)
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for segment in path:
+            node = node.setdefault(segment, {})
+
+    def _render(node: Dict[str, Any], depth: int) -> List[str]:
+        lines = []
+        pad = "  " * depth
+        for name, children in node.items():
+            if children:
+                lines.append(f"{pad}{name} {{")
+                lines.extend(_render(children, depth + 1))
+                lines.append(f"{pad}}}")
+            else:
+                lines.append(f"{pad}{name}")
+        return lines
+
+    return "\n".join(_render(tree, indent))
+
+
+def _projection_selection(projection: FrozenSet[str]) -> str:
+    """Render the `job { ... }` selection set for a projection (the key is always included)."""
+    paths: List[Tuple[str, ...]] = [("key",)]
+    for name in sorted(projection):
+        paths.extend(JOB_FIELD_SELECTIONS.get(name, [tuple(name.split("."))]))
+    return build_selection_set(paths, indent=3)
+
+
+def _json_escape(text: str) -> bytes:
+    """Escape text for inclusion inside a JSON string literal."""
+    return json.dumps(text, ensure_ascii=False)[1:-1].encode("utf-8")
+
+
+class CompiledJobSearch:
+    """
+    A jobSearch query for one projection, pre-serialized as request bytes.
+
+    The JSON body is split around the per-page arguments; the fixed parts
+    are encoded once, so each request only escapes its arguments and joins
+    three byte strings.
+    """
+
+    def __init__(self, projection: FrozenSet[str]) -> None:
+        """
+        Compile the query for a projection.
+
+        Args:
+            projection: Job field names (see JOB_FIELD_SELECTIONS) and/or dotted
+                GraphQL paths relative to `results.job`, e.g. "employer.dossier.employerDetails.industry"
+        """
+        self.projection = projection
+        self.selection = _projection_selection(projection)
+
+        head = "query GetJobData { jobSearch("
+        tail = (
+            " limit: 100 sort: RELEVANCE) {\n"
+            "  pageInfo {\n    nextCursor\n  }\n"
+            "  results {\n    job {\n"
+            f"{self.selection}\n"
+            "    }\n  }\n} }"
+        )
+        self._prefix = b'{"query":"' + _json_escape(head)
+        self._suffix = _json_escape(tail) + b'"}'
+
+    def query(
+        self,
+        what: str,
+        location: str,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Get the GraphQL query text for a page (mainly for debugging)."""
+        return json.loads(self.body(what, location, cursor, filters))["query"]
+
+    def body(
+        self,
+        what: str,
+        location: str,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Get the JSON request body for a page.
+
+        Args:
+            what: Job title/keywords
+            location: Location to search in
+            cursor: Cursor of the page to fetch (None for the first page)
+            filters: Optional search filters
+
+        Returns:
+            bytes: The encoded request body
+        """
+        arguments = " ".join(
+            argument
+            for argument in _format_search_arguments(what, location, cursor, filters).values()
+            if argument
+        )
+        return b"".join((self._prefix, _json_escape(arguments), self._suffix))
+
+
+class CompiledJobData:
+    """
+    A batched jobData (lookup by job key) query for one projection,
+    pre-serialized like CompiledJobSearch.
+    """
+
+    def __init__(self, projection: FrozenSet[str]) -> None:
+        """
+        Compile the query for a projection.
+
+        Args:
+            projection: Job field names and/or dotted GraphQL paths, as for CompiledJobSearch
+        """
+        self.projection = projection
+        self.selection = _projection_selection(projection)
+
+        head = "query GetJobData { jobData(jobKeys: "
+        tail = (
+            ") {\n"
+            "  results {\n    job {\n"
+            f"{self.selection}\n"
+            "    }\n  }\n} }"
+        )
+        self._prefix = b'{"query":"' + _json_escape(head)
+        self._suffix = _json_escape(tail) + b'"}'
+
+    def body(self, keys: Iterable[str]) -> bytes:
+        """
+        Get the JSON request body for a batch of job keys.
+
+        Args:
+            keys: Job keys to fetch
+
+        Returns:
+            bytes: The encoded request body
+        """
+        return b"".join((self._prefix, _json_escape(json.dumps(list(keys))), self._suffix))
+
+
+@lru_cache(maxsize=64)
+def _compile(projection: FrozenSet[str]) -> CompiledJobSearch:
+    return CompiledJobSearch(projection)
+
+
+@lru_cache(maxsize=16)
+def _compile_data(projection: FrozenSet[str]) -> CompiledJobData:
+    return CompiledJobData(projection)
+
+
+def compile_job_data(projection: Optional[Iterable[str]] = None) -> CompiledJobData:
+    """
+    Get the compiled batched detail query for a projection.
+
+    Args:
+        projection: Fields to request (None requests DETAIL_PROJECTION, the
+            fields the listing pass does not fetch)
+
+    Returns:
+        CompiledJobData: The cached compiled query
+    """
+    return _compile_data(frozenset(projection) if projection is not None else DETAIL_PROJECTION)
+
+
+def compile_job_search(projection: Optional[Iterable[str]] = None) -> CompiledJobSearch:
+    """
+    Get the compiled query for a projection, compiling each shape only once.
+
+    Args:
+        projection: Fields to request (None requests JOB_PROJECTION, everything a Job needs)
+
+    Returns:
+        CompiledJobSearch: The cached compiled query
+    """
+    return _compile(frozenset(projection) if projection is not None else JOB_PROJECTION)
@@ -0,0 +1,202 @@
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import threading
+import time
+
+from config.settings import settings
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from threads and asyncio.
+
+    Acquiring reserves tokens immediately (the balance may go negative) and
+    returns how long the caller has to wait for them, so waiting happens
+    outside the lock and callers are served in the order they arrived.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update. Must hold the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_for(self, tokens: float) -> float:
+        """Get the seconds until `tokens` are available. Must hold the lock."""
+        self._refill(time.monotonic())
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def take(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens however long the wait.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Seconds to wait before using the tokens
+        """
+        with self._lock:
+            wait = self._wait_for(tokens)
+            self._tokens -= tokens
+            return wait
+
+    def reserve(self, tokens: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens.
+
+        Args:
+            tokens: Number of tokens to take
+            max_wait: Give up instead of reserving if the wait would be longer
+
+        Returns:
+            Optional[float]: Seconds to wait before using the tokens, or None
+                if the wait would exceed `max_wait` (nothing is reserved)
+        """
+        with self._lock:
+            wait = self._wait_for(tokens)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available; False if `timeout` would be exceeded."""
+        wait = self.reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Await until tokens are available; False if `timeout` would be exceeded."""
+        wait = self.reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+class RateLimiter:
+    """
+    Per-host and per-proxy token buckets.
+
+    A request needs a token from its target host's bucket and from its
+    proxy's bucket, so the host budget is shared across the proxy pool while
+    every proxy keeps its own pace. Buckets are created on first use.
+    """
+
+    def __init__(
+        self,
+        host_rate: float = 0.0,
+        proxy_rate: float = 0.0,
+        burst: float = 1.0
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            host_rate: Requests per second per host (0 disables host limiting)
+            proxy_rate: Requests per second per proxy (0 disables proxy limiting)
+            burst: Bucket capacity
+        """
+        self.host_rate = host_rate
+        self.proxy_rate = proxy_rate
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "RateLimiter":
+        """Build a rate limiter from the scraper settings."""
+        delay = settings.scraper.delay_between_requests
+        return cls(
+            host_rate=settings.scraper.host_requests_per_second,
+            proxy_rate=1.0 / delay if delay > 0 else 0.0,
+            burst=settings.scraper.rate_limit_burst
+        )
+
+    def _bucket(self, kind: str, name: str, rate: float) -> TokenBucket:
+        """Get or create the bucket for a host or proxy."""
+        key = (kind, name)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, self.burst)
+            return bucket
+
+    def _reserve(self, url: str, proxy_key: Optional[str]) -> float:
+        """Reserve a token from every applicable bucket; return the wait."""
+        wait = 0.0
+        if self.host_rate > 0:
+            host = urlsplit(url).netloc
+            wait = max(wait, self._bucket("host", host, self.host_rate).take())
+        if self.proxy_rate > 0:
+            bucket = self._bucket("proxy", proxy_key or "direct", self.proxy_rate)
+            wait = max(wait, bucket.take())
+        return wait
+
+    def acquire(self, url: str, proxy_key: Optional[str] = None) -> float:
+        """
+        Block until a request to `url` through `proxy_key` may be sent.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self._reserve(url, proxy_key)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str, proxy_key: Optional[str] = None) -> float:
+        """
+        Await until a request to `url` through `proxy_key` may be sent.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self._reserve(url, proxy_key)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all scrapers."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter.from_settings()
+        return _rate_limiter
+
+def reset_rate_limiter() -> None:
+    """Drop the shared rate limiter so it is rebuilt from current settings."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
+
+# Example usage:
+if __name__ == "__main__":
+    limiter = RateLimiter(host_rate=2.0, proxy_rate=1.0)
+    start = time.monotonic()
+    for i in range(4):
+        limiter.acquire("https://apis.indeed.com/graphql", f"proxy-{i % 2}")
+        print(f"request {i} at {time.monotonic() - start:.2f}s")
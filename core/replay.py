@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import Any, Iterator, Optional
+import gzip
+import json
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.settings import settings
+from core.response_cache import cache_key
+
+REPLAY_MODES = ("off", "record", "replay")
+# Bodies are stored decoded, so transfer-level headers would no longer be true
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no fixture matches a request."""
+
+class RequestRecorder:
+    """
+    Records `_make_request` responses to fixture files and replays them.
+
+    Every fixture is a gzipped JSON document named after the request's
+    `cache_key`, holding the request (method, URL, body) and the response
+    (status code, headers, body). In replay mode requests are answered from
+    the fixtures only; a request without a fixture raises ReplayMissError
+    instead of falling through to the network.
+    """
+
+    def __init__(self, directory: str = "benchmarks/fixtures", mode: str = "replay") -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            directory: Directory holding the fixture files
+            mode: "record" or "replay"
+        """
+        if mode not in REPLAY_MODES[1:]:
+            raise ValueError(f"Unknown replay mode {mode!r}, expected 'record' or 'replay'")
+        self.directory = Path(directory)
+        self.mode = mode
+        if mode == "record":
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls) -> Optional["RequestRecorder"]:
+        """Build a recorder from the scraper settings, None when the mode is "off"."""
+        if settings.scraper.replay_mode == "off":
+            return None
+        return cls(settings.scraper.replay_fixtures_dir, settings.scraper.replay_mode)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def path_for(self, key: str) -> Path:
+        """Get the fixture file of a request key."""
+        return self.directory / f"{key}.json.gz"
+
+    def save(self, method: str, url: str, response: requests.Response, **kwargs: Any) -> Path:
+        """
+        Write a response to its fixture file.
+
+        Args:
+            method: HTTP method of the request
+            url: Request URL
+            response: Response to record
+            **kwargs: `params`, `data` and/or `json` of the request
+
+        Returns:
+            Path: The fixture file
+        """
+        data = kwargs.get("data")
+        fixture = {
+            "recorded_at": time.time(),
+            "request": {
+                "method": method.upper(),
+                "url": url,
+                "params": kwargs.get("params"),
+                "json": kwargs.get("json"),
+                "data": data.decode("utf-8", "replace") if isinstance(data, bytes) else data,
+            },
+            "response": {
+                "url": response.url or url,
+                "status_code": response.status_code,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                "body": response.content.decode(response.encoding or "utf-8", "replace"),
+            },
+        }
+        path = self.path_for(cache_key(method, url, **kwargs))
+        temp_path = path.with_suffix(".tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(fixture, f)
+        temp_path.replace(path)
+        return path
+
+    def load(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Get the recorded response of a request.
+
+        Raises:
+            ReplayMissError: If the request was never recorded
+        """
+        path = self.path_for(cache_key(method, url, **kwargs))
+        if not path.exists():
+            raise ReplayMissError(f"No recorded response for {method.upper()} {url} in {self.directory}")
+        return load_fixture(path)
+
+    def fixtures(self) -> Iterator[Path]:
+        """Iterate over the recorded fixture files in a stable order."""
+        return iter(sorted(self.directory.glob("*.json.gz")))
+
+def load_fixture(path: Path) -> requests.Response:
+    """Rebuild the response stored in a fixture file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        recorded = json.load(f)["response"]
+    response = requests.Response()
+    response.url = recorded["url"]
+    response.status_code = recorded["status_code"]
+    response.headers = CaseInsensitiveDict(recorded["headers"])
+    response.encoding = "utf-8"
+    response._content = recorded["body"].encode("utf-8")
+    response.from_fixture = True
+    return response
+
+# Example usage:
+if __name__ == "__main__":
+    recorder = RequestRecorder("benchmarks/fixtures", mode="replay")
+    for path in recorder.fixtures():
+        response = load_fixture(path)
+        print(path.name, response.status_code, len(response.content), "bytes")
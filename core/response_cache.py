@@ -0,0 +1,248 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.settings import settings
+
+# Response headers worth keeping with a cached body; the body is stored
+# decoded, so Content-Encoding is dropped (as replay fixtures do)
+_KEPT_HEADERS = ("Content-Type", "Date", "ETag", "Last-Modified")
+_WHITESPACE = re.compile(r"\s+")
+
+def _normalize_query(query: str) -> str:
+    """Collapse insignificant whitespace so equivalent GraphQL documents hash alike."""
+    return _WHITESPACE.sub(" ", query).strip()
+
+def cache_key(method: str, url: str, **kwargs: Any) -> str:
+    """
+    Get the cache key of a request.
+
+    GraphQL bodies are keyed on the hash of the whitespace-normalized query
+    plus its variables (search arguments and cursor are inlined in the query
+    text, so they are part of that hash). Other bodies and query strings are
+    hashed as sent. Headers, proxies and timeouts are not part of the key.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        **kwargs: `params`, `data` and/or `json` as passed to requests
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    payload = kwargs.get("json")
+    data = kwargs.get("data")
+    if payload is None and data:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            payload = None
+
+    parts = [method.upper(), url]
+    if kwargs.get("params"):
+        parts.append(urlencode(sorted(dict(kwargs["params"]).items())))
+    if isinstance(payload, dict) and "query" in payload:
+        query = _normalize_query(payload["query"])
+        parts.append(hashlib.sha256(query.encode("utf-8")).hexdigest())
+        parts.append(json.dumps(payload.get("variables") or {}, sort_keys=True, separators=(",", ":")))
+    elif payload is not None:
+        parts.append(json.dumps(payload, sort_keys=True, separators=(",", ":")))
+    elif data:
+        parts.append(data.decode("utf-8", "replace") if isinstance(data, bytes) else str(data))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    On-disk cache of successful HTTP responses.
+
+    Bodies are stored zlib-compressed in a SQLite table together with the
+    status code and a few headers. Entries older than `ttl` are misses (and
+    are purged on the next write); once the compressed bodies exceed
+    `max_bytes`, the least recently used entries are evicted. The database
+    runs in WAL mode, so worker processes can share one cache file.
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/responses.db",
+        ttl: float = 900.0,
+        max_bytes: int = 256 * 2 ** 20,
+        compression_level: int = 6
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a response stays valid
+            max_bytes: Budget for the compressed bodies
+            compression_level: zlib compression level (1-9)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created ON responses (created)"
+            )
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        """Build a cache from the scraper settings."""
+        return cls(
+            path=settings.scraper.response_cache_path,
+            ttl=settings.scraper.response_cache_ttl,
+            max_bytes=settings.scraper.response_cache_max_bytes
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total size of the compressed bodies in bytes."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[requests.Response]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Key from `cache_key`
+
+        Returns:
+            Optional[requests.Response]: The response (with `from_cache` set),
+                or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, body FROM responses WHERE key = ? AND created >= ?",
+                (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+
+        url, status_code, headers, body = row
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = zlib.decompress(body)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """
+        Store a response, then enforce the TTL and size budget.
+
+        Args:
+            key: Key from `cache_key`
+            response: Response to store (its body is read)
+        """
+        body = zlib.compress(response.content, self.compression_level)
+        headers = {
+            name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers
+        }
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (key, url, status_code, headers, body, size, created, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, response.url or "", response.status_code, json.dumps(headers),
+                     body, len(body), now, now)
+                )
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the budget."""
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        excess = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+# Example usage:
+if __name__ == "__main__":
+    with ResponseCache(".cache/responses_example.db", ttl=60) as cache:
+        key = cache_key("GET", "https://httpbin.org/json")
+        response = cache.get(key)
+        if response is None:
+            response = requests.get("https://httpbin.org/json", timeout=10)
+            cache.put(key, response)
+        print("From cache:", getattr(response, "from_cache", False), len(response.content), "bytes")
@@ -0,0 +1,191 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+import sqlite3
+import threading
+import time
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+class SeenJobsIndex:
+    """
+    Persistent index of job keys already collected in previous runs.
+
+    Keys live in a SQLite `WITHOUT ROWID` table, so a lookup is a single
+    primary-key probe even with millions of keys, and whole pages are
+    checked with one batched query. Every key records when it was first and
+    last seen, which drives expiry of postings that stopped showing up.
+    """
+
+    def __init__(self, path: str = "data/seen_jobs.db") -> None:
+        """
+        Open (or create) the index.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                key TEXT PRIMARY KEY,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS seen_jobs_last_seen ON seen_jobs (last_seen)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_jobs)")}
+        if "fingerprint" not in columns:
+            self._conn.execute("ALTER TABLE seen_jobs ADD COLUMN fingerprint TEXT")
+        self._conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_jobs WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def known(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Get the subset of keys that are already in the index.
+
+        Args:
+            keys: Job keys to check
+
+        Returns:
+            Set[str]: Keys seen in a previous run
+        """
+        keys = list(dict.fromkeys(key for key in keys if key))
+        found: Set[str] = set()
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT key FROM seen_jobs WHERE key IN ({placeholders})", batch
+                    )
+                )
+        return found
+
+    def filter_new(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Get the subset of keys that are not in the index yet.
+
+        Args:
+            keys: Job keys to check
+
+        Returns:
+            Set[str]: Keys never seen before
+        """
+        keys = {key for key in keys if key}
+        return keys - self.known(keys)
+
+    def changed(self, fingerprints: Dict[str, str]) -> Set[str]:
+        """
+        Get the keys that are new or whose listing fingerprint changed.
+
+        Keys recorded without a fingerprint count as unchanged.
+
+        Args:
+            fingerprints: Fingerprint of each job's listing data by key
+
+        Returns:
+            Set[str]: Keys whose details need to be fetched
+        """
+        keys = [key for key in fingerprints if key]
+        stored: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                stored.update(
+                    self._conn.execute(
+                        f"SELECT key, fingerprint FROM seen_jobs WHERE key IN ({placeholders})", batch
+                    ).fetchall()
+                )
+        return {
+            key for key in keys
+            if key not in stored or (stored[key] is not None and stored[key] != fingerprints[key])
+        }
+
+    def mark_seen(
+        self,
+        keys: Iterable[str],
+        seen_at: Optional[float] = None,
+        fingerprints: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
+        """
+        Add keys to the index, refreshing `last_seen` for known ones.
+
+        Args:
+            keys: Job keys to record
+            seen_at: Unix timestamp to record (defaults to now)
+            fingerprints: Optional listing fingerprints to store by key
+        """
+        seen_at = seen_at if seen_at is not None else time.time()
+        fingerprints = fingerprints or {}
+        rows = [(key, seen_at, seen_at, fingerprints.get(key)) for key in keys if key]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    """
+                    INSERT INTO seen_jobs (key, first_seen, last_seen, fingerprint) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        last_seen = excluded.last_seen,
+                        fingerprint = COALESCE(excluded.fingerprint, fingerprint)
+                    """,
+                    rows
+                )
+
+    def expire(self, older_than: timedelta) -> int:
+        """
+        Forget keys whose last sighting is older than `older_than`.
+
+        Args:
+            older_than: Maximum age of the last sighting
+
+        Returns:
+            int: Number of keys removed
+        """
+        cutoff = (datetime.now() - older_than).timestamp()
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM seen_jobs WHERE last_seen < ?", (cutoff,)
+                )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+# Example usage:
+if __name__ == "__main__":
+    with SeenJobsIndex("data/seen_jobs_example.db") as index:
+        index.mark_seen(["0f713639bfb7177e", "a1b2c3d4e5f60718"])
+        print("New keys:", index.filter_new(["0f713639bfb7177e", "ffffffffffffffff"]))
+        print("Expired:", index.expire(timedelta(days=30)))
@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+import threading
+import time
+import requests
+
+from core.metrics import TimedHTTPAdapter
+
+@dataclass
+class PooledSession:
+    """A pooled session with its bookkeeping timestamps."""
+    session: requests.Session
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+class SessionPool:
+    """
+    Pool of keep-alive `requests.Session` objects keyed by proxy.
+
+    Reusing one session per proxy keeps the TCP connection, TLS session and
+    cookies alive between requests. Sessions unused for `idle_timeout`
+    seconds are closed, sessions older than `max_age` seconds are recycled,
+    and the least recently used session is evicted once `max_size` is hit.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 32,
+        idle_timeout: float = 90.0,
+        max_age: float = 600.0
+    ) -> None:
+        """
+        Initialize the session pool.
+
+        Args:
+            max_size: Maximum number of pooled sessions
+            idle_timeout: Seconds an unused session is kept open
+            max_age: Seconds after which a session is replaced by a fresh one
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self._sessions: "OrderedDict[Optional[str], PooledSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(proxies: Optional[Dict[str, str]]) -> Optional[str]:
+        """Get the pool key for a requests-style proxies dict (None when direct)."""
+        if not proxies:
+            return None
+        return proxies.get("https") or proxies.get("http")
+
+    def _evict_expired(self, now: float) -> None:
+        """Close idle and over-age sessions. Must be called with the lock held."""
+        for key, pooled in list(self._sessions.items()):
+            if (now - pooled.last_used > self.idle_timeout
+                    or now - pooled.created_at > self.max_age):
+                del self._sessions[key]
+                pooled.session.close()
+
+    def get(self, proxies: Optional[Dict[str, str]] = None) -> requests.Session:
+        """
+        Get the session bound to the given proxy, creating it if needed.
+
+        Args:
+            proxies: Proxy configuration for requests library
+
+        Returns:
+            requests.Session: A session routing through the proxy
+        """
+        key = self.key_for(proxies)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_expired(now)
+
+            pooled = self._sessions.get(key)
+            if pooled is None:
+                session = requests.Session()
+                # Connections report their setup time to the request metrics
+                adapter = TimedHTTPAdapter()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                if proxies:
+                    session.proxies.update(proxies)
+                pooled = PooledSession(session=session, created_at=now)
+                self._sessions[key] = pooled
+
+                while len(self._sessions) > self.max_size:
+                    _, evicted = self._sessions.popitem(last=False)
+                    evicted.session.close()
+
+            pooled.last_used = now
+            self._sessions.move_to_end(key)
+            return pooled.session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        proxies: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> requests.Response:
+        """Send a request through the pooled session for `proxies`."""
+        session = self.get(proxies)
+        return session.request(method=method, url=url, proxies=proxies, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def close(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            for pooled in self._sessions.values():
+                pooled.session.close()
+            self._sessions.clear()
+
+# Example usage:
+if __name__ == "__main__":
+    pool = SessionPool(max_size=2)
+    for _ in range(3):
+        response = pool.request("GET", "https://httpbin.org/get", timeout=10)
+        print(response.status_code, len(pool))
+    pool.close()
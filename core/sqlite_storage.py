@@ -0,0 +1,207 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+import sqlite3
+import threading
+
+from core.data_model import Job
+from core.storage import JOB_FIELDNAMES, to_record
+
+Record = Union[Job, Dict[str, Any]]
+
+# Columns with a secondary index, used by the query API
+INDEXED_COLUMNS = ("date_posted", "company_name", "location", "is_remote")
+
+class SQLiteStorage:
+    """
+    SQLite job store with upsert by job key and indexed lookups.
+
+    Unlike the flat-file formats, a single database accumulates every run:
+    re-scraped postings update their existing row instead of adding a copy,
+    and queries over history hit indexes instead of re-reading exports.
+    """
+
+    def __init__(self, path: str = "data/jobs.db", batch_size: int = 1000) -> None:
+        """
+        Open (or create) the database.
+
+        Args:
+            path: SQLite database file
+            batch_size: Number of rows written per transaction
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.columns = ["key"] + [name for name in JOB_FIELDNAMES if name != "key"]
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the jobs table and its indexes if they do not exist, adding columns new to JOB_FIELDNAMES."""
+        column_defs = ", ".join(
+            "key TEXT PRIMARY KEY" if name == "key" else f"{name} {self._column_type(name)}"
+            for name in self.columns
+        )
+        with self._conn:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({column_defs})")
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for name in self.columns:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {self._column_type(name)}")
+            for column in INDEXED_COLUMNS:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS jobs_{column} ON jobs ({column})"
+                )
+
+    @staticmethod
+    def _column_type(name: str) -> str:
+        """Get the SQLite column type for a job field."""
+        if name == "is_remote":
+            return "INTEGER"
+        if name in ("salary_min", "salary_max"):
+            return "REAL"
+        return "TEXT"
+
+    @staticmethod
+    def _record_key(record: Dict[str, Any]) -> Optional[str]:
+        """Get the upsert key of a record, falling back to its source URL."""
+        return record.get("key") or record.get("source_url") or record.get("application_url")
+
+    def upsert(self, records: Iterable[Record]) -> int:
+        """
+        Insert jobs, replacing existing rows with the same key.
+
+        Rows are written in transactions of `batch_size`. Records without a
+        key or URL cannot be deduplicated and are skipped.
+
+        Args:
+            records: Jobs or job dictionaries
+
+        Returns:
+            int: Number of rows written
+        """
+        placeholders = ", ".join("?" * len(self.columns))
+        updates = ", ".join(f"{name} = excluded.{name}" for name in self.columns[1:])
+        statement = (
+            f"INSERT INTO jobs ({', '.join(self.columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(key) DO UPDATE SET {updates}"
+        )
+
+        written = 0
+        batch: List[tuple] = []
+        for record in records:
+            record = to_record(record)
+            key = self._record_key(record)
+            if not key:
+                continue
+            batch.append((key,) + tuple(record.get(name) for name in self.columns[1:]))
+            if len(batch) >= self.batch_size:
+                written += self._execute_batch(statement, batch)
+                batch = []
+        if batch:
+            written += self._execute_batch(statement, batch)
+        return written
+
+    def _execute_batch(self, statement: str, batch: List[tuple]) -> int:
+        """Write a batch of rows in a single transaction."""
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(statement, batch)
+        return len(batch)
+
+    def query(
+        self,
+        title: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        posted_since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find stored jobs, newest first.
+
+        Example:
+            # All remote Python jobs posted this week
+            storage.query(title="python", is_remote=True,
+                          posted_since=datetime.now() - timedelta(days=7))
+
+        Args:
+            title: Case-insensitive substring of the job title
+            company: Exact company name
+            location: Exact job location
+            is_remote: Only remote (True) or on-site (False) jobs
+            posted_since: Only jobs posted at or after this time
+            limit: Maximum number of rows
+
+        Returns:
+            List[Dict[str, Any]]: Matching jobs as dictionaries
+        """
+        clauses = []
+        args: List[Any] = []
+        if title is not None:
+            clauses.append("title LIKE ?")
+            args.append(f"%{title}%")
+        if company is not None:
+            clauses.append("company_name = ?")
+            args.append(company)
+        if location is not None:
+            clauses.append("location = ?")
+            args.append(location)
+        if is_remote is not None:
+            clauses.append("is_remote = ?")
+            args.append(int(is_remote))
+        if posted_since is not None:
+            clauses.append("date_posted >= ?")
+            args.append(posted_since.isoformat())
+
+        sql = "SELECT * FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date_posted DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            if job.get("is_remote") is not None:
+                job["is_remote"] = bool(job["is_remote"])
+            jobs.append(job)
+        return jobs
+
+    def count(self) -> int:
+        """Get the number of stored jobs."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+# Example usage:
+if __name__ == "__main__":
+    from datetime import timedelta
+
+    with SQLiteStorage("data/jobs.db") as storage:
+        recent = storage.query(
+            title="python",
+            is_remote=True,
+            posted_since=datetime.now() - timedelta(days=7)
+        )
+        print(f"{len(recent)} remote Python jobs posted this week ({storage.count()} stored)")
@@ -1,10 +1,285 @@
-from typing import List, Dict, Any, Optional
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
 import csv
 import json
 from datetime import datetime
 from pathlib import Path
 import os
 
+from core.data_model import Company, Job
+from core.tracing import traced
+
+# Flat column layout of a Job; Company fields are prefixed with "company_"
+JOB_FIELDNAMES: List[str] = [
+    name
+    for field in fields(Job)
+    for name in (
+        [f"company_{company_field.name}" for company_field in fields(Company)]
+        if field.name == "company" else [field.name]
+    )
+]
+
+Record = Union[Job, Dict[str, Any]]
+
+def job_to_record(job: Job, isoformat_dates: bool = True) -> Dict[str, Any]:
+    """
+    Flatten a Job into a dictionary following JOB_FIELDNAMES.
+
+    Datetimes are converted to ISO 8601 strings unless `isoformat_dates` is False.
+    """
+    record: Dict[str, Any] = {}
+    for field in fields(Job):
+        value = getattr(job, field.name)
+        if field.name == "company":
+            for company_field in fields(Company):
+                record[f"company_{company_field.name}"] = (
+                    getattr(value, company_field.name) if value is not None else None
+                )
+        elif isoformat_dates and isinstance(value, datetime):
+            record[field.name] = value.isoformat()
+        else:
+            record[field.name] = value
+    return record
+
+def to_record(record: Record) -> Dict[str, Any]:
+    """Flatten a Job with `job_to_record`; dictionaries are returned unchanged."""
+    return job_to_record(record) if isinstance(record, Job) else record
+
+class JobWriter(ABC):
+    """
+    Incremental writer with a fixed schema.
+
+    Records are buffered and written out every `chunk_size` records, so a
+    crash only loses the current chunk and memory stays bounded by it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: Optional[List[str]] = None,
+        chunk_size: int = 1000
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            path: File to write to
+            fieldnames: Columns to write (defaults to JOB_FIELDNAMES)
+            chunk_size: Number of records buffered before each flush
+        """
+        self.path = path
+        self.fieldnames = list(fieldnames or JOB_FIELDNAMES)
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._file = self._open(path)
+
+    def _open(self, path: Path) -> Any:
+        """Open the output file."""
+        return open(path, 'w', newline='', encoding='utf-8')
+
+    def _to_record(self, record: Record) -> Dict[str, Any]:
+        """Convert a Job or dictionary into a row restricted to the schema."""
+        record = to_record(record)
+        return {name: record.get(name) for name in self.fieldnames}
+
+    @traced()
+    def write(self, records: Iterable[Record]) -> int:
+        """
+        Add a batch of records.
+
+        Args:
+            records: Jobs or job dictionaries
+
+        Returns:
+            int: Number of records added
+        """
+        added = 0
+        for record in records:
+            self._buffer.append(self._to_record(record))
+            added += 1
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+        self.count += added
+        return added
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Write buffered rows to the file."""
+
+    def flush(self) -> None:
+        """Write buffered records and flush them to disk."""
+        if self._buffer:
+            self._write_rows(self._buffer)
+            self._buffer = []
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush remaining records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+class CsvJobWriter(JobWriter):
+    """Streams records to a CSV file with a fixed header."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._writer = csv.DictWriter(
+            self._file,
+            fieldnames=self.fieldnames,
+            quoting=csv.QUOTE_NONNUMERIC
+        )
+        self._writer.writeheader()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+class JsonlJobWriter(JobWriter):
+    """Streams records to a JSON Lines file, one object per line."""
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.writelines(
+            json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows
+        )
+
+# Arrow types of the Parquet columns; columns listed in PARQUET_DICTIONARY_FIELDS
+# are dictionary-encoded, anything not listed here is stored as a string
+PARQUET_COLUMN_TYPES = {
+    "is_remote": "bool",
+    "date_posted": "timestamp",
+    "salary_min": "float64",
+    "salary_max": "float64",
+}
+PARQUET_DICTIONARY_FIELDS = {"company_name", "company_location", "location", "job_type"}
+
+def _parquet_value(value: Any, column_type: Optional[str]) -> Any:
+    """
+    Convert a record value to the Python type of its Parquet column.
+
+    Records read back from CSV hold every value as a string ("True", "1.5e5",
+    ""), so typed columns are parsed and empty strings become nulls.
+    """
+    if value is None or value == "":
+        return None
+    if column_type == "bool":
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered not in ("true", "false"):
+                raise ValueError(f"Invalid boolean value: {value!r}")
+            return lowered == "true"
+        return bool(value)
+    if column_type == "float64":
+        return float(value)
+    if column_type == "int64":
+        return int(value)
+    if column_type == "timestamp":
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+    return value if isinstance(value, str) else str(value)
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, which is only required for the Parquet format."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet support requires pyarrow. Please install it using: pip install pyarrow"
+        )
+    return pyarrow
+
+def parquet_schema(fieldnames: Optional[List[str]] = None) -> Any:
+    """
+    Build the typed Arrow schema for the given columns.
+
+    Args:
+        fieldnames: Columns to include (defaults to JOB_FIELDNAMES)
+
+    Returns:
+        pyarrow.Schema: Schema with real timestamps, numeric salaries and
+            dictionary-encoded company and location columns
+    """
+    pa = _import_pyarrow()
+    types = {
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us"),
+        "float64": pa.float64(),
+        "int64": pa.int64(),
+    }
+    columns = []
+    for name in fieldnames or JOB_FIELDNAMES:
+        if name in PARQUET_DICTIONARY_FIELDS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        else:
+            arrow_type = types.get(PARQUET_COLUMN_TYPES.get(name), pa.string())
+        columns.append(pa.field(name, arrow_type))
+    return pa.schema(columns)
+
+class ParquetJobWriter(JobWriter):
+    """Streams records to a Parquet file, one row group per chunk."""
+
+    def __init__(self, path: Path, fieldnames: Optional[List[str]] = None, chunk_size: int = 10000) -> None:
+        self._pa = _import_pyarrow()
+        self.schema = parquet_schema(fieldnames)
+        super().__init__(path, fieldnames=fieldnames, chunk_size=chunk_size)
+
+    def _open(self, path: Path) -> Any:
+        return self._pa.parquet.ParquetWriter(str(path), self.schema, compression="zstd")
+
+    def _to_record(self, record: Record) -> Dict[str, Any]:
+        if isinstance(record, Job):
+            record = job_to_record(record, isoformat_dates=False)
+        return {
+            name: _parquet_value(record.get(name), PARQUET_COLUMN_TYPES.get(name))
+            for name in self.fieldnames
+        }
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.write_table(self._pa.Table.from_pylist(rows, schema=self.schema))
+
+    def flush(self) -> None:
+        # Every flush becomes a row group; the footer is only written on close
+        if self._buffer:
+            self._write_rows(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+class SqliteJobWriter(JobWriter):
+    """Upserts records into a SQLiteStorage database, one transaction per chunk."""
+
+    def _open(self, path: Path) -> Any:
+        from core.sqlite_storage import SQLiteStorage
+        return SQLiteStorage(str(path), batch_size=self.chunk_size)
+
+    def _to_record(self, record: Record) -> Dict[str, Any]:
+        return to_record(record)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.upsert(rows)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_rows(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+# File extensions of formats whose extension differs from the format name
+_FORMAT_EXTENSIONS = {"sqlite": "db"}
+# A JSON array cannot be appended to, so "json" streams as JSON Lines
+_STREAMING_FORMATS = {"json": "jsonl"}
+
 class Storage:
     """Handles storage of job data to various formats."""
     
@@ -23,12 +298,13 @@ class Storage:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{prefix}_{timestamp}"
     
-    def save_csv(self, jobs: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    @traced()
+    def save_csv(self, jobs: List[Record], filename: Optional[str] = None) -> str:
         """
         Save jobs to a CSV file.
         
         Args:
-            jobs: List of job dictionaries
+            jobs: List of jobs or job dictionaries
             filename: Optional custom filename
             
         Returns:
@@ -39,6 +315,7 @@ class Storage:
             
         filename = filename or self._get_filename()
         filepath = self.output_dir / f"{filename}.csv"
+        jobs = [to_record(job) for job in jobs]
         
         # Get all possible fields from all jobs
         fieldnames = set()
@@ -53,12 +330,13 @@ class Storage:
             
         return str(filepath)
     
-    def save_json(self, jobs: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    @traced()
+    def save_json(self, jobs: List[Record], filename: Optional[str] = None) -> str:
         """
         Save jobs to a JSON file.
         
         Args:
-            jobs: List of job dictionaries
+            jobs: List of jobs or job dictionaries
             filename: Optional custom filename
             
         Returns:
@@ -69,19 +347,21 @@ class Storage:
             
         filename = filename or self._get_filename()
         filepath = self.output_dir / f"{filename}.json"
+        jobs = [to_record(job) for job in jobs]
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(jobs, f, indent=2, ensure_ascii=False)
             
         return str(filepath)
     
-    def save(self, jobs: List[Dict[str, Any]], format: str = "csv", filename: Optional[str] = None) -> str:
+    @traced()
+    def save(self, jobs: List[Record], format: str = "csv", filename: Optional[str] = None) -> str:
         """
         Save jobs to a file in the specified format.
         
         Args:
-            jobs: List of job dictionaries
-            format: Output format ("csv" or "json")
+            jobs: List of jobs or job dictionaries
+            format: Output format ("csv", "json", "jsonl", "parquet" or "sqlite")
             filename: Optional custom filename
             
         Returns:
@@ -91,9 +371,123 @@ class Storage:
             return self.save_csv(jobs, filename)
         elif format.lower() == "json":
             return self.save_json(jobs, filename)
+        elif format.lower() == "jsonl":
+            return self.save_jsonl(jobs, filename)
+        elif format.lower() == "parquet":
+            return self.save_parquet(jobs, filename)
+        elif format.lower() == "sqlite":
+            return self.save_sqlite(jobs, filename)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    @traced()
+    def save_jsonl(self, jobs: List[Record], filename: Optional[str] = None) -> str:
+        """
+        Save jobs to a JSON Lines file.
+        
+        Args:
+            jobs: List of jobs or job dictionaries
+            filename: Optional custom filename
+            
+        Returns:
+            str: Path to the saved file
+        """
+        if not jobs:
+            raise ValueError("No jobs to save")
+
+        with self.open_writer(format="jsonl", filename=filename) as writer:
+            writer.write(jobs)
+        return str(writer.path)
+
+    @traced()
+    def save_parquet(self, jobs: List[Record], filename: Optional[str] = None) -> str:
+        """
+        Save jobs to a Parquet file with a typed schema (requires pyarrow).
+        
+        Args:
+            jobs: List of jobs or job dictionaries
+            filename: Optional custom filename
+            
+        Returns:
+            str: Path to the saved file
+        """
+        if not jobs:
+            raise ValueError("No jobs to save")
+
+        with self.open_writer(format="parquet", filename=filename) as writer:
+            writer.write(jobs)
+        return str(writer.path)
+
+    @traced()
+    def save_sqlite(self, jobs: List[Record], filename: Optional[str] = None) -> str:
+        """
+        Upsert jobs into a SQLite database (`jobs.db` unless a filename is given).
+        
+        Args:
+            jobs: List of jobs or job dictionaries
+            filename: Optional custom filename
+            
+        Returns:
+            str: Path to the database file
+        """
+        if not jobs:
+            raise ValueError("No jobs to save")
+
+        with self.open_writer(format="sqlite", filename=filename) as writer:
+            writer.write(jobs)
+        return str(writer.path)
+
+    @contextmanager
+    def open_writer(
+        self,
+        format: str = "csv",
+        filename: Optional[str] = None,
+        fieldnames: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[JobWriter]:
+        """
+        Open an incremental writer for streaming jobs to disk.
+
+        Example:
+            with storage.open_writer(format="jsonl") as writer:
+                for result in scraper.iter_pages(params):
+                    writer.write(result.jobs)
+        
+        Args:
+            format: Output format ("csv", "jsonl", "parquet" or "sqlite"; "json"
+                is written as JSON Lines)
+            filename: Optional custom filename
+            fieldnames: Columns to write (defaults to JOB_FIELDNAMES)
+            chunk_size: Number of records buffered before each flush
+                (for Parquet, the row group size)
+            
+        Yields:
+            JobWriter: Writer accepting batches of jobs or job dictionaries
+        """
+        writer_classes = {
+            "csv": CsvJobWriter,
+            "jsonl": JsonlJobWriter,
+            "parquet": ParquetJobWriter,
+            "sqlite": SqliteJobWriter,
+        }
+        format = format.lower()
+        format = _STREAMING_FORMATS.get(format, format)
+        writer_class = writer_classes.get(format)
+        if writer_class is None:
+            raise ValueError(f"Unsupported streaming format: {format}")
+
+        # A SQLite database accumulates runs instead of getting a new file each time
+        filename = filename or ("jobs" if format == "sqlite" else self._get_filename())
+        filepath = self.output_dir / f"{filename}.{_FORMAT_EXTENSIONS.get(format, format)}"
+        writer_kwargs: Dict[str, Any] = {"fieldnames": fieldnames}
+        if chunk_size is not None:
+            writer_kwargs["chunk_size"] = chunk_size
+        writer = writer_class(filepath, **writer_kwargs)
+        try:
+            yield writer
+        finally:
+            writer.close()
+
 # Example usage:
 if __name__ == "__main__":
     # Sample job data
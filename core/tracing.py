@@ -0,0 +1,254 @@
+from collections import defaultdict, deque
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+import json
+import os
+import random
+import threading
+import time
+
+from config.settings import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class Span(NamedTuple):
+    """A finished span; times are nanoseconds relative to the tracer's start."""
+    name: str
+    start_ns: int
+    duration_ns: int
+    self_ns: int  # duration minus the time spent in child spans
+    thread_id: int
+    stack: Tuple[str, ...]  # names from the root span down to this one
+    attributes: Dict[str, Any]
+
+class _NoopSpan:
+    """Returned while tracing is off, so `with tracer.span(...)` costs almost nothing."""
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+_NOOP = _NoopSpan()
+
+class _ActiveSpan:
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._tracer._start(self._name, self._attributes)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer._finish()
+
+    def set(self, key: str, value: Any) -> None:
+        """Attach an attribute (shown as an arg in trace viewers)."""
+        self._attributes[key] = value
+
+class Tracer:
+    """
+    Collects nested timing spans per thread.
+
+    A trace starts at the outermost span on a thread and is kept with
+    probability `sample_rate`; spans nested inside an unsampled trace are
+    skipped too, so sampling never produces partial stacks. Finished spans go
+    to a bounded buffer and export as Chrome trace JSON (chrome://tracing,
+    Perfetto, speedscope) or as folded stacks (flamegraph.pl, speedscope).
+    """
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 1.0, max_spans: int = 100000) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Record spans (when False `span` returns a shared no-op)
+            sample_rate: Fraction of traces (outermost spans) recorded
+            max_spans: Buffer size; the oldest spans are dropped beyond it
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+
+    @classmethod
+    def from_settings(cls) -> "Tracer":
+        """Create a tracer configured from settings.scraper."""
+        return cls(
+            enabled=settings.scraper.tracing_enabled,
+            sample_rate=settings.scraper.tracing_sample_rate,
+            max_spans=settings.scraper.tracing_max_spans
+        )
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Time a block as a span nested under the currently open one.
+
+        Args:
+            name: Span name (one frame of the flamegraph)
+            **attributes: Values attached to the span
+
+        Returns:
+            A context manager; its `set(key, value)` adds attributes
+        """
+        if not self.enabled:
+            return _NOOP
+        return _ActiveSpan(self, name, attributes)
+
+    def _start(self, name: str, attributes: Dict[str, Any]) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # None marks a frame of an unsampled trace
+        if (stack and stack[-1] is None) or (
+                not stack and self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            stack.append(None)
+            return
+        stack.append([name, time.perf_counter_ns(), 0, attributes])
+
+    def _finish(self) -> None:
+        end = time.perf_counter_ns()
+        stack = self._local.stack
+        frame = stack.pop()
+        if frame is None:
+            return
+        name, start, child_ns, attributes = frame
+        duration = end - start
+        if stack:
+            stack[-1][2] += duration
+        self.spans.append(Span(
+            name=name,
+            start_ns=start - self._origin_ns,
+            duration_ns=duration,
+            self_ns=duration - child_ns,
+            thread_id=threading.get_ident(),
+            stack=tuple(parent[0] for parent in stack) + (name,),
+            attributes=attributes
+        ))
+
+    def clear(self) -> None:
+        """Drop the recorded spans."""
+        self.spans.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Get the spans as Chrome trace "complete" events (microsecond timestamps)."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": "jobscraper",
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": span.attributes,
+                }
+                for span in list(self.spans)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def to_folded(self) -> str:
+        """Get self time per stack as folded lines ("a;b;c <microseconds>")."""
+        self_us: Dict[Tuple[str, ...], int] = defaultdict(int)
+        for span in list(self.spans):
+            self_us[span.stack] += span.self_ns // 1000
+        return "".join(f"{';'.join(stack)} {us}\n" for stack, us in sorted(self_us.items()))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Get count, total and self seconds per span name, slowest total first."""
+        totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0, 0])
+        for span in list(self.spans):
+            entry = totals[span.name]
+            entry[0] += 1
+            # Recursive spans would count their nested time twice in the total
+            if span.name not in span.stack[:-1]:
+                entry[1] += span.duration_ns / 1e9
+            entry[2] += span.self_ns / 1e9
+        return sorted(
+            (
+                {"name": name, "count": count, "total_seconds": total, "self_seconds": self_seconds}
+                for name, (count, total, self_seconds) in totals.items()
+            ),
+            key=lambda entry: entry["total_seconds"],
+            reverse=True
+        )
+
+    def export(self, path: str) -> None:
+        """Write the spans as Chrome trace JSON for *.json paths, folded stacks otherwise."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.suffix == ".json":
+            text = json.dumps(self.to_chrome_trace(), default=str)
+        else:
+            text = self.to_folded()
+        target.write_text(text, encoding="utf-8")
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer (configured from settings on first use)."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer.from_settings()
+        return _tracer
+
+def reset_tracer() -> None:
+    """Drop the shared tracer so it is rebuilt from current settings."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = None
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorate a function so each call is a span of the shared tracer.
+
+    While tracing is off the wrapper only checks a flag before calling through.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+    """
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer or get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(tracer, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+# Example usage:
+if __name__ == "__main__":
+    tracer = Tracer(enabled=True)
+
+    with tracer.span("search_jobs", what="python"):
+        for page in range(3):
+            with tracer.span("_make_request", page=page):
+                time.sleep(0.01)
+            with tracer.span("_parse_api_response") as span:
+                time.sleep(0.002)
+                span.set("jobs", 15)
+
+    for entry in tracer.summary():
+        print(f"{entry['name']:<24}{entry['count']:>4}{entry['total_seconds']:>10.4f}{entry['self_seconds']:>10.4f}")
+    print(tracer.to_folded())
@@ -1,11 +1,33 @@
+from config.settings import settings
+from core.data_model import SearchParams, ScrapingMethod
 from scrapers.indeed import IndeedScraper
 from core.storage import Storage
+from core.seen_index import SeenJobsIndex
 
 def main():
-    scraper = IndeedScraper()
-    jobs = scraper.search_jobs(query="python developer", location="remote")
-    storage = Storage()
-    storage.save(jobs)
+    params = SearchParams(what="python developer", location="remote")
+    storage = Storage(settings.storage.output_directory)
+    # Postings stored by previous runs are skipped while parsing
+    seen_index = SeenJobsIndex(str(storage.output_dir / "seen_jobs.db"))
+
+    with IndeedScraper(
+        scraping_method=ScrapingMethod.API,
+        api_key=settings.indeed.api_key,
+        seen_index=seen_index
+    ) as scraper:
+        # Pages are written as they arrive instead of being collected first
+        pending_seen = {}
+        with storage.open_writer(format=settings.storage.output_format) as writer:
+            for result in scraper.iter_pages(params):
+                writer.write(result.jobs)
+                pending_seen.update(result.seen_keys)
+
+        # Only once the writer is closed are the rows durable (Parquet writes its footer on
+        # close), so a crash before this point re-fetches the postings instead of losing them
+        scraper.mark_seen(pending_seen)
+
+    seen_index.close()
+    print(f"Saved {writer.count} new jobs to {writer.path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,147 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+
+from config.settings import settings
+from scrapers.base import BaseScraper
+from core.data_model import SearchParams, SearchResult, ScrapingMethod
+
+@dataclass
+class PageResult:
+    """A single page fetched by the AsyncSearchEngine."""
+    search: SearchParams  # the search as submitted (first-page cursor)
+    page: int  # 0-based page index within the search's cursor chain
+    result: SearchResult
+
+class AsyncSearchEngine:
+    """
+    Runs many searches concurrently, following each search's cursor chain.
+
+    Every search (query x location x filters) is crawled by its own task that
+    fetches page N+1 only after page N returned its `next_cursor`, so the
+    order inside a chain is preserved. Independent chains share a bounded
+    thread pool, which keeps up to `max_concurrency` requests in flight across
+    the scraper's proxy pool. Pages are yielded as soon as they arrive.
+
+    By default the pool is sized to `concurrency_max` and the scraper's
+    adaptive concurrency controller decides how many requests actually run.
+    """
+
+    def __init__(
+        self,
+        scraper: BaseScraper,
+        max_concurrency: Optional[int] = None,
+        max_pages: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            scraper: Scraper used to fetch individual pages
+            max_concurrency: Maximum number of requests in flight
+                (defaults to the `concurrency_max` setting)
+            max_pages: Optional cap on pages fetched per search
+        """
+        if max_concurrency is None:
+            max_concurrency = settings.scraper.concurrency_max
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Each browser page checks out its own driver; more workers would only queue on the pool
+        if scraper.scraping_method != ScrapingMethod.API:
+            max_concurrency = min(max_concurrency, settings.scraper.browser_pool_size)
+
+        self.scraper = scraper
+        self.max_concurrency = max_concurrency
+        self.max_pages = max_pages
+        self.failures: List[Tuple[SearchParams, Exception]] = []
+
+    async def _crawl_search(
+        self,
+        search: SearchParams,
+        executor: ThreadPoolExecutor,
+        queue: "asyncio.Queue[Optional[PageResult]]"
+    ) -> None:
+        """Follow a single search's cursor chain, pushing pages to the queue."""
+        params = search
+        page = 0
+        try:
+            while True:
+                result = await self.scraper.search_jobs_async(params, executor)
+                await queue.put(PageResult(search=search, page=page, result=result))
+
+                page += 1
+                if not result.next_cursor:
+                    break
+                if self.max_pages is not None and page >= self.max_pages:
+                    break
+                params = replace(params, cursor=result.next_cursor)
+        except Exception as e:
+            self.scraper.logger.error(
+                f"Search {search.what!r} in {search.location!r} stopped at page {page}: {str(e)}"
+            )
+            self.failures.append((search, e))
+
+    async def crawl(self, searches: Iterable[SearchParams]) -> AsyncIterator[PageResult]:
+        """
+        Crawl all searches concurrently.
+
+        Args:
+            searches: Searches to run; each is followed until its cursor runs out
+
+        Yields:
+            PageResult: Pages in arrival order (in order within each search)
+        """
+        self.failures = []
+        queue: "asyncio.Queue[Optional[PageResult]]" = asyncio.Queue()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="search"
+        )
+        tasks = [
+            asyncio.create_task(self._crawl_search(search, executor, queue))
+            for search in searches
+        ]
+
+        async def _close_queue() -> None:
+            await asyncio.gather(*tasks)
+            await queue.put(None)
+
+        closer = asyncio.create_task(_close_queue())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                yield page
+        finally:
+            for task in tasks + [closer]:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def collect(self, searches: Iterable[SearchParams]) -> List[PageResult]:
+        """Crawl all searches and return every page once the crawl is done."""
+        return [page async for page in self.crawl(searches)]
+
+    def run(self, searches: Iterable[SearchParams]) -> List[PageResult]:
+        """Blocking wrapper around `collect` for synchronous callers."""
+        return asyncio.run(self.collect(searches))
+
+# Example usage:
+if __name__ == "__main__":
+    from scrapers.indeed import IndeedScraper
+
+    scraper = IndeedScraper(scraping_method=ScrapingMethod.API, api_key=settings.indeed.api_key)
+    engine = AsyncSearchEngine(scraper, max_concurrency=4, max_pages=3)
+    searches = [
+        SearchParams(what=what, location=location)
+        for what in ("python developer", "data engineer")
+        for location in ("remote", "New York, NY")
+    ]
+
+    async def _main() -> None:
+        async for page in engine.crawl(searches):
+            print(page.search.what, page.search.location, page.page, len(page.result.jobs))
+
+    asyncio.run(_main())
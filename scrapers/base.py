@@ -1,15 +1,55 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from functools import partial
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+import asyncio
 import requests
+from requests.structures import CaseInsensitiveDict
 from datetime import datetime
 import json
 import logging
+import time
 from pathlib import Path
 
+from config.settings import settings
 from core.user_agent import UserAgentManager
 from core.proxy_manager import ProxyManager
+from core.session_pool import SessionPool
+from core.rate_limiter import get_rate_limiter
+from core.response_cache import ResponseCache, cache_key
+from core.replay import RequestRecorder
+from core.driver_pool import WebDriverPool, get_driver_pool, launch_chrome
+from core.metrics import (
+    RequestMetrics,
+    bytes_received,
+    bytes_sent,
+    connect_elapsed,
+    get_metrics,
+    proxy_label,
+    reset_connect_timer,
+)
+from core.tracing import get_tracer, traced
+from core.concurrency import (
+    AdaptiveConcurrencyController,
+    backoff_delay,
+    is_blocked_response,
+    parse_retry_after,
+)
 from core.data_model import Job, SearchParams, SearchResult, ScrapingMethod
 
+def _collect_seen_keys(
+    seen_keys: Optional[Dict[str, Optional[str]]],
+    result: SearchResult,
+    consumed: int
+) -> None:
+    """Add a page's seen keys to `seen_keys`, leaving out jobs past the first `consumed`."""
+    if seen_keys is None:
+        return
+    skipped = {job.key for job in result.jobs[consumed:]}
+    seen_keys.update((key, value) for key, value in result.seen_keys.items() if key not in skipped)
+
 class BaseScraper(ABC):
     def __init__(
         self,
@@ -28,6 +68,20 @@ class BaseScraper(ABC):
         # Initialize managers
         self.user_agent_manager = UserAgentManager() if user_agent_enabled else None
         self.proxy_manager = ProxyManager() if proxy_enabled else None
+        self.session_pool = SessionPool(
+            max_size=settings.scraper.session_pool_size,
+            idle_timeout=settings.scraper.session_idle_timeout,
+            max_age=settings.scraper.session_max_age
+        )
+        self.rate_limiter = get_rate_limiter()
+        self.concurrency = AdaptiveConcurrencyController.from_settings()
+        self.response_cache = (
+            ResponseCache.from_settings() if settings.scraper.response_cache_enabled else None
+        )
+        # Record/replay of responses as fixtures (off unless `replay_mode` is set)
+        self.recorder = RequestRecorder.from_settings()
+        # Per-request latency, bytes and status, shared by every scraper in the process
+        self.metrics = get_metrics() if settings.scraper.metrics_enabled else None
         
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -67,56 +121,213 @@ class BaseScraper(ABC):
         self.api_base_url = "https://api.indeed.com/v1"  # Replace with actual API endpoint
 
     def _init_browser(self):
-        """Initialize browser for headless/non-headless scraping"""
+        """Attach the shared pool of warm browsers for headless/non-headless scraping"""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
-            
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless")
-            
-            # Add common options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            
-            # Add user agent if enabled
-            if self.user_agent_enabled:
-                user_agent = self.user_agent_manager.get_next()
-                options.add_argument(f"user-agent={user_agent}")
-            
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=options
-            )
-            
+            import selenium  # noqa: F401
         except ImportError:
             self.logger.error("Selenium dependencies not installed. Please install them using: pip install selenium webdriver-manager")
             raise
 
+        # Chrome is launched on first use and reused by every scraper with the same options
+        next_user_agent = self.user_agent_manager.get_next_user_agent if self.user_agent_enabled else None
+        block_resources = settings.scraper.browser_block_resources
+        self.driver_pool: WebDriverPool = get_driver_pool(
+            ("chrome", self.headless, self.user_agent_enabled, block_resources),
+            partial(launch_chrome, self.headless, next_user_agent, block_resources)
+        )
+
+    @contextmanager
+    def browser(self) -> Iterator[Any]:
+        """
+        Check a warm WebDriver out of the pool for one page.
+
+        Yields:
+            A WebDriver used exclusively by the caller until the block exits
+        """
+        with self.driver_pool.acquire() as driver:
+            yield driver
+
+    @traced()
     def _make_request(self, url: str, method: str = "GET", **kwargs) -> requests.Response:
-        """Make HTTP request with rotating user agents and proxies"""
-        headers = self._get_headers()
-        proxies = self.proxy_manager.get_next_proxy() if self.proxy_enabled else None
-        
-        print("args: ", method, url, proxies,)
+        """
+        Make HTTP request with rotating user agents and proxies.
 
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                # headers=headers,
-                proxies=proxies,
-                **kwargs
-            )
-            response.raise_for_status()
+        403/429/captcha responses, 5xx responses and transport errors are
+        retried up to `max_retries` times on a fresh proxy, waiting for the
+        server's Retry-After or a jittered exponential backoff in between.
+
+        Requests time out after `request_timeout` seconds unless a `timeout`
+        is passed, and a server's Retry-After is capped at `retry_backoff_max`.
+
+        Successful responses are stored in the response cache; a cached
+        response is returned without touching the network, rate limiter or
+        proxies. Pass `use_cache=False` to bypass the cache for one request.
+
+        With `replay_mode` set to "record", every successful response is also
+        saved as a fixture; with "replay" requests are answered from the
+        fixtures only, without network, proxies or cache.
+
+        Every attempt (cache and fixture hits included) is reported to the
+        metrics registry; pass `query_label` to aggregate latency per query.
+        """
+        use_cache = kwargs.pop("use_cache", True) and self.response_cache is not None
+        query = kwargs.pop("query_label", None)
+        if self.recorder is not None and self.recorder.replaying:
+            response = self.recorder.load(method, url, **kwargs)
+            self._observe_request(method, url, query, response=response, cached=True)
             return response
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
-            raise
+
+        key = None
+        if use_cache:
+            key = cache_key(method, url, **kwargs)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._observe_request(method, url, query, response=cached, cached=True)
+                if self.recorder is not None:
+                    self.recorder.save(method, url, cached, **kwargs)
+                return cached
+
+        # Caller headers win over the defaults, e.g. an API's own user agent
+        caller_headers = kwargs.pop("headers", None) or {}
+        max_retries = settings.scraper.max_retries
+        # A hung connection must not hold a concurrency slot forever
+        kwargs.setdefault("timeout", settings.scraper.request_timeout)
+
+        for attempt in range(max_retries + 1):
+            proxies = self.proxy_manager.get_next_proxy() if self.proxy_enabled else None
+            self.logger.debug(f"{method} {url} via {proxy_label(proxies)} (attempt {attempt + 1})")
+            # A fresh user agent with every attempt, like the proxy
+            headers = CaseInsensitiveDict(self._get_headers())
+            headers.update(caller_headers)
+
+            self.rate_limiter.acquire(url, SessionPool.key_for(proxies))
+
+            retry_after = None
+            with self.concurrency.slot():
+                start = time.monotonic()
+                reset_connect_timer()
+                try:
+                    response = self.session_pool.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        proxies=proxies,
+                        **kwargs
+                    )
+                except requests.exceptions.RequestException as e:
+                    self._record_proxy_result(proxies, start, None)
+                    self._observe_request(
+                        method, url, query, start=start, attempt=attempt, proxies=proxies,
+                        error=e, request_kwargs={**kwargs, "headers": headers}
+                    )
+                    self.logger.error(f"Request failed (attempt {attempt + 1}): {str(e)}")
+                    if attempt == max_retries:
+                        raise
+                else:
+                    blocked = is_blocked_response(response)
+                    if blocked or response.status_code < 500:
+                        self.concurrency.record(blocked)
+                    self._record_proxy_result(proxies, start, response.status_code)
+                    self._observe_request(
+                        method, url, query, start=start, attempt=attempt, proxies=proxies,
+                        response=response
+                    )
+
+                    if not blocked and response.status_code < 500:
+                        try:
+                            response.raise_for_status()
+                        except requests.exceptions.RequestException as e:
+                            self.logger.error(f"Request failed: {str(e)}")
+                            raise
+                        if key is not None:
+                            self.response_cache.put(key, response)
+                        if self.recorder is not None:
+                            self.recorder.save(method, url, response, **kwargs)
+                        return response
+
+                    self.logger.warning(
+                        f"Request blocked or failed with {response.status_code} (attempt {attempt + 1})"
+                    )
+                    if attempt == max_retries:
+                        if response.ok:
+                            raise requests.exceptions.HTTPError(
+                                "Captcha challenge served instead of a response",
+                                response=response
+                            )
+                        response.raise_for_status()
+                    retry_after = parse_retry_after(response)
+                    if retry_after is not None and retry_after > settings.scraper.retry_backoff_max:
+                        self.logger.warning(
+                            f"Retry-After of {retry_after:.0f}s capped at {settings.scraper.retry_backoff_max:.0f}s"
+                        )
+                        retry_after = settings.scraper.retry_backoff_max
+
+            if retry_after is None:
+                retry_after = backoff_delay(
+                    attempt,
+                    settings.scraper.retry_backoff_base,
+                    settings.scraper.retry_backoff_max
+                )
+            time.sleep(retry_after)
+
+        # Only reached when no attempt was made (max_retries below zero)
+        raise requests.exceptions.RetryError(f"{method} {url} failed after {max_retries + 1} attempts")
+
+    def _record_proxy_result(
+        self,
+        proxies: Optional[Dict[str, str]],
+        start: float,
+        status_code: Optional[int]
+    ) -> None:
+        """Feed a request outcome back to the proxy manager's health scores"""
+        if proxies and self.proxy_manager:
+            self.proxy_manager.record_result(
+                proxies["https"],
+                time.monotonic() - start,
+                status_code
+            )
+
+    def _observe_request(
+        self,
+        method: str,
+        url: str,
+        query: Optional[str],
+        start: Optional[float] = None,
+        attempt: int = 0,
+        proxies: Optional[Dict[str, str]] = None,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+        cached: bool = False,
+        request_kwargs: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Report one request attempt to the metrics registry"""
+        if self.metrics is None:
+            return
+        request_kwargs = request_kwargs or {}
+        if response is not None:
+            request = response.request
+            user_agent = request.headers.get("User-Agent") if request is not None else None
+            elapsed = getattr(response, "elapsed", None)
+        else:
+            request = None
+            user_agent = (request_kwargs.get("headers") or {}).get("User-Agent")
+            elapsed = None
+        self.metrics.observe(RequestMetrics(
+            url=url,
+            method=method,
+            status_code=response.status_code if response is not None else None,
+            total_seconds=time.monotonic() - start if start is not None else 0.0,
+            ttfb_seconds=elapsed.total_seconds() if elapsed and not cached else None,
+            connect_seconds=connect_elapsed() if not cached else 0.0,
+            bytes_in=bytes_received(response) if response is not None else 0,
+            bytes_out=0 if cached else bytes_sent(request, request_kwargs.get("data")),
+            proxy=proxy_label(proxies),
+            user_agent=user_agent,
+            query=query,
+            attempt=attempt,
+            cached=cached,
+            error=f"{type(error).__name__}: {error}" if error is not None else None
+        ))
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with rotating user agent"""
@@ -136,10 +347,139 @@ class BaseScraper(ABC):
         """Search for jobs based on parameters"""
         pass
 
+    async def search_jobs_async(
+        self,
+        params: SearchParams,
+        executor: Optional[Executor] = None
+    ) -> SearchResult:
+        """
+        Fetch a single page without blocking the event loop.
+
+        The blocking `search_jobs` call runs on `executor` (the loop's default
+        executor when None), so several pages can wait on the network at once.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.search_jobs, params)
+
+    def iter_pages(
+        self,
+        params: SearchParams,
+        max_pages: Optional[int] = None
+    ) -> Iterator[SearchResult]:
+        """
+        Fetch pages lazily, following `next_cursor` until it runs out.
+
+        Args:
+            params: Search parameters for the first page
+            max_pages: Optional cap on the number of pages fetched
+
+        Yields:
+            SearchResult: One page at a time
+        """
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            result = self.search_jobs(params)
+            pages += 1
+            yield result
+            if not result.next_cursor:
+                break
+            params = replace(params, cursor=result.next_cursor)
+
+    def mark_seen(self, seen_keys: Dict[str, Optional[str]]) -> None:
+        """
+        Record persisted postings in the scraper's seen index.
+
+        Call it with the pages' `seen_keys` once their jobs are durable.
+        Scrapers without a seen index ignore it.
+
+        Args:
+            seen_keys: Job keys with their listing fingerprints (or None)
+        """
+        pass
+
+    def iter_jobs(
+        self,
+        params: SearchParams,
+        max_pages: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        seen_keys: Optional[Dict[str, Optional[str]]] = None
+    ) -> Iterator[Job]:
+        """
+        Stream jobs across cursor pages.
+
+        Only the current page is held in memory and the next page is fetched
+        when the consumer asks for more, so downstream stages can parse, dedupe
+        and write while the crawl continues.
+
+        Args:
+            params: Search parameters for the first page
+            max_pages: Optional cap on the number of pages fetched
+            max_jobs: Optional cap on the number of jobs yielded
+            seen_keys: Optional dict collecting the `seen_keys` of the jobs
+                yielded so far; pass it to `mark_seen` once they are persisted
+
+        Yields:
+            Job: Jobs in result order
+        """
+        if max_jobs is not None and max_jobs <= 0:
+            return
+        count = 0
+        for result in self.iter_pages(params, max_pages):
+            for index, job in enumerate(result.jobs):
+                yield job
+                count += 1
+                if max_jobs is not None and count >= max_jobs:
+                    _collect_seen_keys(seen_keys, result, index + 1)
+                    return
+            _collect_seen_keys(seen_keys, result, len(result.jobs))
+
+    async def aiter_pages(
+        self,
+        params: SearchParams,
+        max_pages: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> AsyncIterator[SearchResult]:
+        """Async variant of `iter_pages`; pages are fetched on `executor`."""
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            result = await self.search_jobs_async(params, executor)
+            pages += 1
+            yield result
+            if not result.next_cursor:
+                break
+            params = replace(params, cursor=result.next_cursor)
+
+    async def aiter_jobs(
+        self,
+        params: SearchParams,
+        max_pages: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        seen_keys: Optional[Dict[str, Optional[str]]] = None
+    ) -> AsyncIterator[Job]:
+        """Async variant of `iter_jobs`; pages are fetched on `executor`."""
+        if max_jobs is not None and max_jobs <= 0:
+            return
+        count = 0
+        async for result in self.aiter_pages(params, max_pages, executor):
+            for index, job in enumerate(result.jobs):
+                yield job
+                count += 1
+                if max_jobs is not None and count >= max_jobs:
+                    _collect_seen_keys(seen_keys, result, index + 1)
+                    return
+            _collect_seen_keys(seen_keys, result, len(result.jobs))
+
     def close(self):
         """Clean up resources"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        self.session_pool.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.metrics is not None and settings.scraper.metrics_export_path:
+            self.metrics.export(settings.scraper.metrics_export_path)
+        if settings.scraper.tracing_export_path:
+            get_tracer().export(settings.scraper.tracing_export_path)
+        # Pooled browsers stay warm for other scrapers; close_driver_pools() quits them
 
     def __enter__(self):
         return self
@@ -0,0 +1,259 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+import logging
+import multiprocessing
+import queue
+
+from config.settings import settings
+from scrapers.base import BaseScraper
+from core.data_model import SearchParams
+from core.seen_index import SeenJobsIndex
+from core.storage import Storage
+from core.rate_limiter import reset_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class TaskProgress:
+    """Progress of a single (query, location) task."""
+    task_id: int
+    params: SearchParams
+    pages: int = 0
+    jobs: int = 0
+    done: bool = False
+    error: Optional[str] = None
+
+def _crawl_worker(
+    worker_id: int,
+    scraper_factory: Callable[[], BaseScraper],
+    max_pages: Optional[int],
+    rate_share: int,
+    tasks: "multiprocessing.Queue",
+    results: "multiprocessing.Queue"
+) -> None:
+    """
+    Worker process: crawl tasks from `tasks` and send pages to `results`.
+
+    Messages are (kind, worker_id, task_id, payload) tuples where kind is
+    "start", "page" (payload: list of Job and the page's seen keys), "done"
+    (payload: error or None) or "exit".
+    """
+    # Each process gets an equal share of the global request budget
+    settings.scraper.delay_between_requests *= rate_share
+    settings.scraper.host_requests_per_second /= rate_share
+    reset_rate_limiter()
+
+    scraper = scraper_factory()
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            task_id, params = task
+            results.put(("start", worker_id, task_id, None))
+            try:
+                for result in scraper.iter_pages(params, max_pages):
+                    results.put(("page", worker_id, task_id, (result.jobs, result.seen_keys)))
+                results.put(("done", worker_id, task_id, None))
+            except Exception as e:
+                results.put(("done", worker_id, task_id, f"{type(e).__name__}: {e}"))
+    finally:
+        scraper.close()
+        results.put(("exit", worker_id, None, None))
+
+class CrawlCoordinator:
+    """
+    Spreads a query matrix across a pool of worker processes.
+
+    Each worker builds its own scraper (so JSON parsing and Job construction
+    run outside the parent's GIL) and pulls (query, location) tasks from a
+    shared queue. Workers start from the proxy inventory cached on disk by
+    the parent and split the request budget (`delay_between_requests` and
+    `host_requests_per_second`) between them.
+    Pages flow back through a result queue into a single Storage writer in
+    the parent, which also tracks progress per task. Once the writer is
+    closed, the parent records the pages' seen keys in `seen_index`.
+    """
+
+    def __init__(
+        self,
+        scraper_factory: Callable[[], BaseScraper],
+        storage: Storage,
+        processes: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        progress_callback: Optional[Callable[[TaskProgress], None]] = None,
+        start_method: Optional[str] = None,
+        seen_index: Optional[SeenJobsIndex] = None
+    ) -> None:
+        """
+        Initialize the coordinator.
+
+        Args:
+            scraper_factory: Picklable callable building a scraper in each worker,
+                e.g. functools.partial(IndeedScraper, api_key=...)
+            storage: Storage receiving every page
+            processes: Number of worker processes (defaults to the CPU count)
+            max_pages: Optional cap on pages fetched per task
+            progress_callback: Called with a task's progress after every update
+            start_method: multiprocessing start method (platform default when None)
+            seen_index: Index receiving the seen keys of persisted pages (the
+                workers' scrapers should filter against the same database)
+        """
+        self.scraper_factory = scraper_factory
+        self.storage = storage
+        self.processes = processes or multiprocessing.cpu_count()
+        self.max_pages = max_pages
+        self.progress_callback = progress_callback
+        self.context = multiprocessing.get_context(start_method)
+        self.seen_index = seen_index
+        self.progress: Dict[int, TaskProgress] = {}
+
+    def _warm_proxy_cache(self) -> None:
+        """
+        Refresh the proxy inventory on disk before the workers start.
+
+        The refresh runs in the parent, synchronously, so every worker loads
+        a fresh cache instead of each starting its own proxy-API fetch.
+        """
+        try:
+            from core.proxy_manager import ProxyManager
+            ProxyManager(background_refresh=False)
+        except Exception as e:
+            logger.warning(f"Could not warm the proxy cache: {e}")
+
+    def _update(self, progress: TaskProgress) -> None:
+        """Report a task's progress."""
+        if progress.done:
+            if progress.error:
+                logger.error(f"Task {progress.task_id} ({progress.params.what!r} in "
+                             f"{progress.params.location!r}) failed: {progress.error}")
+            else:
+                logger.info(f"Task {progress.task_id} finished: {progress.pages} pages, {progress.jobs} jobs")
+        if self.progress_callback:
+            self.progress_callback(progress)
+
+    def run(
+        self,
+        searches: Iterable[SearchParams],
+        format: str = "csv",
+        filename: Optional[str] = None,
+        warm_proxy_cache: bool = True
+    ) -> Dict[int, TaskProgress]:
+        """
+        Crawl every search and write all pages through one writer.
+
+        Args:
+            searches: (query, location) searches to run
+            format: Storage format passed to `Storage.open_writer`
+            filename: Optional custom filename
+            warm_proxy_cache: Fetch the proxy inventory once before starting workers
+
+        Returns:
+            Dict[int, TaskProgress]: Final progress per task id
+        """
+        searches = list(searches)
+        self.progress = {
+            task_id: TaskProgress(task_id=task_id, params=params)
+            for task_id, params in enumerate(searches)
+        }
+        if not searches:
+            return self.progress
+        if warm_proxy_cache:
+            self._warm_proxy_cache()
+
+        processes = min(self.processes, len(searches))
+        tasks = self.context.Queue()
+        results = self.context.Queue()
+        for task in enumerate(searches):
+            tasks.put(task)
+        for _ in range(processes):
+            tasks.put(None)
+
+        workers = [
+            self.context.Process(
+                target=_crawl_worker,
+                args=(worker_id, self.scraper_factory, self.max_pages, processes, tasks, results),
+                name=f"crawl-worker-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        running = set(range(processes))
+        current_task: Dict[int, Optional[int]] = {}
+        pending_seen: Dict[str, Optional[str]] = {}
+        try:
+            with self.storage.open_writer(format=format, filename=filename) as writer:
+                while running:
+                    try:
+                        kind, worker_id, task_id, payload = results.get(timeout=1.0)
+                    except queue.Empty:
+                        self._reap_crashed_workers(workers, running, current_task)
+                        continue
+
+                    if kind == "start":
+                        current_task[worker_id] = task_id
+                    elif kind == "page":
+                        jobs, seen_keys = payload
+                        progress = self.progress[task_id]
+                        progress.pages += 1
+                        progress.jobs += writer.write(jobs)
+                        pending_seen.update(seen_keys)
+                        self._update(progress)
+                    elif kind == "done":
+                        current_task[worker_id] = None
+                        progress = self.progress[task_id]
+                        progress.done = True
+                        progress.error = payload
+                        self._update(progress)
+                    elif kind == "exit":
+                        running.discard(worker_id)
+
+            # Rows are durable only once the writer is closed
+            if self.seen_index is not None:
+                self.seen_index.mark_seen(pending_seen, fingerprints=pending_seen)
+        finally:
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+
+        return self.progress
+
+    def _reap_crashed_workers(
+        self,
+        workers: List[multiprocessing.Process],
+        running: set,
+        current_task: Dict[int, Optional[int]]
+    ) -> None:
+        """Stop waiting for workers that died without saying goodbye."""
+        for worker_id in list(running):
+            worker = workers[worker_id]
+            if worker.is_alive():
+                continue
+            running.discard(worker_id)
+            task_id = current_task.get(worker_id)
+            if task_id is not None:
+                progress = self.progress[task_id]
+                progress.done = True
+                progress.error = f"Worker exited with code {worker.exitcode}"
+                self._update(progress)
+
+# Example usage:
+if __name__ == "__main__":
+    from functools import partial
+    from core.data_model import ScrapingMethod
+    from scrapers.indeed import IndeedScraper
+
+    queries = ["python developer", "data engineer", "devops engineer"]
+    locations = ["remote", "New York, NY", "San Francisco, CA", "Austin, TX"]
+
+    coordinator = CrawlCoordinator(
+        partial(IndeedScraper, scraping_method=ScrapingMethod.API, api_key=settings.indeed.api_key),
+        Storage(settings.storage.output_directory),
+        progress_callback=lambda p: print(f"[{p.task_id}] {p.params.what} / {p.params.location}: "
+                                          f"{p.pages} pages, {p.jobs} jobs{' (done)' if p.done else ''}")
+    )
+    coordinator.run([SearchParams(what=q, location=l) for q in queries for l in locations])
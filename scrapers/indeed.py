@@ -1,189 +1,287 @@
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+import hashlib
 import json
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
 from scrapers.base import BaseScraper
 from config.settings import settings
 from core.data_model import Job, SearchParams, SearchResult, Company
-from core.queries import INDEED_JOB_SEARCH, INDEED_API_HEADERS, INDEED_JOB_TYPE_KEYS, INDEED_REMOTE_KEYS
+from core.seen_index import SeenJobsIndex
+from core.tracing import get_tracer, traced
+from core.decoding import decode_job, decode_job_data, decode_job_search, decode_listings, loads
+from core.queries import (
+    compile_job_data,
+    compile_job_search,
+    INDEED_API_HEADERS,
+    INDEED_JOB_TYPE_KEYS,
+    INDEED_REMOTE_KEYS,
+    LISTING_PROJECTION,
+)
+
+# Fields of every job card on the results page, collected in one WebDriver round trip
+EXTRACT_JOB_CARDS_SCRIPT = """
+const text = (card, cls) => {
+    const el = card.getElementsByClassName(cls)[0];
+    return el ? el.innerText : null;
+};
+const cards = Array.from(document.getElementsByClassName("job_seen_beacon")).slice(0, arguments[0]);
+const next = document.querySelector(arguments[1]);
+return JSON.stringify({next: next ? next.href : null, cards: cards.map(card => {
+    const link = card.getElementsByClassName("jcs-JobTitle")[0];
+    return {
+        key: link ? link.getAttribute("data-jk") : null,
+        title: text(card, "jobTitle"),
+        company: text(card, "companyName"),
+        location: text(card, "companyLocation"),
+        metadata: text(card, "metadata"),
+        salary: text(card, "salary-snippet"),
+        url: link ? link.href : null
+    };
+})});
+"""
+# Link to the next results page (browser mode)
+NEXT_PAGE_SELECTOR = 'a[data-testid="pagination-page-next"], a[aria-label="Next Page"]'
+# Results per page; browser-mode cursors are `start=` offsets in steps of this
+BROWSER_PAGE_SIZE = 10
+# Card fields a Job cannot be built without
+REQUIRED_CARD_FIELDS = ("title", "company", "location", "metadata", "url")
 
 class IndeedScraper(BaseScraper):
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        seen_index: Optional[SeenJobsIndex] = None,
+        projection: Optional[Iterable[str]] = None,
+        two_phase: bool = False,
+        detail_batch_size: int = 25,
+        card_extraction: str = "script",
+        max_cards: int = 100,
+        **kwargs
+    ):
         super().__init__(**kwargs)
+        # Jobs whose key is already in the index are skipped while parsing
+        self.seen_index = seen_index
+        # Keys (and fingerprints) returned this run but not yet marked seen;
+        # the caller marks them once the jobs are persisted
+        self._pending_seen: Dict[str, Optional[str]] = {}
+        # Only the fields in the projection are requested (defaults to what Job needs)
+        self.job_search = compile_job_search(projection)
+        # Two-phase crawl: cheap listing pages, then batched details for new or changed keys
+        self.two_phase = two_phase
+        self.detail_batch_size = detail_batch_size
+        self.listing_search = compile_job_search(LISTING_PROJECTION)
+        self.job_data = compile_job_data()
+        # Browser mode: "script" reads all cards with one execute_script call,
+        # "elements" queries each card field with its own find_element call
+        if card_extraction not in ("script", "elements"):
+            raise ValueError(f"Unknown card extraction mode: {card_extraction}")
+        self.card_extraction = card_extraction
+        self.max_cards = max_cards
         self.base_url = "https://www.indeed.com"
         self.search_url = f"{self.base_url}/jobs"
         self.api_url = "https://apis.indeed.com/graphql"
-        self.params = params
 
+    @traced()
     def search_jobs(self, params: SearchParams) -> SearchResult:
         """Search for jobs using the configured scraping method"""
         if self.scraping_method == "api":
-            return self._search_jobs_api(self.params)
+            if self.two_phase:
+                return self._search_jobs_two_phase(params)
+            return self._search_jobs_api(params)
         else:
-            return self._search_jobs_browser(self.params)
+            return self._search_jobs_browser(params)
 
     def _search_jobs_api(self, params: SearchParams) -> SearchResult:
         """Search jobs using Indeed's GraphQL API"""
         try:
-            # Prepare GraphQL variables
-            variables = {
-                "what": params.what,
-                "location": params.location,
-                "cursor": params.cursor,
-                "filters": params.filters
-            }
-            print("Kwargs: ",   
-                  { 
-                      "self.api_url": self.api_url,
-                      "method": "POST",
-                      "headers": INDEED_API_HEADERS, # TODO: move this to the base manager later 
-                      "json": {
-                          "query": INDEED_JOB_SEARCH,
-                          "variables": variables
-                      }
-                  })
-            
+            # The request body is pre-serialized; only the page arguments are encoded
+            body = self.job_search.body(
+                what=params.what,
+                location=params.location,
+                cursor=params.cursor,
+                filters=params.filters
+            )
             # Make GraphQL request
             response = self._make_request(
                 self.api_url,
                 method="POST",
                 headers=INDEED_API_HEADERS, # TODO: move this to the base manager later 
-                json={
-                    "query": INDEED_JOB_SEARCH,
-                    "variables": variables
-                }
+                data=body,
+                query_label=self._query_label(params)
             )
             
-            data = response.json()
-            return self._parse_api_response(data)
+            # Decoded straight from the body bytes into records, skipping response.json()
+            return self._parse_api_response(response.content)
             
         except Exception as e:
             self.logger.error(f"API search failed: {str(e)}")
             raise
 
-    def _parse_api_response(self, data: Dict[str, Any]) -> SearchResult:
-        """Parse GraphQL API response into SearchResult"""
-        jobs = []
-        job_search = data.get("data", {}).get("jobSearch", {})
-        
-        for result in job_search.get("results", []):
+    def _search_jobs_two_phase(self, params: SearchParams) -> SearchResult:
+        """
+        Search jobs with a listing pass followed by a batched detail pass.
+
+        The listing pass only requests key, title, posting date and location.
+        Details (description, employer, compensation, attributes, links) are
+        then fetched by key for listings that are new or whose listing
+        fingerprint changed since they were last seen; unchanged repeat
+        postings are dropped without downloading their descriptions again.
+
+        Listings whose details could not be fetched are left out of the page
+        and of `seen_keys`, so the next run retries them.
+        """
+        try:
+            body = self.listing_search.body(
+                what=params.what,
+                location=params.location,
+                cursor=params.cursor,
+                filters=params.filters
+            )
+            response = self._make_request(
+                self.api_url,
+                method="POST",
+                headers=INDEED_API_HEADERS,
+                data=body,
+                query_label=self._query_label(params)
+            )
+            return self._parse_listing_response(response.content)
+            
+        except Exception as e:
+            self.logger.error(f"Two-phase search failed: {str(e)}")
+            raise
+
+    def _parse_listing_response(self, content: bytes) -> SearchResult:
+        """Fetch details for the new or changed listings of a page and build its jobs"""
+        listings, next_cursor = decode_listings(content)
+
+        fingerprints = {key: self._fingerprint(job_data) for key, job_data in listings.items()}
+        if self.seen_index is not None:
+            wanted = {
+                key for key in self.seen_index.changed(fingerprints)
+                if key not in self._pending_seen or self._pending_seen[key] != fingerprints[key]
+            }
+        else:
+            wanted = set(listings)
+
+        keys = [key for key in listings if key in wanted]
+        details = self._fetch_job_details(keys)
+        fetched = [key for key in keys if key in details]
+        if len(fetched) < len(keys):
+            self.logger.warning(f"No details for {len(keys) - len(fetched)} listings; they are retried next run")
+
+        # Listing fields win over the detail lookup's copies
+        with get_tracer().span("build_jobs", count=len(fetched)):
+            jobs = [decode_job({**details[key], **listings[key]}).to_job() for key in fetched]
+
+        # Unchanged known listings only refresh their last_seen; unfetched ones stay unmarked
+        missing = set(keys) - set(fetched)
+        seen_keys: Dict[str, Optional[str]] = {
+            key: fingerprint for key, fingerprint in fingerprints.items() if key not in missing
+        }
+        self._pending_seen.update((key, fingerprints[key]) for key in fetched)
+
+        return SearchResult(
+            jobs=jobs,
+            next_cursor=next_cursor,
+            seen_keys=seen_keys
+        )
+
+    def _fetch_job_details(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch detail fields for job keys in batches of `detail_batch_size`; failed batches are skipped"""
+        details = {}
+        for start in range(0, len(keys), self.detail_batch_size):
+            batch = keys[start:start + self.detail_batch_size]
             try:
-                job_data = result.get("job", {})
-                
-                # Parse employer/company data
-                employer_data = job_data.get("employer", {})
-                dossier = employer_data.get("dossier", {})
-                employer_details = dossier.get("employerDetails", {})
-                links = dossier.get("links", {})
-                
-                company = Company(
-                    name=employer_data.get("name", ""),
-                    website=links.get("corporateWebsite"),
-                    location=employer_details.get("addresses", [None])[0],
-                    contact_email=None,  # Not available in API
-                    contact_phone=None   # Not available in API
-                )
-                
-                # Parse job attributes
-                attributes = job_data.get("attributes", [])
-                is_remote = self._check_remote_status(attributes)
-                job_type = self._determine_job_type(attributes)
-                
-                # Parse compensation
-                compensation = self._parse_compensation(job_data.get("compensation", {}))
-                
-                # Create job object
-                job = Job(
-                    title=job_data.get("title", ""),
-                    company=company,
-                    location=job_data.get("location", {}).get("formatted", {}).get("short", ""),
-                    is_remote=is_remote,
-                    job_type=job_type,
-                    compensation=compensation,
-                    date_posted=datetime.fromisoformat(job_data.get("datePublished", "")),
-                    description=job_data.get("description", {}).get("html", ""),
-                    application_url=job_data.get("recruit", {}).get("viewJobUrl", ""),
-                    source_url=job_data.get("recruit", {}).get("viewJobUrl", "")
+                response = self._make_request(
+                    self.api_url,
+                    method="POST",
+                    headers=INDEED_API_HEADERS,
+                    data=self.job_data.body(batch),
+                    query_label="jobData"
                 )
-                
-                jobs.append(job)
-                
+                details.update(decode_job_data(response.content))
             except Exception as e:
-                self.logger.error(f"Error parsing job data: {str(e)}")
-                continue
-        
-        return SearchResult(
-            jobs=jobs,
-            next_cursor=job_search.get("pageInfo", {}).get("nextCursor")
+                self.logger.error(f"Detail batch of {len(batch)} jobs failed: {str(e)}")
+        return details
+
+    def mark_seen(self, seen_keys: Dict[str, Optional[str]]) -> None:
+        """Record persisted postings in the seen index and stop tracking them as pending"""
+        if self.seen_index is None:
+            return
+        self.seen_index.mark_seen(seen_keys, fingerprints=seen_keys)
+        for key in seen_keys:
+            self._pending_seen.pop(key, None)
+
+    def _query_label(self, params: SearchParams) -> str:
+        """Label aggregating request metrics per search query"""
+        return f"{params.what} | {params.location}"
+
+    def _fingerprint(self, job_data: Dict[str, Any]) -> str:
+        """Hash the listing fields whose change means the details should be refetched"""
+        parts = (
+            job_data.get("title") or "",
+            str(job_data.get("datePublished") or ""),
+            ((job_data.get("location") or {}).get("formatted") or {}).get("short") or "",
         )
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
 
-    def _check_remote_status(self, attributes: List[Dict[str, str]]) -> bool:
-        """Check if job is remote based on attributes"""
-        for attr in attributes:
-            if attr.get("key", "").lower() in REMOTE_KEYS:
-                return True
-        return False
-
-    def _determine_job_type(self, attributes: List[Dict[str, str]]) -> str:
-        """Determine job type from attributes"""
-        for attr in attributes:
-            if attr.get("key", "").lower() in JOB_TYPE_KEYS:
-                return attr.get("label", "Unknown")
-        return "Unknown"
+    @traced()
+    def _parse_api_response(self, content: Union[bytes, Dict[str, Any]]) -> SearchResult:
+        """Parse a GraphQL jobSearch response (raw body or decoded payload) into SearchResult"""
+        page = decode_job_search(content)
+        records = page.records
 
-    def _parse_compensation(self, compensation_data: Dict[str, Any]) -> Optional[str]:
-        """Parse compensation data into a readable string"""
-        try:
-            estimated = compensation_data.get("estimated", {})
-            base_salary = estimated.get("baseSalary", {})
-            salary_range = base_salary.get("range", {})
-            
-            min_salary = salary_range.get("min")
-            max_salary = salary_range.get("max")
-            
-            if min_salary and max_salary:
-                return f"${min_salary:,.2f} - ${max_salary:,.2f}"
-            elif min_salary:
-                return f"From ${min_salary:,.2f}"
-            elif max_salary:
-                return f"Up to ${max_salary:,.2f}"
-            return None
-            
-        except Exception:
-            return None
+        # Look the whole page up at once, before any Job is built
+        seen_keys: Dict[str, Optional[str]] = {}
+        if self.seen_index is not None:
+            page_keys = [record.key for record in records if record.key]
+            known_keys = self.seen_index.known(page_keys) | self._pending_seen.keys()
+            records = [record for record in records if record.key not in known_keys]
+            # Marked by the caller after the jobs are persisted, never before
+            seen_keys = dict.fromkeys(page_keys)
+            self._pending_seen.update(dict.fromkeys(record.key for record in records if record.key))
+
+        with get_tracer().span("build_jobs", count=len(records)):
+            jobs = [record.to_job() for record in records]
+        return SearchResult(jobs=jobs, next_cursor=page.next_cursor, seen_keys=seen_keys)
 
     def _search_jobs_browser(self, params: SearchParams) -> SearchResult:
-        """Search jobs using browser automation"""
+        """
+        Search jobs using browser automation.
+
+        The cursor is the `start=` offset of the results page; `next_cursor`
+        is taken from the page's next-page link and is None on the last page.
+        """
         try:
             # Construct search URL
             search_url = self._build_search_url(params)
-            self.driver.get(search_url)
-            
-            # Wait for job cards to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
-            )
             
-            # Get all job cards
-            job_cards = self.driver.find_elements(By.CLASS_NAME, "job_seen_beacon")
-            jobs = []
-            
-            for card in job_cards[:100]:  # Limit to 100 results
-                try:
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    self.logger.error(f"Failed to parse job card: {str(e)}")
-                    continue
+            # A warm browser from the pool; a crashed one is replaced on the next page
+            with self.browser() as driver:
+                driver.get(search_url)
+                
+                # Wait for job cards to load
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
+                )
+                
+                page = None
+                if self.card_extraction == "script":
+                    try:
+                        page = self._extract_job_cards(driver)
+                    except WebDriverException as e:
+                        self.logger.warning(f"Script extraction failed, querying elements instead: {str(e)}")
+                if page is None:
+                    page = self._parse_job_card_elements(driver)
             
+            jobs, next_url = page
             return SearchResult(
                 jobs=jobs,
-                next_cursor=None  # Browser scraping doesn't support pagination
+                next_cursor=self._next_start(next_url, self._start_offset(params))
             )
             
         except TimeoutException:
@@ -193,59 +291,86 @@ class IndeedScraper(BaseScraper):
             self.logger.error(f"Browser search failed: {str(e)}")
             raise
 
+    @traced()
+    def _extract_job_cards(self, driver) -> Tuple[List[Job], Optional[str]]:
+        """Read every job card and the next-page link with a single execute_script round trip"""
+        page = loads(driver.execute_script(EXTRACT_JOB_CARDS_SCRIPT, self.max_cards, NEXT_PAGE_SELECTOR))
+        cards = page["cards"]
+        posted = datetime.now()  # Would need to parse from job page
+        with get_tracer().span("build_jobs", count=len(cards)):
+            jobs = [self._job_from_card(card, posted) for card in cards]
+        return [job for job in jobs if job], page["next"]
+
+    @traced()
+    def _parse_job_card_elements(self, driver) -> Tuple[List[Job], Optional[str]]:
+        """Read job cards field by field (one WebDriver round trip per field) and the next-page link"""
+        job_cards = driver.find_elements(By.CLASS_NAME, "job_seen_beacon")
+        jobs = []
+        
+        for card in job_cards[:self.max_cards]:
+            try:
+                job = self._parse_job_card(card)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                self.logger.error(f"Failed to parse job card: {str(e)}")
+                continue
+        next_links = driver.find_elements(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)
+        return jobs, next_links[0].get_attribute("href") if next_links else None
+
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse a job card element into a Job object"""
         try:
-            # Extract basic information
-            title = card.find_element(By.CLASS_NAME, "jobTitle").text
-            company_name = card.find_element(By.CLASS_NAME, "companyName").text
-            
-            # Get company details
-            company = Company(
-                name=company_name,
-                website=None,  # Would need to visit company page
-                location=None,  # Would need to visit company page
-                contact_email=None,
-                contact_phone=None
-            )
-            
-            # Get location
-            location = card.find_element(By.CLASS_NAME, "companyLocation").text
-            
-            # Get job type and remote status
-            metadata = card.find_element(By.CLASS_NAME, "metadata").text.lower()
-            is_remote = "remote" in metadata
-            job_type = self._extract_job_type_from_metadata(metadata)
-            
             # Get salary if available
-            compensation = None
+            salary = None
             try:
-                salary_elem = card.find_element(By.CLASS_NAME, "salary-snippet")
-                compensation = salary_elem.text
+                salary = card.find_element(By.CLASS_NAME, "salary-snippet").text
             except NoSuchElementException:
                 pass
             
-            # Get job link
-            link_elem = card.find_element(By.CLASS_NAME, "jcs-JobTitle")
-            job_url = link_elem.get_attribute("href")
-            
-            return Job(
-                title=title,
-                company=company,
-                location=location,
-                is_remote=is_remote,
-                job_type=job_type,
-                compensation=compensation,
-                date_posted=datetime.now(),  # Would need to parse from job page
-                description="",  # Would need to visit job page
-                application_url=job_url,
-                source_url=job_url
-            )
+            return self._job_from_card({
+                "title": card.find_element(By.CLASS_NAME, "jobTitle").text,
+                "company": card.find_element(By.CLASS_NAME, "companyName").text,
+                "location": card.find_element(By.CLASS_NAME, "companyLocation").text,
+                "metadata": card.find_element(By.CLASS_NAME, "metadata").text,
+                "salary": salary,
+                "url": card.find_element(By.CLASS_NAME, "jcs-JobTitle").get_attribute("href"),
+            })
             
         except Exception as e:
             self.logger.error(f"Error parsing job card: {str(e)}")
             return None
 
+    def _job_from_card(self, card: Dict[str, Any], posted: Optional[datetime] = None) -> Optional[Job]:
+        """Build a Job from the fields of one job card"""
+        missing = [name for name in REQUIRED_CARD_FIELDS if not card.get(name)]
+        if missing:
+            self.logger.error(f"Error parsing job card: missing {', '.join(missing)}")
+            return None
+        
+        # Get job type and remote status
+        metadata = card["metadata"].lower()
+        
+        return Job(
+            title=card["title"],
+            company=Company(
+                name=card["company"],
+                website=None,  # Would need to visit company page
+                location=None,  # Would need to visit company page
+                contact_email=None,
+                contact_phone=None
+            ),
+            location=card["location"],
+            is_remote="remote" in metadata,
+            job_type=self._extract_job_type_from_metadata(metadata),
+            compensation=card.get("salary") or None,
+            date_posted=posted or datetime.now(),  # Would need to parse from job page
+            description="",  # Would need to visit job page
+            application_url=card["url"],
+            source_url=card["url"],
+            key=card.get("key")
+        )
+
     def _extract_job_type_from_metadata(self, metadata: str) -> str:
         """Extract job type from metadata text"""
         if "full-time" in metadata:
@@ -260,21 +385,36 @@ class IndeedScraper(BaseScraper):
             return "Internship"
         return "Unknown"
 
+    @staticmethod
+    def _start_offset(params: SearchParams) -> int:
+        """Get the `start=` offset a browser-mode cursor points at"""
+        return int(params.cursor) if params.cursor and params.cursor.isdigit() else 0
+
+    @staticmethod
+    def _next_start(next_url: Optional[str], start: int) -> Optional[str]:
+        """Get the cursor of the page behind a next-page link (None without a link)"""
+        if not next_url:
+            return None
+        offsets = parse_qs(urlsplit(next_url).query).get("start")
+        if offsets and offsets[0].isdigit():
+            return offsets[0]
+        return str(start + BROWSER_PAGE_SIZE)
+
     def _build_search_url(self, params: SearchParams) -> str:
         """Build Indeed search URL with parameters"""
-        url_parts = [self.search_url]
-        
-        # Add query parameters
-        url_parts.append(f"q={params.what}")
-        url_parts.append(f"l={params.location}")
+        query = {"q": params.what, "l": params.location}
         
         if params.filters:
             if params.filters.get("job_type"):
-                url_parts.append(f"jt={params.filters['job_type']}")
+                query["jt"] = params.filters["job_type"]
             if params.filters.get("is_remote"):
-                url_parts.append("sc=0kf%3Aattr(FSFW)%3B")
+                query["sc"] = "0kf:attr(FSFW);"
+        
+        start = self._start_offset(params)
+        if start:
+            query["start"] = str(start)
             
-        return "&".join(url_parts)
+        return f"{self.search_url}?{urlencode(query)}"
     
 
 if __name__ == "__main__":
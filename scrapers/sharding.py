@@ -0,0 +1,210 @@
+import asyncio
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from scrapers.base import BaseScraper
+from scrapers.async_search import AsyncSearchEngine
+from core.data_model import Job, SearchParams
+from core.queries import INDEED_JOB_TYPE_FILTER_CODES
+
+class QueryPlanner:
+    """
+    Splits one logical search into narrower shards.
+
+    Dimensions are tried in order: location, job type, remote-only and
+    posting date (`hours_old` windows). A location is only split into the
+    sub-locations configured for it, and a "remote" search keeps the
+    remote-only filter on each of its city shards, so every shard stays
+    inside the parent search. Locations without sub-locations are not split.
+    Each shard's top results reach postings the parent's capped pagination
+    never gets to; overlap between shards is removed when results are merged.
+    """
+
+    DIMENSIONS = ("location", "job_type", "is_remote", "hours_old")
+
+    def __init__(
+        self,
+        locations: Optional[Mapping[str, Sequence[str]]] = None,
+        job_types: Optional[Sequence[str]] = tuple(INDEED_JOB_TYPE_FILTER_CODES),
+        remote: bool = True,
+        date_windows: Optional[Sequence[int]] = (24, 72, 168, 336)
+    ) -> None:
+        """
+        Initialize the planner.
+
+        Args:
+            locations: Sub-locations to split each location into, keyed by
+                the parent location (case-insensitive)
+            job_types: Job types to split into (see INDEED_JOB_TYPE_FILTER_CODES)
+            remote: Whether to add a remote-only shard
+            date_windows: `hours_old` windows to split into
+        """
+        self.locations: Dict[str, List[str]] = {
+            parent.strip().lower(): list(children) for parent, children in (locations or {}).items()
+        }
+        self.values: Dict[str, List[Any]] = {
+            "job_type": list(job_types or []),
+            "is_remote": [True] if remote else [],
+            "hours_old": list(date_windows or []),
+        }
+
+    def _split_values(self, params: SearchParams, dimension: str) -> List[Any]:
+        """Get the values a search can be narrowed to along a dimension."""
+        if dimension == "location":
+            return self.locations.get((params.location or "").strip().lower(), [])
+        if (params.filters or {}).get(dimension):
+            return []
+        return self.values[dimension]
+
+    def _with_value(self, params: SearchParams, dimension: str, value: Any) -> SearchParams:
+        """Get a copy of the search narrowed to `value` along `dimension`."""
+        filters = dict(params.filters or {})
+        if dimension == "location":
+            # A city shard of a remote search must stay remote-only
+            if (params.location or "").strip().lower() == "remote":
+                filters["is_remote"] = True
+            return replace(params, location=value, filters=filters or params.filters, cursor=None)
+        filters[dimension] = value
+        return replace(params, filters=filters, cursor=None)
+
+    def split(self, params: SearchParams, depth: int = 0) -> List[Tuple[SearchParams, int]]:
+        """
+        Split a search along the next usable dimension.
+
+        Args:
+            params: Search to split
+            depth: Index of the first dimension that may be used
+
+        Returns:
+            List[Tuple[SearchParams, int]]: Child shards with the depth to
+                continue splitting them from; empty when nothing is left to split
+        """
+        for index in range(depth, len(self.DIMENSIONS)):
+            dimension = self.DIMENSIONS[index]
+            values = self._split_values(params, dimension)
+            if not values:
+                continue
+            # Sub-locations may be split further (e.g. a state into cities)
+            next_depth = index if dimension == "location" else index + 1
+            return [(self._with_value(params, dimension, value), next_depth) for value in values]
+        return []
+
+    def plan(self, params: SearchParams) -> List[SearchParams]:
+        """
+        Expand a search into every shard up front (non-adaptive).
+
+        Args:
+            params: Search to expand
+
+        Returns:
+            List[SearchParams]: The search itself and all of its shards
+        """
+        shards = [params]
+        frontier = [(params, 0)]
+        while frontier:
+            children = [child for shard, depth in frontier for child in self.split(shard, depth)]
+            shards.extend(child for child, _ in children)
+            frontier = children
+        return shards
+
+class ShardedSearch:
+    """
+    Runs a search with automatic sharding and merges deduplicated results.
+
+    The search starts unsharded. Any shard whose cursor chain is still going
+    after `max_pages_per_shard` pages is considered saturated and is split by
+    the planner; the next wave of shards then runs in parallel through the
+    AsyncSearchEngine. Jobs are deduplicated by key (or source URL).
+
+    The seen keys of every page whose jobs were yielded accumulate in
+    `seen_keys`; pass them to the scraper's `mark_seen` once the jobs are
+    persisted.
+    """
+
+    def __init__(
+        self,
+        scraper: BaseScraper,
+        planner: Optional[QueryPlanner] = None,
+        max_concurrency: Optional[int] = None,
+        max_pages_per_shard: int = 10
+    ) -> None:
+        """
+        Initialize the sharded search.
+
+        Args:
+            scraper: Scraper used to fetch pages
+            planner: Planner deciding how to split saturated shards
+            max_concurrency: Maximum number of requests in flight
+                (defaults to the `concurrency_max` setting)
+            max_pages_per_shard: Pages after which a shard counts as saturated
+        """
+        self.planner = planner or QueryPlanner()
+        self.max_pages_per_shard = max_pages_per_shard
+        self.engine = AsyncSearchEngine(
+            scraper,
+            max_concurrency=max_concurrency,
+            max_pages=max_pages_per_shard
+        )
+        self.shards_run = 0
+        self.duplicates = 0
+        self.seen_keys: Dict[str, Optional[str]] = {}
+
+    async def crawl(self, params: SearchParams) -> AsyncIterator[Job]:
+        """
+        Crawl a logical search across all shards it needs.
+
+        Args:
+            params: The broad search
+
+        Yields:
+            Job: Unique jobs as their pages arrive
+        """
+        self.shards_run = 0
+        self.duplicates = 0
+        self.seen_keys = {}
+        seen: Set[str] = set()
+        wave: List[Tuple[SearchParams, int]] = [(params, 0)]
+
+        while wave:
+            depths = {id(shard): depth for shard, depth in wave}
+            saturated: List[SearchParams] = []
+            self.shards_run += len(wave)
+
+            async for page in self.engine.crawl([shard for shard, _ in wave]):
+                for job in page.result.jobs:
+                    key = job.key or job.source_url
+                    if key in seen:
+                        self.duplicates += 1
+                        continue
+                    seen.add(key)
+                    yield job
+                self.seen_keys.update(page.result.seen_keys)
+                if page.result.next_cursor and page.page + 1 >= self.max_pages_per_shard:
+                    saturated.append(page.search)
+
+            wave = [
+                child
+                for shard in saturated
+                for child in self.planner.split(shard, depths[id(shard)])
+            ]
+
+    async def collect(self, params: SearchParams) -> List[Job]:
+        """Crawl a logical search and return all unique jobs."""
+        return [job async for job in self.crawl(params)]
+
+    def run(self, params: SearchParams) -> List[Job]:
+        """Blocking wrapper around `collect` for synchronous callers."""
+        return asyncio.run(self.collect(params))
+
+# Example usage:
+if __name__ == "__main__":
+    from config.settings import settings
+    from core.data_model import ScrapingMethod
+    from scrapers.indeed import IndeedScraper
+
+    scraper = IndeedScraper(scraping_method=ScrapingMethod.API, api_key=settings.indeed.api_key)
+    planner = QueryPlanner(locations={"remote": ["New York, NY", "San Francisco, CA", "Austin, TX"]})
+    search = ShardedSearch(scraper, planner)
+    jobs = search.run(SearchParams(what="python developer", location="remote"))
+    scraper.mark_seen(search.seen_keys)
+    print(f"{len(jobs)} unique jobs from {search.shards_run} shards ({search.duplicates} duplicates)")
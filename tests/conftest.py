@@ -0,0 +1,28 @@
+import pytest
+
+from core.data_model import ScrapingMethod
+from tests.helpers import FakeScraper
+
+
+@pytest.fixture
+def indeed_scraper(tmp_path, monkeypatch):
+    """Return an IndeedScraper factory that needs no network; logs go under tmp_path."""
+    from scrapers.indeed import IndeedScraper
+
+    monkeypatch.chdir(tmp_path)
+
+    def _factory(**kwargs):
+        kwargs.setdefault("scraping_method", ScrapingMethod.API)
+        kwargs.setdefault("api_key", "test")
+        kwargs.setdefault("proxy_enabled", False)
+        kwargs.setdefault("user_agent_enabled", False)
+        return IndeedScraper(**kwargs)
+
+    return _factory
+
+
+@pytest.fixture
+def fake_scraper(tmp_path, monkeypatch):
+    """Return a FakeScraper factory; logs are written under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return FakeScraper
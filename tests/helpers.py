@@ -0,0 +1,98 @@
+"""Builders and fakes shared by the test modules."""
+from datetime import datetime
+
+import requests
+
+from core.data_model import Company, Job, SearchParams, SearchResult, ScrapingMethod
+from scrapers.base import BaseScraper
+
+
+def make_job(title: str = "Python Developer", company: str = "Tech Corp", **overrides) -> Job:
+    """Build a Job with sensible defaults for tests."""
+    fields = dict(
+        title=title,
+        company=Company(
+            name=company,
+            website=None,
+            location=None,
+            contact_email=None,
+            contact_phone=None
+        ),
+        location="Remote",
+        is_remote=True,
+        job_type="Full-time",
+        compensation=None,
+        date_posted=datetime(2025, 5, 2),
+        description="Looking for a Python developer...",
+        application_url="https://www.indeed.com/viewjob?jk=1",
+        source_url="https://www.indeed.com/viewjob?jk=1"
+    )
+    fields.update(overrides)
+    return Job(**fields)
+
+
+class FakeScraper(BaseScraper):
+    """Scraper serving canned pages keyed by (what, cursor)."""
+
+    def __init__(self, pages=None, **kwargs):
+        self.pages = pages or {}
+        self.calls = []
+        kwargs.setdefault("scraping_method", ScrapingMethod.API)
+        kwargs.setdefault("api_key", "test")
+        kwargs.setdefault("proxy_enabled", False)
+        kwargs.setdefault("user_agent_enabled", False)
+        super().__init__(**kwargs)
+
+    def search_jobs(self, params: SearchParams) -> SearchResult:
+        self.calls.append((params.what, params.cursor))
+        return self.pages[(params.what, params.cursor)]
+
+
+def make_api_result(key: str, title: str = "Python Developer", company: str = "Tech Corp") -> dict:
+    """Build a single jobSearch result as returned by the GraphQL API."""
+    return {
+        "trackingKey": f"tk-{key}",
+        "job": {
+            "key": key,
+            "title": title,
+            "datePublished": "2025-05-02T00:00:00",
+            "description": {"html": "<p>Looking for a Python developer...</p>"},
+            "location": {"formatted": {"short": "Remote", "long": "Remote"}},
+            "compensation": {
+                "estimated": {
+                    "currencyCode": "USD",
+                    "baseSalary": {"unitOfWork": "YEAR", "range": {"min": 100000.0, "max": 150000.0}},
+                }
+            },
+            "attributes": [{"key": "remote", "label": "Remote"}],
+            "employer": {
+                "name": company,
+                "dossier": {
+                    "employerDetails": {"addresses": ["Austin, TX"]},
+                    "links": {"corporateWebsite": "https://example.com"},
+                },
+            },
+            "recruit": {"viewJobUrl": f"https://www.indeed.com/viewjob?jk={key}"},
+        },
+    }
+
+
+def make_api_page(keys, next_cursor=None) -> dict:
+    """Build a jobSearch response page holding one result per key."""
+    return {
+        "data": {
+            "jobSearch": {
+                "pageInfo": {"nextCursor": next_cursor},
+                "results": [make_api_result(key) for key in keys],
+            }
+        }
+    }
+
+
+def make_response(status_code=200, body=b"{}", headers=None) -> requests.Response:
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {"Content-Type": "application/json"})
+    return response
@@ -0,0 +1,69 @@
+import threading
+import time
+
+from config.settings import settings
+from core.data_model import ScrapingMethod, SearchParams, SearchResult
+from scrapers.async_search import AsyncSearchEngine
+from tests.helpers import make_job
+
+
+def _chain(what, length):
+    """Pages for a search whose cursor chain is `length` pages long."""
+    pages = {}
+    cursor = None
+    for i in range(length):
+        next_cursor = f"{what}-{i + 1}" if i + 1 < length else None
+        pages[(what, cursor)] = SearchResult(jobs=[make_job(title=f"{what} {i}")], next_cursor=next_cursor)
+        cursor = next_cursor
+    return pages
+
+
+def test_crawl_follows_each_cursor_chain_in_order(fake_scraper):
+    scraper = fake_scraper(pages={**_chain("a", 3), **_chain("b", 2)})
+    engine = AsyncSearchEngine(scraper, max_concurrency=4)
+
+    pages = engine.run([SearchParams(what="a", location="x"), SearchParams(what="b", location="x")])
+
+    assert len(pages) == 5
+    for what, length in (("a", 3), ("b", 2)):
+        titles = [p.result.jobs[0].title for p in pages if p.search.what == what]
+        assert titles == [f"{what} {i}" for i in range(length)]
+    assert engine.failures == []
+
+
+def test_crawl_respects_max_pages_and_records_failures(fake_scraper):
+    scraper = fake_scraper(pages=_chain("a", 5))
+    engine = AsyncSearchEngine(scraper, max_concurrency=2, max_pages=2)
+
+    pages = engine.run([SearchParams(what="a", location="x"), SearchParams(what="missing", location="x")])
+
+    assert [p.page for p in pages] == [0, 1]
+    assert len(engine.failures) == 1
+    assert engine.failures[0][0].what == "missing"
+
+
+def test_browser_mode_runs_up_to_the_driver_pool_size(fake_scraper, monkeypatch):
+    monkeypatch.setattr(settings.scraper, "browser_pool_size", 3)
+    scraper = fake_scraper(pages={**_chain("a", 2), **_chain("b", 2), **_chain("c", 2), **_chain("d", 2)},
+                           scraping_method=ScrapingMethod.HEADLESS)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+    search_jobs = scraper.search_jobs
+
+    def slow_search(params):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.pop()
+        return search_jobs(params)
+
+    scraper.search_jobs = slow_search
+    engine = AsyncSearchEngine(scraper, max_concurrency=8)
+
+    pages = engine.run([SearchParams(what=what, location="x") for what in "abcd"])
+
+    assert engine.max_concurrency == 3
+    assert len(pages) == 8 and 1 < max(peak) <= 3
@@ -0,0 +1,65 @@
+import asyncio
+
+from core.data_model import SearchParams, SearchResult
+from tests.helpers import make_job
+
+PAGES = {
+    ("python", None): SearchResult(jobs=[make_job("a"), make_job("b")], next_cursor="c1"),
+    ("python", "c1"): SearchResult(jobs=[make_job("c"), make_job("d")], next_cursor="c2"),
+    ("python", "c2"): SearchResult(jobs=[make_job("e")], next_cursor=None),
+}
+PARAMS = SearchParams(what="python", location="remote")
+
+
+def test_iter_jobs_follows_cursors_lazily(fake_scraper):
+    scraper = fake_scraper(pages=PAGES)
+    jobs = scraper.iter_jobs(PARAMS)
+
+    assert next(jobs).title == "a"
+    assert scraper.calls == [("python", None)]
+    assert [job.title for job in jobs] == ["b", "c", "d", "e"]
+    assert scraper.calls == [("python", None), ("python", "c1"), ("python", "c2")]
+
+
+def test_iter_jobs_limits(fake_scraper):
+    scraper = fake_scraper(pages=PAGES)
+
+    assert [job.title for job in scraper.iter_jobs(PARAMS, max_pages=2)] == ["a", "b", "c", "d"]
+    assert [job.title for job in scraper.iter_jobs(PARAMS, max_jobs=3)] == ["a", "b", "c"]
+
+
+def test_aiter_jobs_matches_sync_variant(fake_scraper):
+    scraper = fake_scraper(pages=PAGES)
+
+    async def _collect():
+        return [job.title async for job in scraper.aiter_jobs(PARAMS, max_jobs=4)]
+
+    assert asyncio.run(_collect()) == ["a", "b", "c", "d"]
+
+
+def test_iter_jobs_collects_seen_keys_of_yielded_jobs(fake_scraper):
+    pages = {
+        ("python", None): SearchResult(
+            jobs=[make_job("a", key="a"), make_job("b", key="b")],
+            next_cursor="c1",
+            seen_keys={"a": None, "b": None, "known": None}
+        ),
+        ("python", "c1"): SearchResult(
+            jobs=[make_job("c", key="c"), make_job("d", key="d")],
+            next_cursor=None,
+            seen_keys={"c": None, "d": None}
+        ),
+    }
+    scraper = fake_scraper(pages=pages)
+
+    seen_keys = {}
+    jobs = scraper.iter_jobs(PARAMS, seen_keys=seen_keys)
+    next(jobs)
+    assert seen_keys == {}
+    list(jobs)
+    assert set(seen_keys) == {"a", "b", "known", "c", "d"}
+
+    # Jobs past max_jobs were never handed out, so their keys stay unmarked
+    seen_keys = {}
+    assert len(list(scraper.iter_jobs(PARAMS, max_jobs=3, seen_keys=seen_keys))) == 3
+    assert set(seen_keys) == {"a", "b", "known", "c"}
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from core.data_model import SearchParams
+from core.driver_pool import WebDriverPool
+
+
+def make_card(key: str, **overrides) -> dict:
+    card = {
+        "key": key,
+        "title": f"Python Developer {key}",
+        "company": "Tech Corp",
+        "location": "Remote",
+        "metadata": "Full-time\nRemote",
+        "salary": "$100,000 a year",
+        "url": f"https://www.indeed.com/viewjob?jk={key}",
+    }
+    card.update(overrides)
+    return card
+
+
+class FakeElement:
+    def __init__(self, fields: dict):
+        self.fields = fields
+        self.text = fields.get("text")
+
+    def find_element(self, by, cls):
+        driver_fields = {
+            "jobTitle": "title", "companyName": "company", "companyLocation": "location",
+            "metadata": "metadata", "salary-snippet": "salary", "jcs-JobTitle": "url",
+        }
+        value = self.fields.get(driver_fields[cls])
+        if value is None:
+            raise NoSuchElementException(cls)
+        return FakeElement({"text": value, "href": value})
+
+    def get_attribute(self, name):
+        return self.fields.get(name)
+
+
+class FakeDriver:
+    """Counts WebDriver round trips; serves the cards from memory."""
+
+    def __init__(self, cards, script_error=None, next_url=None):
+        self.cards = cards
+        self.script_error = script_error
+        self.next_url = next_url
+        self.round_trips = 0
+        self.urls = []
+
+    def get(self, url):
+        self.round_trips += 1
+        self.urls.append(url)
+
+    def find_element(self, by, cls):
+        self.round_trips += 1
+        return FakeElement({})
+
+    def find_elements(self, by, selector):
+        self.round_trips += 1
+        if by == By.CSS_SELECTOR:
+            return [FakeElement({"href": self.next_url})] if self.next_url else []
+        return [FakeElement(card) for card in self.cards]
+
+    def execute_script(self, script, limit, next_selector):
+        self.round_trips += 1
+        if self.script_error:
+            raise self.script_error
+        return json.dumps({"cards": self.cards[:limit], "next": self.next_url})
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def browser_scraper(indeed_scraper):
+    def _factory(driver, **kwargs):
+        scraper = indeed_scraper(**kwargs)
+        scraper.scraping_method = "headless"
+        scraper.driver_pool = WebDriverPool(lambda: driver)
+        return scraper
+
+    return _factory
+
+
+def test_script_extraction_reads_the_page_in_one_round_trip(browser_scraper):
+    cards = [make_card(str(i)) for i in range(50)] + [make_card("broken", title=None)]
+    driver = FakeDriver(cards)
+
+    result = browser_scraper(driver).search_jobs(SearchParams(what="python", location="remote"))
+
+    assert driver.round_trips == 3  # get, wait for the cards, execute_script
+    assert len(result.jobs) == 50
+    job = result.jobs[0]
+    assert (job.key, job.job_type, job.is_remote, job.compensation) == ("0", "Full-time", True, "$100,000 a year")
+
+
+def test_element_extraction_and_script_fallback_build_the_same_jobs(browser_scraper):
+    cards = [make_card("a"), make_card("b", salary=None, metadata="Contract")]
+    params = SearchParams(what="python", location="remote")
+
+    by_script = browser_scraper(FakeDriver(cards)).search_jobs(params).jobs
+    by_elements = browser_scraper(FakeDriver(cards), card_extraction="elements").search_jobs(params).jobs
+    fallback = browser_scraper(FakeDriver(cards, script_error=JavascriptException("csp"))).search_jobs(params).jobs
+
+    def fields(jobs):
+        return [(job.title, job.company.name, job.job_type, job.compensation, job.application_url) for job in jobs]
+
+    assert fields(by_script) == fields(by_elements) == fields(fallback)
+    assert by_script[1].compensation is None and by_script[1].job_type == "Contract"
+
+
+@pytest.mark.parametrize("card_extraction", ["script", "elements"])
+def test_pages_follow_start_offsets(browser_scraper, card_extraction):
+    driver = FakeDriver([make_card("a")], next_url="https://www.indeed.com/jobs?q=python&start=20")
+    scraper = browser_scraper(driver, card_extraction=card_extraction)
+    params = SearchParams(what="python developer", location="New York, NY", cursor="10", filters={"is_remote": True})
+
+    result = scraper.search_jobs(params)
+
+    assert driver.urls == [
+        "https://www.indeed.com/jobs?q=python+developer&l=New+York%2C+NY&sc=0kf%3Aattr%28FSFW%29%3B&start=10"
+    ]
+    assert result.next_cursor == "20"
+
+    driver.next_url = None
+    assert scraper.search_jobs(params).next_cursor is None
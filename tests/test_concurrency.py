@@ -0,0 +1,98 @@
+import pytest
+import requests
+
+from config.settings import settings
+from core.concurrency import AdaptiveConcurrencyController, is_blocked_response, parse_retry_after
+from core.rate_limiter import RateLimiter
+from tests.helpers import make_response
+
+
+def test_limit_grows_additively_and_halves_on_block():
+    controller = AdaptiveConcurrencyController(initial=4, maximum=8, decrease_cooldown=0)
+    for _ in range(8):
+        controller.record(blocked=False)
+    assert controller.concurrency == 5
+
+    controller.record(blocked=True)
+    assert controller.concurrency == 2
+    assert controller.block_rate == pytest.approx(1 / 9)
+
+
+def test_slots_are_bounded_by_the_limit():
+    controller = AdaptiveConcurrencyController(initial=1)
+    with controller.slot():
+        assert controller.in_flight == 1
+        assert not controller.acquire(timeout=0.01)
+    assert controller.acquire(timeout=0.01)
+
+
+def test_block_detection_and_retry_after():
+    assert is_blocked_response(make_response(429))
+    assert is_blocked_response(make_response(200, b"<html>hCaptcha</html>", {"Content-Type": "text/html"}))
+    assert not is_blocked_response(make_response(200))
+    assert parse_retry_after(make_response(429, headers={"Retry-After": "3"})) == 3.0
+    assert parse_retry_after(make_response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+
+
+def test_make_request_retries_blocked_responses(fake_scraper, monkeypatch):
+    monkeypatch.setattr(settings.scraper, "retry_backoff_base", 0.0)
+    scraper = fake_scraper()
+    scraper.rate_limiter = RateLimiter()
+    responses = [make_response(429, headers={"Retry-After": "0"}), make_response(503), make_response(200)]
+    monkeypatch.setattr(scraper.session_pool, "request", lambda **kwargs: responses.pop(0))
+
+    assert scraper._make_request("https://apis.indeed.com/graphql").status_code == 200
+    assert scraper.concurrency.block_rate == pytest.approx(1 / 2)
+
+
+def test_make_request_gives_up_after_max_retries(fake_scraper, monkeypatch):
+    monkeypatch.setattr(settings.scraper, "retry_backoff_base", 0.0)
+    monkeypatch.setattr(settings.scraper, "max_retries", 1)
+    scraper = fake_scraper()
+    scraper.rate_limiter = RateLimiter()
+    calls = []
+    monkeypatch.setattr(scraper.session_pool, "request", lambda **kwargs: calls.append(1) or make_response(403))
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        scraper._make_request("https://apis.indeed.com/graphql")
+    assert len(calls) == 2
+
+    # Without any attempt the request fails instead of returning None
+    monkeypatch.setattr(settings.scraper, "max_retries", -1)
+    with pytest.raises(requests.exceptions.RetryError):
+        scraper._make_request("https://apis.indeed.com/graphql")
+    assert len(calls) == 2
+
+
+def test_make_request_sets_a_timeout_and_caps_retry_after(fake_scraper, monkeypatch):
+    monkeypatch.setattr(settings.scraper, "retry_backoff_max", 5.0)
+    scraper = fake_scraper()
+    scraper.rate_limiter = RateLimiter()
+    sleeps = []
+    monkeypatch.setattr("scrapers.base.time.sleep", sleeps.append)
+    timeouts = []
+    responses = [make_response(429, headers={"Retry-After": "86400"}), make_response(200)]
+
+    def request(**kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(scraper.session_pool, "request", request)
+
+    scraper._make_request("https://apis.indeed.com/graphql")
+    assert sleeps == [5.0]
+    assert timeouts == [settings.scraper.request_timeout] * 2
+
+
+def test_make_request_sends_rotating_user_agents(fake_scraper, monkeypatch):
+    scraper = fake_scraper(user_agent_enabled=True)
+    scraper.rate_limiter = RateLimiter()
+    sent = []
+    monkeypatch.setattr(scraper.session_pool, "request", lambda **kwargs: sent.append(kwargs["headers"]) or make_response(200))
+
+    scraper._make_request("https://www.indeed.com/jobs", use_cache=False)
+    scraper._make_request("https://www.indeed.com/jobs", use_cache=False)
+    scraper._make_request("https://apis.indeed.com/graphql", use_cache=False, headers={"user-agent": "Indeed App"})
+
+    assert sent[0]["User-Agent"] and sent[0]["User-Agent"] != sent[1]["User-Agent"]
+    assert sent[2]["User-Agent"] == "Indeed App" and sent[2]["Accept"] == "application/json"
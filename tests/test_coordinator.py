@@ -0,0 +1,47 @@
+import csv
+
+from core.data_model import SearchParams, SearchResult
+from core.seen_index import SeenJobsIndex
+from core.storage import Storage
+from scrapers.coordinator import CrawlCoordinator
+from tests.helpers import FakeScraper, make_job
+
+
+def _scraper_factory():
+    pages = {}
+    for what in ("python", "java"):
+        pages[(what, None)] = SearchResult(
+            jobs=[make_job(f"{what} 0"), make_job(f"{what} 1")],
+            next_cursor="2",
+            seen_keys={f"{what}-0": None, f"{what}-1": None}
+        )
+        pages[(what, "2")] = SearchResult(jobs=[make_job(f"{what} 2")], next_cursor=None, seen_keys={f"{what}-2": "fp"})
+    return FakeScraper(pages=pages)
+
+
+def test_coordinator_gathers_all_tasks_into_one_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    updates = []
+    seen_index = SeenJobsIndex(str(tmp_path / "seen.db"))
+    coordinator = CrawlCoordinator(
+        _scraper_factory,
+        Storage(str(tmp_path / "data")),
+        processes=2,
+        progress_callback=lambda p: updates.append((p.task_id, p.pages, p.done)),
+        seen_index=seen_index
+    )
+
+    progress = coordinator.run(
+        [SearchParams(what=what, location="remote") for what in ("python", "java", "missing")],
+        filename="crawl",
+        warm_proxy_cache=False
+    )
+
+    with open(tmp_path / "data" / "crawl.csv", newline="", encoding="utf-8") as f:
+        titles = sorted(row["title"] for row in csv.DictReader(f))
+    assert titles == ["java 0", "java 1", "java 2", "python 0", "python 1", "python 2"]
+    assert [(p.pages, p.jobs, p.done) for p in progress.values()] == [(2, 3, True), (2, 3, True), (0, 0, True)]
+    assert "KeyError" in progress[2].error
+    assert (0, 1, False) in updates and (0, 2, True) in updates
+    assert len(seen_index) == 6 and seen_index.changed({"java-2": "fp", "python-2": "new"}) == {"python-2"}
+    seen_index.close()
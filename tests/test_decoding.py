@@ -0,0 +1,42 @@
+import json
+from datetime import datetime
+
+import core.decoding as decoding
+from core.decoding import decode_job_search, decode_listings
+from tests.helpers import make_api_page
+
+
+def test_typed_and_generic_paths_build_the_same_records(monkeypatch):
+    page = make_api_page(["a", "b"], next_cursor="next")
+    page["data"]["jobSearch"]["results"][1]["job"].update(
+        employer=None, compensation={"estimated": None}, datePublished=1746144000000
+    )
+    body = json.dumps(page).encode()
+
+    typed = decode_job_search(body)
+    monkeypatch.setattr(decoding, "msgspec", None)
+    generic = decode_job_search(body)
+
+    assert typed == generic == decode_job_search(page)
+    assert typed.next_cursor == "next"
+    first, second = typed.records
+    assert first.salary_min == 100000.0 and first.is_remote and first.company_location == "Austin, TX"
+    assert first.date_posted == datetime(2025, 5, 2)
+    assert second.company_name == "" and second.salary_max is None
+    assert second.to_job().compensation is None
+
+
+def test_unexpected_shapes_fall_back_to_the_extractors():
+    page = make_api_page(["a"])
+    page["data"]["jobSearch"]["results"][0]["job"]["title"] = {"unexpected": "object"}
+
+    result = decode_job_search(json.dumps(page).encode())
+
+    assert [record.key for record in result.records] == ["a"]
+
+
+def test_listings_tolerate_null_data():
+    assert decode_listings(b'{"data": null, "errors": [{"message": "boom"}]}') == ({}, None)
+
+    listings, next_cursor = decode_listings(json.dumps(make_api_page(["a", "b"], next_cursor="c")).encode())
+    assert list(listings) == ["a", "b"] and next_cursor == "c"
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+
+import core.driver_pool
+from config.settings import settings
+from core.driver_pool import WebDriverPool, resolve_driver_path
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_drivers_are_reused_then_recycled_after_max_pages():
+    pool = WebDriverPool(FakeDriver, max_size=1, max_pages=3)
+    drivers = []
+    for _ in range(4):
+        with pool.acquire() as driver:
+            drivers.append(driver)
+
+    assert drivers[0] is drivers[1] is drivers[2] and drivers[3] is not drivers[0]
+    assert drivers[0].quit_called and pool.launched == 2
+
+    pool.close()
+    assert drivers[3].quit_called
+
+
+def test_crashed_drivers_are_replaced_but_timeouts_are_not():
+    pool = WebDriverPool(FakeDriver)
+    with pytest.raises(TimeoutException):
+        with pool.acquire() as slow:
+            raise TimeoutException("no job cards")
+    with pytest.raises(InvalidSessionIdException):
+        with pool.acquire() as crashed:
+            raise InvalidSessionIdException("chrome not reachable")
+    with pool.acquire() as fresh:
+        pass
+
+    assert slow is crashed and crashed.quit_called and fresh is not crashed
+
+
+def test_checkouts_are_limited_to_max_size():
+    pool = WebDriverPool(FakeDriver, max_size=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def page():
+        with pool.acquire():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=page) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2 and pool.launched == 2
+
+
+def test_driver_path_is_resolved_once(monkeypatch):
+    monkeypatch.setattr(core.driver_pool, "_driver_path", None)
+    monkeypatch.setattr(settings.scraper, "webdriver_path", "/opt/chromedriver")
+    assert resolve_driver_path() == "/opt/chromedriver"
+
+    monkeypatch.setattr(settings.scraper, "webdriver_path", "/usr/bin/chromedriver")
+    assert resolve_driver_path() == "/opt/chromedriver"
@@ -0,0 +1,39 @@
+import pytest
+
+from core.data_model import Company, Job
+from core.job_batch import JobBatch
+from tests.helpers import make_job
+
+
+def _jobs():
+    return [
+        make_job(key="a", salary_min=100000.0),
+        make_job(title="Data Engineer", company="Data Inc", key="b", is_remote=False, date_posted=None),
+        make_job(key="c", company="Data Inc", description=""),
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_rows_round_trip(compress):
+    jobs = _jobs()
+    batch = JobBatch(jobs, compress_descriptions=compress)
+
+    assert len(batch) == 3
+    assert list(batch) == jobs
+    assert batch[-1] == jobs[-1]
+    assert batch.column("salary_min") == [100000.0, None, None]
+
+
+def test_repeated_values_are_stored_once():
+    batch = JobBatch(_jobs())
+
+    assert batch.value_counts("company_name") == {"Tech Corp": 1, "Data Inc": 2}
+    assert len(batch.dictionaries["location"]) == 2  # None + "Remote"
+    assert "b" in batch and batch.index("c") == 2 and "z" not in batch
+
+
+def test_models_have_no_instance_dict():
+    job = make_job()
+
+    assert not hasattr(job, "__dict__") and not hasattr(job.company, "__dict__")
+    assert Job.__slots__ and Company.__slots__
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from config.settings import settings
+from core.proxy_manager import Proxy, ProxyManager
+
+PROXIES = [Proxy(ip=f"10.0.0.{i}", port=8000, username="u", password="p") for i in range(3)]
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.scraper, "proxy_cache_path", str(tmp_path / "default.json"))
+    monkeypatch.setattr(ProxyManager, "_fetch_residential_proxies", lambda self: list(PROXIES))
+    monkeypatch.setattr(ProxyManager, "_fetch_mobile_proxy", lambda self: None)
+    return ProxyManager()
+
+
+def test_blocked_proxy_is_cooled_down_and_recovers(manager):
+    bad = PROXIES[0].url
+    manager.record_result(bad, 0.1, 429)
+
+    stats = manager.stats[bad]
+    assert stats.blocked == 1 and stats.consecutive_failures == 1
+    assert all(manager.select_proxy().url != bad for _ in range(50))
+
+    manager.record_result(bad, 0.1, 200)
+    assert not stats.is_cooling_down(0) and stats.consecutive_failures == 0
+
+
+def test_cooldown_backs_off_exponentially(manager):
+    url = PROXIES[0].url
+    manager.record_result(url, 1.0, None)
+    first = manager.stats[url].cooldown_until
+    manager.record_result(url, 1.0, None)
+
+    assert manager.stats[url].cooldown_until - first > 4
+
+
+def test_selection_prefers_faster_proxies(manager):
+    manager.record_result(PROXIES[0].url, 0.1, 200)
+    manager.record_result(PROXIES[1].url, 5.0, 200)
+    manager.record_result(PROXIES[2].url, 5.0, 200)
+
+    picks = [manager.select_proxy().url for _ in range(300)]
+    assert picks.count(PROXIES[0].url) > 150
+
+
+def _join_refresh_threads():
+    for thread in threading.enumerate():
+        if thread.name == "proxy-refresh":
+            thread.join()
+
+
+def _fail(self):
+    raise AssertionError("proxy API should not be called")
+
+
+def test_fresh_cache_skips_proxy_apis(monkeypatch, tmp_path, manager):
+    cache_path = tmp_path / "proxies.json"
+    ProxyManager(cache_path=str(cache_path))._save_cache()
+    _join_refresh_threads()
+    monkeypatch.setattr(ProxyManager, "_fetch_residential_proxies", _fail)
+    monkeypatch.setattr(ProxyManager, "_fetch_mobile_proxy", lambda self: PROXIES[0])
+
+    cached = ProxyManager(cache_path=str(cache_path))
+
+    assert cached.residential_proxies == PROXIES
+
+
+def test_stale_cache_is_used_while_refreshing_in_background(monkeypatch, tmp_path, manager):
+    cache_path = tmp_path / "proxies.json"
+    ProxyManager(cache_path=str(cache_path))._save_cache()
+    _join_refresh_threads()
+    api_called = threading.Event()
+    release = threading.Event()
+
+    def _slow_fetch(self):
+        api_called.set()
+        release.wait(5)
+        return PROXIES[:1]
+
+    monkeypatch.setattr(ProxyManager, "_fetch_residential_proxies", _slow_fetch)
+
+    stale = ProxyManager(cache_path=str(cache_path), cache_ttl=0)
+    assert stale.residential_proxies == PROXIES
+    assert api_called.wait(5)
+
+    release.set()
+    _join_refresh_threads()
+
+    assert stale.residential_proxies == PROXIES[:1]
+    assert stale._load_cache()[0] == PROXIES[:1]
+
+
+def test_foreground_refresh_updates_a_stale_cache_before_returning(monkeypatch, tmp_path, manager):
+    cache_path = tmp_path / "proxies.json"
+    ProxyManager(cache_path=str(cache_path))._save_cache()
+    _join_refresh_threads()
+    monkeypatch.setattr(ProxyManager, "_fetch_residential_proxies", lambda self: PROXIES[:1])
+
+    refreshed = ProxyManager(cache_path=str(cache_path), cache_ttl=0, background_refresh=False)
+
+    assert refreshed.residential_proxies == PROXIES[:1]
+    assert refreshed._load_cache()[0] == PROXIES[:1]
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+
+def test_selection_refreshes_an_expired_inventory_in_background(monkeypatch, manager):
+    _join_refresh_threads()
+    monkeypatch.setattr(ProxyManager, "_fetch_residential_proxies", lambda self: PROXIES[:1])
+    manager.select_proxy()
+    assert manager.residential_proxies == PROXIES
+
+    manager._next_refresh_at = 0
+    manager.select_proxy()
+    _join_refresh_threads()
+
+    assert manager.residential_proxies == PROXIES[:1]
+    assert manager._next_refresh_at > time.time()
@@ -0,0 +1,57 @@
+import json
+
+from core.data_model import SearchParams
+from core.queries import DETAIL_PROJECTION, compile_job_data, compile_job_search, build_selection_set
+from tests.helpers import make_api_page
+
+
+def test_selection_set_merges_shared_prefixes():
+    selection = build_selection_set([("employer", "name"), ("employer", "dossier", "links", "corporateWebsite")])
+
+    assert selection.split() == ["employer", "{", "name", "dossier", "{", "links", "{", "corporateWebsite", "}", "}", "}"]
+
+
+def test_compiled_body_is_valid_json_with_escaped_arguments():
+    body = compile_job_search().body('python "dev"', "remote", cursor="abc", filters={"is_remote": True})
+    query = json.loads(body)["query"]
+
+    assert 'what: "python \\"dev\\""' in query
+    assert 'cursor: "abc"' in query
+    assert '"DSQF7"' in query
+    assert "description" in query and "ceoPhotoUrl" not in query
+
+
+def test_projection_trims_the_selection_and_is_compiled_once():
+    compiled = compile_job_search(["title", "employer.dossier.employerDetails.industry"])
+    query = compiled.query("python", "remote")
+
+    assert compile_job_search(["employer.dossier.employerDetails.industry", "title"]) is compiled
+    assert "industry" in query and "key" in query
+    assert "description" not in query and "compensation" not in query
+
+
+def test_job_data_accepts_any_iterable_projection():
+    compiled = compile_job_data(["description", "employer.name"])
+
+    assert compile_job_data({"employer.name", "description"}) is compiled
+    assert compile_job_data() is compile_job_data(DETAIL_PROJECTION)
+    assert "description" in compiled.selection and "compensation" not in compiled.selection
+
+
+def test_search_posts_the_precompiled_body(indeed_scraper, monkeypatch):
+    scraper = indeed_scraper(projection=["title"])
+    sent = {}
+
+    class _Response:
+        content = json.dumps(make_api_page(["a"])).encode()
+
+    def _make_request(url, method="GET", **kwargs):
+        sent.update(kwargs)
+        return _Response()
+
+    monkeypatch.setattr(scraper, "_make_request", _make_request)
+    result = scraper.search_jobs(SearchParams(what="python", location="remote"))
+
+    assert isinstance(sent["data"], bytes)
+    assert "title" in json.loads(sent["data"])["query"]
+    assert [job.key for job in result.jobs] == ["a"]
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from core.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve(max_wait=0.05) is None
+    # take() always reserves, queueing behind the earlier reservation
+    assert bucket.take() == pytest.approx(0.2, abs=0.02)
+
+
+def test_bucket_blocks_threads_and_coroutines():
+    bucket = TokenBucket(rate=20.0)
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+
+    async def _acquire_twice():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    asyncio.run(_acquire_twice())
+    assert time.monotonic() - start >= 0.2
+
+
+def test_limiter_uses_separate_proxy_buckets_and_a_shared_host_bucket():
+    limiter = RateLimiter(host_rate=100.0, proxy_rate=1.0, burst=1)
+    url = "https://apis.indeed.com/graphql"
+
+    assert limiter.acquire(url, "proxy-a") == 0
+    assert limiter.acquire(url, "proxy-b") == pytest.approx(0.01, abs=0.01)
+    assert limiter._reserve(url, "proxy-a") == pytest.approx(1.0, abs=0.05)
@@ -0,0 +1,27 @@
+import pytest
+
+from config.settings import settings
+from core.rate_limiter import RateLimiter
+from core.replay import ReplayMissError
+from tests.helpers import make_response
+
+URL = "https://apis.indeed.com/graphql"
+
+
+def test_record_then_replay_without_network(fake_scraper, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.scraper, "response_cache_enabled", False)
+    monkeypatch.setattr(settings.scraper, "replay_fixtures_dir", str(tmp_path / "fixtures"))
+    monkeypatch.setattr(settings.scraper, "replay_mode", "record")
+    recording = fake_scraper()
+    recording.rate_limiter = RateLimiter()
+    monkeypatch.setattr(recording.session_pool, "request", lambda **kwargs: make_response(200, body=b'{"page": 1}'))
+    recording._make_request(URL, method="POST", data=b'{"query": "{ jobSearch }"}')
+
+    monkeypatch.setattr(settings.scraper, "replay_mode", "replay")
+    replaying = fake_scraper()
+    monkeypatch.setattr(replaying.session_pool, "request", pytest.fail)
+
+    replayed = replaying._make_request(URL, method="POST", data=b'{"query": "{  jobSearch }"}')
+    assert replayed.json() == {"page": 1} and replayed.from_fixture
+    with pytest.raises(ReplayMissError):
+        replaying._make_request(URL, method="POST", data=b'{"query": "{ jobData }"}')
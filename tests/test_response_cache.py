@@ -0,0 +1,65 @@
+import json
+import os
+import time
+
+from core.queries import compile_job_search
+from core.rate_limiter import RateLimiter
+from core.response_cache import ResponseCache, cache_key
+from tests.helpers import make_response
+
+URL = "https://apis.indeed.com/graphql"
+
+
+def test_key_normalizes_graphql_bodies():
+    search = compile_job_search()
+    first = search.body("python", "remote", cursor="c1")
+    reformatted = json.dumps({"query": "  " + json.loads(first)["query"].replace("\n", "\n\n ")}).encode()
+
+    assert cache_key("POST", URL, data=first) == cache_key("post", URL, data=reformatted)
+    assert cache_key("POST", URL, data=first) != cache_key("POST", URL, data=search.body("python", "remote", cursor="c2"))
+    assert cache_key("GET", URL, params={"b": 1, "a": 2}) == cache_key("GET", URL, params={"a": 2, "b": 1})
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    with ResponseCache(str(tmp_path / "responses.db"), ttl=60) as cache:
+        cache.put("k", make_response(200, body=b'{"data": 1}', headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"
+        }))
+
+        cached = cache.get("k")
+        assert cached.json() == {"data": 1} and cached.from_cache
+        assert cached.headers["content-type"] == "application/json"
+        assert "content-encoding" not in cached.headers
+
+        now = time.time()
+        monkeypatch.setattr("core.response_cache.time.time", lambda: now + 61)
+        assert cache.get("k") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted_over_budget(tmp_path):
+    body = os.urandom(1000)  # incompressible
+    with ResponseCache(str(tmp_path / "responses.db"), max_bytes=2500) as cache:
+        cache.put("a", make_response(body=body))
+        cache.put("b", make_response(body=body))
+        cache.get("a")
+        cache.put("c", make_response(body=body))
+
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.get("b") is None
+        assert cache.size <= 2500
+
+
+def test_make_request_serves_repeats_from_disk(fake_scraper, monkeypatch):
+    scraper = fake_scraper()
+    scraper.rate_limiter = RateLimiter()
+    calls = []
+    monkeypatch.setattr(scraper.session_pool, "request", lambda **kwargs: calls.append(1) or make_response(200))
+    body = compile_job_search().body("python", "remote")
+
+    scraper._make_request(URL, method="POST", data=body)
+    cached = scraper._make_request(URL, method="POST", data=body)
+    scraper._make_request(URL, method="POST", data=body, use_cache=False)
+
+    assert cached.from_cache and cached.status_code == 200
+    assert len(calls) == 2
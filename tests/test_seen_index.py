@@ -0,0 +1,118 @@
+import json
+import time
+from datetime import timedelta
+
+from core.seen_index import SeenJobsIndex
+from core.data_model import SearchParams
+from tests.helpers import make_api_page, make_api_result
+
+
+def test_filter_new_and_mark_seen(tmp_path):
+    with SeenJobsIndex(str(tmp_path / "seen.db")) as index:
+        index.mark_seen(["a", "b"])
+
+        assert "a" in index and "z" not in index
+        assert index.filter_new(["a", "c", None, "c"]) == {"c"}
+        assert len(index) == 2
+
+    # The index persists across runs
+    with SeenJobsIndex(str(tmp_path / "seen.db")) as index:
+        assert index.known(["a", "b", "c"]) == {"a", "b"}
+
+
+def test_expire_uses_last_seen(tmp_path):
+    with SeenJobsIndex(str(tmp_path / "seen.db")) as index:
+        index.mark_seen(["old", "refreshed"], seen_at=time.time() - 10 * 86400)
+        index.mark_seen(["refreshed"])
+
+        assert index.expire(timedelta(days=7)) == 1
+        assert index.known(["old", "refreshed"]) == {"refreshed"}
+
+
+def test_parse_skips_known_keys(tmp_path, indeed_scraper):
+    index = SeenJobsIndex(str(tmp_path / "seen.db"))
+    scraper = indeed_scraper(seen_index=index)
+
+    first = scraper._parse_api_response(make_api_page(["a", "b"]))
+    second = scraper._parse_api_response(make_api_page(["b", "c"], next_cursor="next"))
+
+    assert [job.key for job in first.jobs] == ["a", "b"]
+    assert [job.key for job in second.jobs] == ["c"]
+    assert second.next_cursor == "next"
+
+    # Nothing is recorded until the caller has persisted the jobs
+    assert len(index) == 0
+    scraper.mark_seen(second.seen_keys)
+    assert index.known(["a", "b", "c"]) == {"b", "c"}
+    assert set(scraper._pending_seen) == {"a"}
+    index.close()
+
+
+def test_changed_compares_fingerprints(tmp_path):
+    with SeenJobsIndex(str(tmp_path / "seen.db")) as index:
+        index.mark_seen(["a", "b"], fingerprints={"a": "1", "b": "1"})
+        index.mark_seen(["legacy"])
+
+        assert index.changed({"a": "1", "b": "2", "c": "1", "legacy": "1"}) == {"b", "c"}
+
+        # A sighting without a fingerprint keeps the stored one
+        index.mark_seen(["a"])
+        assert index.changed({"a": "1"}) == set()
+
+
+def test_two_phase_fetches_details_for_new_or_changed_keys(tmp_path, indeed_scraper, monkeypatch):
+    index = SeenJobsIndex(str(tmp_path / "seen.db"))
+    scraper = indeed_scraper(seen_index=index, two_phase=True, detail_batch_size=2)
+    listing_pages = [make_api_page(["a", "b", "c"], next_cursor="next"), make_api_page(["a", "b", "d"])]
+    listing_pages[1]["data"]["jobSearch"]["results"][1]["job"]["title"] = "Senior Python Developer"
+    detail_batches = []
+
+    class _Response:
+        def __init__(self, data):
+            self.content = json.dumps(data).encode()
+
+    def _make_request(url, method="GET", **kwargs):
+        query = json.loads(kwargs["data"])["query"]
+        if "jobSearch" in query:
+            assert "description" not in query
+            return _Response(listing_pages.pop(0))
+        keys = json.loads(query[query.index("["):query.index("]") + 1])
+        detail_batches.append(keys)
+        return _Response({"data": {"jobData": {"results": [make_api_result(key) for key in keys]}}})
+
+    monkeypatch.setattr(scraper, "_make_request", _make_request)
+    first = scraper.search_jobs(SearchParams(what="python", location="remote"))
+    second = scraper.search_jobs(SearchParams(what="python", location="remote", cursor="next"))
+
+    assert [job.key for job in first.jobs] == ["a", "b", "c"]
+    assert first.jobs[0].description and first.next_cursor == "next"
+    assert [job.key for job in second.jobs] == ["b", "d"]
+    assert second.jobs[0].title == "Senior Python Developer"
+    assert detail_batches == [["a", "b"], ["c"], ["b", "d"]]
+    index.close()
+
+
+def test_two_phase_leaves_listings_without_details_unmarked(tmp_path, indeed_scraper, monkeypatch):
+    index = SeenJobsIndex(str(tmp_path / "seen.db"))
+    scraper = indeed_scraper(seen_index=index, two_phase=True, detail_batch_size=2)
+
+    class _Response:
+        def __init__(self, data):
+            self.content = json.dumps(data).encode()
+
+    def _make_request(url, method="GET", **kwargs):
+        query = json.loads(kwargs["data"])["query"]
+        if "jobSearch" in query:
+            return _Response(make_api_page(["a", "b", "c"]))
+        keys = json.loads(query[query.index("["):query.index("]") + 1])
+        if "c" in keys:
+            raise ConnectionError("detail batch failed")
+        # "b" is missing from the detail response
+        return _Response({"data": {"jobData": {"results": [make_api_result("a")]}}})
+
+    monkeypatch.setattr(scraper, "_make_request", _make_request)
+    result = scraper.search_jobs(SearchParams(what="python", location="remote"))
+
+    assert [job.key for job in result.jobs] == ["a"]
+    assert set(result.seen_keys) == {"a"} and len(index) == 0
+    index.close()
@@ -0,0 +1,30 @@
+from core.session_pool import SessionPool
+
+PROXY_A = {"http": "http://u:p@1.1.1.1:80", "https": "http://u:p@1.1.1.1:80"}
+PROXY_B = {"http": "http://u:p@2.2.2.2:80", "https": "http://u:p@2.2.2.2:80"}
+
+
+def test_sessions_are_reused_per_proxy():
+    pool = SessionPool()
+    session = pool.get(PROXY_A)
+
+    assert pool.get(PROXY_A) is session
+    assert pool.get(PROXY_B) is not session
+    assert session.proxies["https"] == PROXY_A["https"]
+    assert len(pool) == 2
+
+
+def test_least_recently_used_session_is_evicted():
+    pool = SessionPool(max_size=1)
+    first = pool.get(PROXY_A)
+    pool.get(PROXY_B)
+
+    assert len(pool) == 1
+    assert pool.get(PROXY_A) is not first
+
+
+def test_sessions_are_recycled_after_max_age():
+    pool = SessionPool(max_age=0)
+    first = pool.get(None)
+
+    assert pool.get(None) is not first
@@ -3,9 +3,9 @@
 from config.settings import settings
 
 def test_proxy_settings():
-    assert settings.proxy.api_url == "https://api.proxy-cheap.com/proxies"
-    assert settings.proxy.api_key 
-    assert settings.proxy.api_secret 
+    assert settings.residential_proxy.url == "https://api.proxy-cheap.com/proxies"
+    assert settings.residential_proxy.api_key 
+    assert settings.residential_proxy.api_secret 
 
 def test_scraper_settings():
     assert settings.scraper.request_timeout == 30
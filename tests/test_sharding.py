@@ -0,0 +1,65 @@
+from core.data_model import SearchParams, SearchResult
+from scrapers.sharding import QueryPlanner, ShardedSearch
+from tests.helpers import FakeScraper, make_job
+
+
+class ShardScraper(FakeScraper):
+    """Serves a saturated broad search and one page per narrower shard."""
+
+    def search_jobs(self, params):
+        filters = params.filters or {}
+        shard = f"{params.location}/{filters.get('job_type')}"
+        self.calls.append((shard, params.cursor))
+        if shard == "remote/None":
+            page = int(params.cursor or 0)
+            return SearchResult(
+                jobs=[make_job(key=f"broad-{page}")],
+                next_cursor=str(page + 1),
+                seen_keys={f"broad-{page}": None}
+            )
+        # Every shard overlaps the broad search by one posting
+        return SearchResult(
+            jobs=[make_job(key="broad-0"), make_job(key=shard)],
+            next_cursor=None,
+            seen_keys={"broad-0": None, shard: None}
+        )
+
+
+def test_split_walks_dimensions_in_order():
+    planner = QueryPlanner(locations={"CA": ["SF", "LA"]}, job_types=["fulltime"], remote=False, date_windows=None)
+    params = SearchParams(what="python", location="CA")
+
+    children = planner.split(params)
+    assert [(child.location, child.filters, depth) for child, depth in children] == [("SF", None, 0), ("LA", None, 0)]
+    grandchildren = planner.split(*children[0])
+    assert [(child.filters, depth) for child, depth in grandchildren] == [({"job_type": "fulltime"}, 2)]
+    assert planner.split(*grandchildren[0]) == []
+    assert len(planner.plan(params)) == 5
+
+
+def test_locations_only_split_into_their_sub_locations():
+    planner = QueryPlanner(locations={"Remote": ["NY", "SF"]}, job_types=None, remote=True, date_windows=None)
+
+    remote = planner.split(SearchParams(what="python", location="remote"))
+    assert [(child.location, child.filters) for child, _ in remote] == [
+        ("NY", {"is_remote": True}), ("SF", {"is_remote": True})
+    ]
+    # Already remote-only, and NY has no sub-locations
+    assert planner.split(*remote[0]) == []
+
+    austin = planner.split(SearchParams(what="python", location="Austin, TX"))
+    assert [(child.location, child.filters) for child, _ in austin] == [("Austin, TX", {"is_remote": True})]
+
+
+def test_saturated_search_is_sharded_and_deduplicated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = ShardScraper()
+    planner = QueryPlanner(job_types=["fulltime", "parttime"], remote=False, date_windows=None)
+    search = ShardedSearch(scraper, planner, max_pages_per_shard=2)
+
+    jobs = search.run(SearchParams(what="python", location="remote"))
+
+    assert sorted(job.key for job in jobs) == ["broad-0", "broad-1", "remote/fulltime", "remote/parttime"]
+    assert search.shards_run == 3
+    assert search.duplicates == 2
+    assert set(search.seen_keys) == {"broad-0", "broad-1", "remote/fulltime", "remote/parttime"}
@@ -0,0 +1,56 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+from core.sqlite_storage import SQLiteStorage
+from core.storage import Storage
+from tests.helpers import make_job
+
+
+def test_upsert_replaces_rows_with_the_same_key(tmp_path):
+    with SQLiteStorage(str(tmp_path / "jobs.db"), batch_size=2) as storage:
+        storage.upsert([make_job("a", key="1"), make_job("b", key="2"), make_job("c", key="3")])
+        storage.upsert([make_job("a (updated)", key="1")])
+
+        assert storage.count() == 3
+        assert storage.query(title="updated")[0]["key"] == "1"
+
+
+def test_existing_database_gets_new_columns(tmp_path):
+    path = tmp_path / "jobs.db"
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE jobs (key TEXT PRIMARY KEY, title TEXT, date_posted TEXT)")
+        conn.execute("INSERT INTO jobs VALUES ('0', 'old', '2025-01-01T00:00:00')")
+    conn.close()
+
+    with SQLiteStorage(str(path)) as storage:
+        storage.upsert([make_job("new", key="1", salary_min=100000.0)])
+
+        assert storage.count() == 2
+        assert storage.query(title="new")[0]["salary_min"] == 100000.0
+
+
+def test_query_filters(tmp_path):
+    now = datetime.now()
+    with SQLiteStorage(str(tmp_path / "jobs.db")) as storage:
+        storage.upsert([
+            make_job("Python Developer", key="1", date_posted=now - timedelta(days=1)),
+            make_job("Senior Python Engineer", key="2", date_posted=now - timedelta(days=30)),
+            make_job("Python Developer", key="3", is_remote=False, date_posted=now),
+            make_job("Java Developer", key="4", company="Other", date_posted=now),
+        ])
+
+        recent_remote = storage.query(title="python", is_remote=True, posted_since=now - timedelta(days=7))
+        assert [job["key"] for job in recent_remote] == ["1"]
+        assert recent_remote[0]["is_remote"] is True
+        assert [job["key"] for job in storage.query(company="Other")] == ["4"]
+        assert len(storage.query(limit=2)) == 2
+
+
+def test_storage_save_sqlite_accumulates_runs(tmp_path):
+    storage = Storage(str(tmp_path))
+
+    path = storage.save([make_job("a", key="1")], format="sqlite")
+    assert storage.save([make_job("b", key="2")], format="sqlite") == path
+
+    with SQLiteStorage(path) as db:
+        assert db.count() == 2
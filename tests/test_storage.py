@@ -0,0 +1,102 @@
+import csv
+import json
+
+import pytest
+
+from core.storage import JOB_FIELDNAMES, JobWriter, Storage, job_to_record
+from tests.helpers import make_job
+
+
+def test_job_to_record_flattens_company():
+    record = job_to_record(make_job(company="Tech Corp"))
+
+    assert list(record) == JOB_FIELDNAMES
+    assert record["company_name"] == "Tech Corp"
+    assert record["date_posted"] == "2025-05-02T00:00:00"
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+def test_open_writer_flushes_each_chunk(tmp_path, format):
+    storage = Storage(str(tmp_path))
+
+    with storage.open_writer(format=format, filename="jobs", chunk_size=2) as writer:
+        writer.write([make_job("a"), make_job("b"), make_job("c")])
+        # The first chunk is on disk before the writer is closed
+        assert writer.path.read_text(encoding="utf-8").count("Tech Corp") == 2
+        writer.write([{"title": "d", "unknown": "ignored"}])
+
+    if format == "csv":
+        with open(writer.path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        rows = [json.loads(line) for line in writer.path.read_text(encoding="utf-8").splitlines()]
+
+    assert writer.count == 4
+    assert [row["title"] for row in rows] == ["a", "b", "c", "d"]
+    assert list(rows[0]) == JOB_FIELDNAMES
+
+
+def test_open_writer_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        with Storage(str(tmp_path)).open_writer(format="xml"):
+            pass
+
+
+def test_json_format_streams_as_jsonl(tmp_path):
+    with Storage(str(tmp_path)).open_writer(format="json", filename="jobs") as writer:
+        writer.write([make_job("a"), make_job("b")])
+
+    assert writer.path.name == "jobs.jsonl"
+    assert [json.loads(line)["title"] for line in writer.path.read_text().splitlines()] == ["a", "b"]
+
+
+def test_parquet_writer_uses_typed_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    storage = Storage(str(tmp_path))
+
+    with storage.open_writer(format="parquet", filename="jobs", chunk_size=2) as writer:
+        writer.write([make_job("a", salary_min=100000.0, salary_max=150000.0), make_job("b")])
+        writer.write([job_to_record(make_job("c"))])
+
+    parquet_file = pq.ParquetFile(writer.path)
+    schema = parquet_file.schema_arrow
+    table = parquet_file.read()
+
+    assert parquet_file.num_row_groups == 2
+    assert str(schema.field("date_posted").type) == "timestamp[us]"
+    assert str(schema.field("is_remote").type) == "bool"
+    assert str(schema.field("company_name").type).startswith("dictionary")
+    assert table.column("salary_min").to_pylist() == [100000.0, None, None]
+    assert table.column("title").to_pylist() == ["a", "b", "c"]
+
+
+def test_parquet_writer_converts_csv_rows(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    storage = Storage(str(tmp_path))
+    csv_path = storage.save([make_job("a", salary_min=100000.0), make_job("b", is_remote=False)], format="csv")
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    table = pq.read_table(storage.save(rows, format="parquet", filename="from_csv"))
+
+    assert table.column("is_remote").to_pylist() == [True, False]
+    assert table.column("salary_min").to_pylist() == [100000.0, None]
+    assert table.column("compensation").to_pylist() == [None, None]
+
+
+@pytest.mark.parametrize("format", ["csv", "json"])
+def test_save_accepts_jobs(tmp_path, format):
+    path = Storage(str(tmp_path)).save([make_job(key="a"), make_job(key="b")], format=format, filename="jobs")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f)) if format == "csv" else json.load(f)
+    assert [row["key"] for row in rows] == ["a", "b"]
+    assert rows[0]["company_name"] == "Tech Corp" and rows[0]["date_posted"] == "2025-05-02T00:00:00"
+
+
+def test_writer_subclasses_must_implement_write_rows(tmp_path):
+    class IncompleteWriter(JobWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteWriter(tmp_path / "jobs.txt")
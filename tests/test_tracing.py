@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import core.tracing
+from core.tracing import Tracer
+from tests.helpers import make_api_page
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = Tracer(enabled=True)
+    monkeypatch.setattr(core.tracing, "_tracer", tracer)
+    return tracer
+
+
+def test_nested_spans_export_as_chrome_trace_and_folded_stacks(tracer, tmp_path):
+    with tracer.span("search_jobs", what="python"):
+        with tracer.span("_make_request"):
+            pass
+        with tracer.span("_parse_api_response") as span:
+            span.set("jobs", 2)
+
+    assert [span.stack for span in tracer.spans] == [
+        ("search_jobs", "_make_request"),
+        ("search_jobs", "_parse_api_response"),
+        ("search_jobs",),
+    ]
+    root = tracer.spans[-1]
+    assert root.self_ns == root.duration_ns - sum(span.duration_ns for span in list(tracer.spans)[:2])
+
+    tracer.export(str(tmp_path / "trace.json"))
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert {event["ph"] for event in events} == {"X"}
+    assert events[1]["args"] == {"jobs": 2}
+    assert tracer.to_folded().splitlines()[0].startswith("search_jobs ")
+
+
+def test_unsampled_traces_skip_nested_spans(tracer):
+    tracer.sample_rate = 0.0
+    with tracer.span("search_jobs"):
+        with tracer.span("_make_request"):
+            pass
+    assert not tracer.spans
+
+    tracer.enabled = False
+    assert tracer.span("search_jobs") is tracer.span("_make_request")
+
+
+def test_scraper_stages_are_traced(indeed_scraper, tracer):
+    scraper = indeed_scraper()
+
+    scraper._parse_api_response(json.dumps(make_api_page(["a", "b"])).encode())
+
+    assert [(span.stack, span.attributes) for span in tracer.spans] == [
+        (("IndeedScraper._parse_api_response", "build_jobs"), {"count": 2}),
+        (("IndeedScraper._parse_api_response",), {}),
+    ]